@@ -0,0 +1 @@
+"""Performance benchmarks for the CLI; run with ``python -m benchmarks``."""
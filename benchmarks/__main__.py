@@ -0,0 +1,58 @@
+"""Command-line entry point: ``python -m benchmarks``."""
+
+import sys
+
+import click
+
+from .harness import (BASELINE, SCENARIOS, TOLERANCES, compare, load_baseline, run,
+                      save_baseline)
+
+
+@click.command()
+@click.option('--scenario', '-k', 'names', multiple=True,
+              help='Only run the named scenario(s)')
+@click.option('--latency', type=float, help='Seconds the fake API waits per request')
+@click.option('--update-baseline', is_flag=True, help='Record this run as the new baseline')
+@click.option('--time-tolerance', type=float, default=TOLERANCES['wall'], show_default=True,
+              help='Allowed wall-time growth over the baseline, as a fraction')
+@click.option('--verbose', '-v', is_flag=True, help='Show per-endpoint request counts')
+def main(names, latency, update_baseline, time_tolerance, verbose):
+    """Measure CLI commands against a local fake Shortcut API.
+
+    Every scenario is compared with benchmarks/baseline.json. Any growth in
+    request count, per-endpoint requests or repeated identical requests
+    fails the run, as do bytes, memory or time beyond their tolerance.
+    """
+    baseline = load_baseline()
+    settings = dict(baseline['settings'])
+    if latency is not None:
+        settings['latency'] = latency
+    scenarios = [s for s in SCENARIOS if not names or s.name in names]
+    if not scenarios:
+        raise click.UsageError(f"No scenario named {', '.join(names)}")
+
+    measurements = run(scenarios, settings)
+    tolerances = {**TOLERANCES, 'wall': time_tolerance}
+
+    click.echo(f"{'scenario':<22} {'wall s':>8} {'requests':>9} {'dupes':>6} {'bytes':>10} {'peak KB':>9}")
+    failed = False
+    for m in measurements:
+        problems = compare(m, None if update_baseline else baseline['scenarios'].get(m.name), tolerances)
+        status = click.style('FAIL', fg='red') if problems else click.style('ok', fg='green')
+        click.echo(f"{m.name:<22} {m.wall:>8.3f} {m.requests:>9} {m.duplicates:>6} {m.bytes:>10} "
+                   f"{m.peak_kb:>9.0f}  {status}")
+        if verbose:
+            for endpoint, count in m.endpoints.items():
+                click.echo(f"    {count:>5}  {endpoint}")
+        for problem in problems:
+            click.echo(f"    {problem}")
+        failed = failed or bool(problems)
+
+    if update_baseline and not failed:
+        save_baseline(measurements, settings)
+        click.echo(f"Baseline written to {BASELINE}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
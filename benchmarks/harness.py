@@ -0,0 +1,238 @@
+"""Run real CLI commands against the fake API and measure them.
+
+Each scenario is one ``sc`` invocation through ``CliRunner``, with the
+process-wide client, session, rate limiter and on-disk caches reset so
+every run starts cold. A scenario is run twice: once for wall time and
+request counts, and once under tracemalloc for peak memory, so the
+allocation tracing does not distort the timing.
+"""
+
+import importlib
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Union
+from unittest import mock
+
+from click.testing import CliRunner
+
+from tests.fakeapi import TOKEN, FakeShortcut, Workspace
+
+BASELINE = Path(__file__).with_name("baseline.json")
+
+# Workspace and server settings the baseline was recorded with
+DEFAULT_SETTINGS = {
+    'stories': 2000,
+    'members': 200,
+    'groups': 5,
+    'epics': 20,
+    'iterations': 8,
+    'latency': 0.02,
+}
+
+# Allowed growth over the baseline before a metric fails the run. Request
+# counts and repeated requests must not grow at all: that is an N+1.
+TOLERANCES = {
+    'requests': 0.0,
+    'duplicates': 0.0,
+    'bytes': 0.25,
+    'peak_kb': 0.5,
+    'wall': 0.5,
+}
+# Absolute slack on wall time, for scheduler noise on very short runs
+WALL_SLACK = 0.1
+
+
+@dataclass
+class Scenario:
+    """One command line to measure, with scripted answers for interactive prompts.
+
+    ``settings`` overrides the workspace settings for a scenario that needs
+    data of another shape; it then runs against a workspace of its own.
+    """
+    name: str
+    args: Union[Sequence[str], Callable[[Workspace], Sequence[str]]]
+    text_answers: Sequence[Optional[str]] = ()
+    select_answers: Sequence[object] = ()
+    settings: Dict[str, int] = field(default_factory=dict)
+
+    def argv(self, workspace: Workspace) -> List[str]:
+        return list(self.args(workspace) if callable(self.args) else self.args)
+
+
+def _first_group(workspace: Workspace) -> List[str]:
+    return ['team', 'stories', next(iter(workspace.groups)), '--limit', '50']
+
+
+SCENARIOS = [
+    Scenario('story-search', ['story', 'search', 'type:bug', '--limit', '100']),
+    Scenario('story-view', ['story', 'view', '1000']),
+    Scenario('search-all', ['search', 'all', 'login']),
+    Scenario('iteration-stats', ['iteration', 'stats', '2']),
+    # One iteration holding about 1,500 stories, past the 1000-result search cap
+    Scenario('iteration-stats-large', ['iteration', 'stats', '1'],
+             settings={'stories': 3000, 'iterations': 1}),
+    Scenario('iteration-velocity', ['iteration', 'velocity', '--last', '6']),
+    Scenario('team-stories', _first_group),
+    Scenario('story-create', ['story', 'create'],
+             text_answers=["Benchmark story", "", "3"],
+             select_answers=["feature", 1, None, None, None, None]),
+]
+
+
+@dataclass
+class Measurement:
+    """What one scenario cost."""
+    name: str
+    exit_code: int
+    wall: float
+    requests: int
+    duplicates: int
+    bytes: int
+    peak_kb: float
+    endpoints: Dict[str, int] = field(default_factory=dict)
+    output: str = ''
+
+    def metrics(self) -> Dict[str, float]:
+        return {k: getattr(self, k) for k in TOLERANCES}
+
+
+def _endpoint(method: str, path: str) -> str:
+    """Group a logged request under its route, with IDs replaced by ``{id}``."""
+    parts = ['{id}' if p.isdigit() or p.count('-') == 4 else p for p in path.split('?', 1)[0].split('/')]
+    return f"{method} {'/'.join(parts)}"
+
+
+@contextmanager
+def cli_against(api: FakeShortcut) -> Iterator[None]:
+    """Point ``sc`` at the fake server with fresh process state and empty caches."""
+    import sc.utils.client as client_module
+
+    with tempfile.TemporaryDirectory() as cache_dir, \
+            mock.patch.dict(os.environ, {'SHORTCUT_API_TOKEN': TOKEN, 'SHORTCUT_API_URL': api.base_url}), \
+            mock.patch.object(client_module, 'CACHE_DIR', Path(cache_dir)):
+        client_module._client = client_module._session = client_module._limiter = None
+        try:
+            yield
+        finally:
+            client_module._client = client_module._session = client_module._limiter = None
+
+
+def _invoke(api: FakeShortcut, scenario: Scenario, argv: List[str]):
+    from sc.cli import cli
+
+    with cli_against(api), mock.patch('sc.commands.story.questionary') as questionary:
+        questionary.text.return_value.ask.side_effect = list(scenario.text_answers)
+        questionary.select.return_value.ask.side_effect = list(scenario.select_answers)
+        return CliRunner().invoke(cli, argv, catch_exceptions=True)
+
+
+def run_scenario(api: FakeShortcut, scenario: Scenario, memory: bool = True) -> Measurement:
+    argv = scenario.argv(api.workspace)
+
+    api.reset()
+    started = time.perf_counter()
+    result = _invoke(api, scenario, argv)
+    wall = time.perf_counter() - started
+    log = list(api.requests)
+
+    # Second, traced run for memory; the server is warm but the client is not
+    peak = 0
+    if memory:
+        tracemalloc.start()
+        try:
+            _invoke(api, scenario, argv)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    identical = Counter((r.method, r.path) for r in log)
+    output = result.output
+    if result.exception is not None and not isinstance(result.exception, SystemExit):
+        output += f"\n{type(result.exception).__name__}: {result.exception}"
+    return Measurement(
+        name=scenario.name,
+        exit_code=result.exit_code,
+        wall=round(wall, 4),
+        requests=len(log),
+        duplicates=sum(n - 1 for n in identical.values()),
+        bytes=sum(r.bytes for r in log),
+        peak_kb=round(peak / 1024, 1),
+        endpoints=dict(sorted(Counter(_endpoint(r.method, r.path) for r in log).items())),
+        output=output,
+    )
+
+
+def _serve(settings: Dict) -> FakeShortcut:
+    workspace = Workspace(**{k: v for k, v in settings.items() if k != 'latency'})
+    return FakeShortcut(workspace, latency=settings['latency'])
+
+
+def run(scenarios: Sequence[Scenario] = SCENARIOS, settings: Optional[Dict] = None,
+        memory: bool = True) -> List[Measurement]:
+    """Measure scenarios against a fake workspace built from ``settings``.
+
+    A scenario with settings of its own runs against a workspace built
+    with them. ``memory=False`` skips the traced run; peak_kb is then
+    reported as 0.
+    """
+    from sc.cli import COMMANDS
+
+    # Import every command up front so the first scenario is not charged for it
+    for path, _ in COMMANDS.values():
+        importlib.import_module(path.split(':')[0])
+    settings = {**DEFAULT_SETTINGS, **(settings or {})}
+    servers: Dict[tuple, FakeShortcut] = {}
+    measurements = []
+    with ExitStack() as stack:
+        for scenario in scenarios:
+            key = tuple(sorted(scenario.settings.items()))
+            if key not in servers:
+                servers[key] = stack.enter_context(_serve({**settings, **scenario.settings}))
+            measurements.append(run_scenario(servers[key], scenario, memory))
+    return measurements
+
+
+def load_baseline(path: Path = BASELINE) -> Dict:
+    if not path.exists():
+        return {'settings': DEFAULT_SETTINGS, 'scenarios': {}}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_baseline(measurements: Sequence[Measurement], settings: Dict, path: Path = BASELINE) -> None:
+    data = {
+        'settings': settings,
+        'scenarios': {m.name: {**m.metrics(), 'endpoints': m.endpoints} for m in measurements},
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def compare(measurement: Measurement, baseline: Optional[Dict],
+            tolerances: Dict[str, float] = TOLERANCES) -> List[str]:
+    """Regressions of one measurement against its baseline entry, as messages."""
+    if measurement.exit_code != 0:
+        last_line = (measurement.output.strip().splitlines() or [''])[-1]
+        return [f"exited with {measurement.exit_code}: {last_line}"]
+    if baseline is None:
+        return []
+    problems = []
+    for metric, tolerance in tolerances.items():
+        current, allowed = getattr(measurement, metric), baseline[metric] * (1 + tolerance)
+        if metric == 'wall':
+            allowed += WALL_SLACK
+        if current > allowed:
+            problems.append(f"{metric} {current:g} > {baseline[metric]:g} (allowed {allowed:g})")
+    for endpoint, count in measurement.endpoints.items():
+        before = baseline.get('endpoints', {}).get(endpoint, 0)
+        if count > before:
+            problems.append(f"{endpoint}: {count} requests, baseline {before}")
+    return problems
@@ -1,3 +1,5 @@
 from .client import ShortcutClient
+from .cache import ReferenceCache
+from .store import LocalStore
 
-__all__ = ['ShortcutClient']
\ No newline at end of file
+__all__ = ['ShortcutClient', 'ReferenceCache', 'LocalStore']
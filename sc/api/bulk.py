@@ -0,0 +1,112 @@
+"""Chunked, concurrent use of the ``/stories/bulk`` endpoints."""
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Stories per bulk request; Shortcut rejects larger batches.
+BULK_CHUNK_SIZE = 100
+BULK_WORKERS = 4
+
+
+@dataclass
+class ChunkResult:
+    """Outcome of one bulk request."""
+    index: int
+    items: List[Any]
+    result: Any = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def chunked(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Split an iterable into lists of at most ``size`` items, lazily."""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run_chunks(chunks: Iterable[List[Any]], send: Callable[[List[Any]], Any],
+               workers: int = BULK_WORKERS,
+               on_chunk: Optional[Callable[[ChunkResult], None]] = None) -> List[ChunkResult]:
+    """Send chunks concurrently, reporting each one as it finishes.
+
+    Chunks are pulled from the iterable only as workers free up, so a
+    large streamed input is never held in memory at once. A failing chunk
+    is recorded and does not stop the others. Results are returned in
+    chunk order; the client's rate limiter keeps the fan-out inside the
+    API budget.
+
+    If reading the next chunk raises (a malformed input row, say), no
+    more chunks are sent; those already in flight finish and are reported
+    through ``on_chunk`` before the error is re-raised, so callers keep a
+    record of everything that was sent.
+    """
+    workers = max(1, workers)
+    numbered = enumerate(chunks)
+    results = []
+    source_error = None
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = {}
+
+        def submit_next():
+            nonlocal source_error
+            if source_error is not None:
+                return
+            try:
+                for index, chunk in numbered:
+                    pending[pool.submit(send, chunk)] = ChunkResult(index, chunk)
+                    return
+            except Exception as e:
+                source_error = e
+
+        for _ in range(workers * 2):
+            submit_next()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                chunk = pending.pop(future)
+                try:
+                    chunk.result = future.result()
+                except Exception as e:
+                    chunk.error = e
+                if on_chunk:
+                    on_chunk(chunk)
+                results.append(chunk)
+                submit_next()
+    if source_error is not None:
+        raise source_error
+    return sorted(results, key=lambda r: r.index)
+
+
+def bulk_update_stories(client, story_ids: Iterable[int], changes: Dict[str, Any],
+                        chunk_size: int = BULK_CHUNK_SIZE, workers: int = BULK_WORKERS,
+                        on_chunk: Optional[Callable[[ChunkResult], None]] = None) -> List[ChunkResult]:
+    """Apply the same UpdateStories ``changes`` to every story, one PUT per chunk."""
+    def send(ids):
+        return client._make_request('PUT', '/stories/bulk', json={**changes, 'story_ids': ids})
+
+    return run_chunks(chunked(story_ids, chunk_size), send, workers, on_chunk)
+
+
+def bulk_create_stories(client, stories: Iterable[Tuple[Any, Dict[str, Any]]],
+                        chunk_size: int = BULK_CHUNK_SIZE, workers: int = BULK_WORKERS,
+                        on_chunk: Optional[Callable[[ChunkResult], None]] = None) -> List[ChunkResult]:
+    """Create stories from ``(key, CreateStoryParams)`` pairs, one POST per chunk.
+
+    Each successful chunk's result is a list of ``(key, created story)``
+    pairs, so callers can tell which input produced which story.
+    """
+    def send(chunk):
+        created = client._make_request('POST', '/stories/bulk',
+                                       json={'stories': [body for _, body in chunk]})
+        return [(key, story) for (key, _), story in zip(chunk, created)]
+
+    return run_chunks(chunked(stories, chunk_size), send, workers, on_chunk)
@@ -0,0 +1,119 @@
+"""On-disk cache for slow-changing Shortcut reference data."""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+CACHE_DIR = Path.home() / ".cache" / "shortcut"
+
+# Seconds each collection stays fresh. Workflows almost never change,
+# epics and iterations move the most.
+DEFAULT_TTLS = {
+    'member': 24 * 60 * 60,  # the token's own member, for @me
+    'workflows': 24 * 60 * 60,
+    'members': 60 * 60,
+    'groups': 60 * 60,
+    'labels': 60 * 60,
+    'epics': 15 * 60,
+    'iterations': 15 * 60,
+}
+
+
+def record_count(data: Any) -> int:
+    """Records in a cached payload: list items, or 1 for a single object."""
+    return len(data) if isinstance(data, list) else 1
+
+
+def workspace_key(api_token: str) -> str:
+    """Short stable key that keeps caches for different tokens apart."""
+    return hashlib.sha256(api_token.encode('utf-8')).hexdigest()[:16]
+
+
+class ReferenceCache:
+    """Stores whole list responses (workflows, members, ...) as JSON files."""
+
+    def __init__(self, directory: Path, ttls: Optional[Dict[str, int]] = None):
+        self.directory = Path(directory)
+        self.ttls = dict(DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update({k: int(v) for k, v in ttls.items() if k in DEFAULT_TTLS})
+
+    @property
+    def names(self) -> List[str]:
+        return list(self.ttls)
+
+    def _path(self, name: str) -> Path:
+        return self.directory / f"{name}.json"
+
+    def _read(self, name: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(name), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or 'fetched_at' not in entry:
+            return None
+        return entry
+
+    def get(self, name: str) -> Optional[Any]:
+        """Return cached data for a collection, or None if missing or stale."""
+        if name not in self.ttls:
+            return None
+        entry = self._read(name)
+        if entry is None:
+            return None
+        if time.time() - entry['fetched_at'] > self.ttls[name]:
+            return None
+        return entry.get('data')
+
+    def set(self, name: str, data: Any, fetched_at: Optional[float] = None) -> None:
+        """Write a collection atomically; failures leave the cache untouched."""
+        if name not in self.ttls:
+            return
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'fetched_at': time.time() if fetched_at is None else fetched_at, 'data': data}, f)
+            os.replace(tmp_path, self._path(name))
+        except (OSError, TypeError, ValueError):
+            pass
+
+    def replace(self, name: str, data: Any) -> None:
+        """Rewrite a collection's data in place, keeping its fetch time and so its expiry."""
+        entry = self._read(name)
+        if entry is not None:
+            self.set(name, data, fetched_at=entry['fetched_at'])
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Drop one collection, or every collection when name is None."""
+        for n in ([name] if name else self.names):
+            try:
+                self._path(n).unlink()
+            except OSError:
+                pass
+
+    def status(self) -> List[Dict[str, Any]]:
+        """Describe each collection: age in seconds, TTL, freshness and last write time."""
+        now = time.time()
+        rows = []
+        for name in self.names:
+            entry = self._read(name)
+            age = now - entry['fetched_at'] if entry else None
+            try:
+                modified = self._path(name).stat().st_mtime if entry else None
+            except OSError:
+                modified = None
+            rows.append({
+                'name': name,
+                'ttl': self.ttls[name],
+                'age': age,
+                'fresh': age is not None and age <= self.ttls[name],
+                'modified': modified,
+                'count': record_count(entry.get('data')) if entry else 0,
+            })
+        return rows
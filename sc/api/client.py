@@ -0,0 +1,172 @@
+"""Shortcut API client used by the CLI commands."""
+
+from typing import Any, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from useshortcut.client import APIClient
+
+from . import fastjson, trace
+from .cache import ReferenceCache
+from .memo import MEMOISED_METHODS, RequestMemo
+from .records import GroupSlim, IterationSlim, MemberSlim, ProjectSlim
+from .ratelimit import RateLimiter, parse_retry_after
+
+# Connections kept open to the API host. Covers the concurrent fan-out in
+# search all plus the page prefetch in each paginated search.
+POOL_SIZE = 16
+
+
+def make_session(pool_size: int = POOL_SIZE) -> requests.Session:
+    """A keep-alive session with a connection pool sized for concurrent commands."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({
+        'Accept-Encoding': 'gzip, deflate',
+        'Connection': 'keep-alive',
+    })
+    return session
+
+
+def _throttled(error: Exception) -> Optional[float]:
+    """Retry-After seconds (0.0 if absent) when ``error`` is a 429, else None."""
+    response = getattr(error, 'response', None)
+    if not isinstance(error, requests.HTTPError) or response is None or response.status_code != 429:
+        return None
+    return parse_retry_after(response.headers.get('Retry-After')) or 0.0
+
+
+class ShortcutClient(APIClient):
+    """APIClient that serves slow-changing collections from a local cache.
+
+    Only bare GETs of top-level collections (``/workflows``, ``/members``,
+    ...) are cached. Any write to one of those collections drops its entry
+    so the next read sees the change. With a RequestMemo, identical reads
+    within one command are also shared (see sc.api.memo).
+    """
+
+    def __init__(self, api_token: str, base_url: Optional[str] = None,
+                 cache: Optional[ReferenceCache] = None,
+                 session: Optional[requests.Session] = None,
+                 limiter: Optional[RateLimiter] = None,
+                 memo: Optional[RequestMemo] = None) -> None:
+        super().__init__(api_token, base_url)
+        # Swap APIClient's default session for a pooled one, keeping its auth headers
+        headers = self.session.headers
+        self.session.close()
+        self.session = session or make_session()
+        self.session.headers.update(headers)
+        self.session.headers['Accept-Encoding'] = 'gzip, deflate'
+        self.cache = cache
+        self.limiter = limiter
+        self.memo = memo
+
+    def _collection(self, path: str) -> str:
+        return path.strip('/').split('/', 1)[0].split('?', 1)[0]
+
+    def _http(self, method: str, path: str, **kwargs) -> Any:
+        """One HTTP round trip; like APIClient._make_request but decoding with fastjson."""
+        url = f"{self.base_url}/{path.lstrip('/')}"
+        tracer = trace.get_tracer()
+        if tracer is not None:
+            return self._traced_http(tracer, method, path, url, **kwargs)
+        response = self.session.request(method, url, **kwargs)
+        response.raise_for_status()
+        return fastjson.loads(response.content) if response.content else response
+
+    def _traced_http(self, tracer: trace.Tracer, method: str, path: str, url: str, **kwargs) -> Any:
+        started = tracer.clock()
+        response = None
+        try:
+            with tracer.span('http', f"{method} {path}"):
+                response = self.session.request(method, url, **kwargs)
+        finally:
+            status, size = None, 0
+            if response is not None:
+                # Bytes on the wire: the compressed length when the body was gzipped
+                status = response.status_code
+                size = int(response.headers.get('Content-Length') or len(response.content))
+            tracer.request(method, path, status, started, tracer.clock() - started, size)
+        response.raise_for_status()
+        if not response.content:
+            return response
+        with tracer.span('decode', path):
+            return fastjson.loads(response.content)
+
+    def _send(self, method: str, path: str, **kwargs) -> Any:
+        """Issue one API call, under the rate limiter when there is one."""
+        if self.limiter is None:
+            return self._http(method, path, **kwargs)
+        tracer = trace.get_tracer()
+        if tracer is None:
+            return self.limiter.call(lambda: self._http(method, path, **kwargs), _throttled)
+        with tracer.span('rate-limit', f"{method} {path}"):
+            return self.limiter.call(lambda: self._http(method, path, **kwargs), _throttled)
+
+    def _make_request(self, method: str, path: str, **kwargs) -> Any:
+        if self.memo is None:
+            return self._cached_request(method, path, **kwargs)
+        key = self.memo.key(method, path, kwargs)
+        if key is None:
+            try:
+                return self._cached_request(method, path, **kwargs)
+            finally:
+                if method.upper() not in MEMOISED_METHODS:
+                    self.memo.clear()
+        tracer = trace.get_tracer()
+        started = tracer.clock() if tracer is not None else 0.0
+        result, shared = self.memo.call(key, lambda: self._cached_request(method, path, **kwargs))
+        if shared and tracer is not None:
+            tracer.request(method, path, None, started, tracer.clock() - started, source='memo')
+        return result
+
+    def _cached_request(self, method: str, path: str, **kwargs) -> Any:
+        """One request, answered from the reference cache when it can be."""
+        if self.cache is None:
+            return self._send(method, path, **kwargs)
+
+        name = self._collection(path)
+        if name not in self.cache.ttls:
+            return self._send(method, path, **kwargs)
+
+        if method.upper() != 'GET':
+            result = self._send(method, path, **kwargs)
+            self.cache.invalidate(name)
+            return result
+
+        if path.strip('/') != name or kwargs.get('params'):
+            return self._send(method, path, **kwargs)
+
+        data = self.cache.get(name)
+        if data is None:
+            data = self._send(method, path, **kwargs)
+            self.cache.set(name, data)
+        else:
+            tracer = trace.get_tracer()
+            if tracer is not None:
+                tracer.request(method, path, None, tracer.clock(), 0.0, source='cache')
+        return data
+
+    def fetch_reference(self, name: str) -> Any:
+        """Fetch a cached collection from the API and store it, ignoring freshness."""
+        if self.cache is not None:
+            self.cache.invalidate(name)
+        return self._make_request('GET', f'/{name}')
+
+    # Reference collections decode into slim records (sc.api.records): every
+    # name lookup and table reads them whole, and only a few fields of each.
+
+    def list_members(self) -> List[MemberSlim]:
+        return [MemberSlim.from_dict(m) for m in self._make_request('GET', '/members')]
+
+    def list_groups(self) -> List[GroupSlim]:
+        return [GroupSlim.from_dict(g) for g in self._make_request('GET', '/groups')]
+
+    def list_iterations(self) -> List[IterationSlim]:
+        return [IterationSlim.from_dict(i) for i in self._make_request('GET', '/iterations')]
+
+    def list_projects(self) -> List[ProjectSlim]:
+        """Projects as records; the typed Project model rejects fields newer than it."""
+        return [ProjectSlim.from_dict(p) for p in self._make_request('GET', '/projects')]
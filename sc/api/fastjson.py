@@ -0,0 +1,22 @@
+"""JSON decoding through orjson when it is installed.
+
+orjson parses API responses several times faster than the standard
+library; it is optional (``pip install sc[fast]``) and ``json`` is used
+otherwise.
+"""
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+import json
+from typing import Any, Union
+
+BACKEND = 'orjson' if orjson is not None else 'json'
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,162 @@
+"""Generate ``sc/api/records.py`` from the bundled OpenAPI spec.
+
+Run from the repository root after changing ``RECORDS`` or updating
+``shortcut-api-v3.yaml``::
+
+    python -m sc.api.gen_records
+"""
+
+import sys
+import textwrap
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import yaml
+
+ROOT = Path(__file__).resolve().parents[2]
+SPEC = ROOT / "shortcut-api-v3.yaml"
+OUTPUT = Path(__file__).with_name("records.py")
+
+# Record class -> (spec definition, fields the CLI reads). Keep the lists
+# short: every field kept costs memory on every decoded hit.
+RECORDS: List[Tuple[str, str, List[str]]] = [
+    ('LabelSlim', 'LabelSlim', ['id', 'name', 'color', 'archived']),
+    ('ProfileSlim', 'Profile', ['name', 'mention_name', 'email_address']),
+    ('MemberSlim', 'Member', ['id', 'disabled', 'role', 'profile']),
+    ('GroupSlim', 'Group', ['id', 'name', 'mention_name', 'archived', 'description', 'member_ids']),
+    ('StorySlim', 'StorySlim', [
+        'id', 'name', 'story_type', 'workflow_state_id', 'owner_ids', 'estimate',
+        'epic_id', 'iteration_id', 'group_id', 'labels', 'archived', 'blocked',
+        'started', 'completed', 'created_at', 'updated_at', 'started_at',
+        'completed_at', 'deadline', 'app_url',
+    ]),
+    # Search hits fetched with detail=full, for fields slim results omit
+    ('StoryDetail', 'StorySearchResult', [
+        'id', 'name', 'story_type', 'workflow_state_id', 'owner_ids', 'estimate',
+        'epic_id', 'iteration_id', 'group_id', 'labels', 'archived', 'blocked',
+        'started', 'completed', 'created_at', 'updated_at', 'started_at',
+        'completed_at', 'deadline', 'app_url', 'description', 'requested_by_id',
+        'comments', 'tasks',
+    ]),
+    ('EpicSlim', 'EpicSlim', [
+        'id', 'name', 'state', 'stats', 'owner_ids', 'group_ids', 'archived',
+        'started_at', 'completed_at', 'deadline', 'updated_at', 'app_url',
+    ]),
+    ('ProjectSlim', 'Project', ['id', 'name', 'archived', 'app_url']),
+    ('IterationSlim', 'IterationSlim', [
+        'id', 'name', 'status', 'start_date', 'end_date', 'stats', 'group_ids',
+        'updated_at', 'app_url',
+    ]),
+]
+
+# (record, field) -> record class the field's value(s) decode into.
+NESTED: Dict[Tuple[str, str], str] = {
+    ('StorySlim', 'labels'): 'LabelSlim',
+    ('StoryDetail', 'labels'): 'LabelSlim',
+    ('MemberSlim', 'profile'): 'ProfileSlim',
+}
+
+HEADER = '''\
+# Generated by `python -m sc.api.gen_records` from shortcut-api-v3.yaml.
+# Do not edit by hand: change RECORDS in gen_records.py and regenerate.
+"""Compact ``__slots__`` records for decoded API responses.
+
+Each class keeps only the fields the CLI reads; everything else in the
+payload is dropped at decode time. Missing fields decode as None.
+"""
+'''
+
+
+def _field_type(prop: Dict) -> str:
+    if '$ref' in prop:
+        return prop['$ref'].rsplit('/', 1)[-1]
+    if prop.get('type') == 'array':
+        return f"array of {_field_type(prop.get('items', {}))}"
+    kind = prop.get('type', 'object')
+    return f"{kind}, nullable" if prop.get('x-nullable') else kind
+
+
+def _record_source(name: str, definition: str, fields: List[str], properties: Dict) -> str:
+    lines = [
+        "",
+        "",
+        f"class {name}:",
+        f'    """{definition} fields used by the CLI."""',
+        "",
+        "    __slots__ = (",
+    ]
+    width = max(len(f) for f in fields) + 4
+    for field in fields:
+        lines.append(f"        {repr(field) + ',':<{width}} # {_field_type(properties[field])}")
+    lines += [
+        "    )",
+        "",
+    ]
+    params = textwrap.wrap(", ".join(["self"] + [f"{f}=None" for f in fields]), width=88,
+                           initial_indent="    def __init__(", subsequent_indent=" " * 17)
+    params[-1] += "):"
+    lines += params
+    lines += [f"        self.{f} = {f}" for f in fields]
+    lines += [
+        "",
+        "    @classmethod",
+        f"    def from_dict(cls, data: dict) -> '{name}':",
+        "        self = cls.__new__(cls)",
+        "        get = data.get",
+    ]
+    for field in fields:
+        nested = NESTED.get((name, field))
+        if nested is None:
+            lines.append(f"        self.{field} = get({field!r})")
+        elif properties[field].get('type') == 'array':
+            lines.append(f"        self.{field} = [{nested}.from_dict(v) for v in get({field!r}) or ()]")
+        else:
+            lines.append(f"        value = get({field!r})")
+            lines.append(f"        self.{field} = {nested}.from_dict(value) if value is not None else None")
+    lines += [
+        "        return self",
+        "",
+        "    def to_dict(self) -> dict:",
+        "        return {",
+    ]
+    for field in fields:
+        nested = NESTED.get((name, field))
+        if nested is None:
+            value = f"self.{field}"
+        elif properties[field].get('type') == 'array':
+            value = f"[v.to_dict() for v in self.{field} or ()]"
+        else:
+            value = f"self.{field}.to_dict() if self.{field} is not None else None"
+        lines.append(f"            {field!r}: {value},")
+    lines += [
+        "        }",
+        "",
+        "    def __repr__(self) -> str:",
+    ]
+    shown = [f for f in ('id', 'name') if f in fields]
+    lines.append(f"        return f\"{name}({', '.join(f'{f}={{self.{f}!r}}' for f in shown)})\"")
+    return "\n".join(lines)
+
+
+def generate(spec_path: Path = SPEC) -> str:
+    """Source of records.py for the given spec."""
+    with open(spec_path, encoding='utf-8') as f:
+        definitions = yaml.safe_load(f)['definitions']
+    parts = [HEADER.rstrip("\n")]
+    for name, definition, fields in RECORDS:
+        properties = definitions[definition]['properties']
+        missing = [f for f in fields if f not in properties]
+        if missing:
+            raise ValueError(f"{definition} has no field(s) {', '.join(missing)}")
+        parts.append(_record_source(name, definition, fields, properties))
+    return "\n".join(parts) + "\n"
+
+
+def main() -> int:
+    OUTPUT.write_text(generate(), encoding='utf-8')
+    print(f"Wrote {OUTPUT.relative_to(ROOT)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
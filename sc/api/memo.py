@@ -0,0 +1,93 @@
+"""Per-command deduplication of identical API reads.
+
+A RequestMemo sits in front of the client's request path for the length
+of one ``sc`` command. Identical GETs that overlap in time share one HTTP
+call (single-flight), and later repeats are answered from memory. Each
+caller gets its own deep copy, because the typed models' ``from_json``
+rewrites the dicts it is given.
+"""
+
+import json
+import re
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Methods whose responses may be shared. Anything else is a write and
+# drops every memoised response, since it may have changed any of them.
+MEMOISED_METHODS = {'GET'}
+
+# Read endpoints that are never memoised (regular expressions on the path).
+# Story lists - search pages and the stories of an iteration, epic or
+# label - are large and read once; holding them would only cost memory.
+NOT_MEMOISED = (r'^/search/', r'/stories$')
+
+
+def copy_json(value: Any) -> Any:
+    """Deep copy of decoded JSON; several times faster than copy.deepcopy."""
+    if isinstance(value, dict):
+        return {k: copy_json(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [copy_json(v) for v in value]
+    return value
+
+
+class RequestMemo:
+    """Single-flight and memoisation of identical reads, for one command."""
+
+    def __init__(self, not_memoised: Tuple[str, ...] = NOT_MEMOISED):
+        self.not_memoised = re.compile('|'.join(not_memoised)) if not_memoised else None
+        self.hits = 0
+        self._lock = threading.Lock()
+        self._results: Dict[tuple, Any] = {}
+        self._inflight: Dict[tuple, Future] = {}
+        self._generation = 0
+
+    def key(self, method: str, path: str, kwargs: Dict[str, Any]) -> Optional[tuple]:
+        """Identity of a request, or None when it must not be shared."""
+        if method.upper() not in MEMOISED_METHODS:
+            return None
+        if self.not_memoised is not None and self.not_memoised.search(path.split('?', 1)[0]):
+            return None
+        return method.upper(), path, json.dumps(kwargs, sort_keys=True, default=str)
+
+    def clear(self) -> None:
+        """Forget every response (after a write, or when a new command starts)."""
+        with self._lock:
+            self._results.clear()
+            self._generation += 1
+
+    def call(self, key: tuple, fetch: Callable[[], Any]) -> Tuple[Any, bool]:
+        """Result of ``fetch`` for ``key``, and whether it was shared rather than fetched."""
+        with self._lock:
+            if key in self._results:
+                self.hits += 1
+                return copy_json(self._results[key]), True
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+                generation = self._generation
+        if not owner:
+            shared = future.result()
+            with self._lock:
+                self.hits += 1
+            return copy_json(shared), True
+
+        try:
+            result = fetch()
+        except BaseException as e:
+            with self._lock:
+                del self._inflight[key]
+            future.set_exception(e)
+            raise
+        # Waiters and later hits copy from a pristine version the caller never sees
+        shareable = isinstance(result, (dict, list))
+        pristine = copy_json(result) if shareable else result
+        with self._lock:
+            del self._inflight[key]
+            # A write that landed while this read was in flight may have changed it
+            if shareable and generation == self._generation:
+                self._results[key] = pristine
+        future.set_result(pristine)
+        return result, False
@@ -0,0 +1,80 @@
+"""Lazy, cursor-following iteration over Shortcut search results."""
+
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterator, Optional
+from urllib.parse import urlsplit
+
+from . import trace
+from .records import EpicSlim, StorySlim
+
+# Largest page_size the search endpoints accept.
+MAX_PAGE_SIZE = 250
+
+
+def _next_path(client, next_token: Optional[str]) -> Optional[str]:
+    """Turn a response's ``next`` value into a path relative to the client's base URL."""
+    if not next_token:
+        return None
+    base_path = urlsplit(client.base_url).path.rstrip('/')
+    if next_token.startswith('http'):
+        parts = urlsplit(next_token)
+        next_token = parts.path + (f'?{parts.query}' if parts.query else '')
+    if base_path and next_token.startswith(base_path):
+        next_token = next_token[len(base_path):]
+    return next_token
+
+
+def iter_search(client, path: str, params: Dict[str, Any], limit: Optional[int] = None,
+                decode: Callable[[Dict[str, Any]], Any] = lambda item: SimpleNamespace(**item)) -> Iterator[Any]:
+    """Yield search hits page by page, following ``next`` until ``limit`` is reached.
+
+    While the caller works through one page the next one is already being
+    fetched on a background thread, so rendering overlaps the network.
+    """
+    if limit is not None and limit <= 0:
+        return
+    params = dict(params)
+    params.setdefault('page_size', min(limit or MAX_PAGE_SIZE, MAX_PAGE_SIZE))
+    remaining = limit
+
+    pool = ThreadPoolExecutor(max_workers=1)
+    try:
+        pending = pool.submit(client._make_request, 'GET', path, params=params)
+        while pending is not None:
+            page = pending.result()
+            items = page.get('data') or []
+            next_path = _next_path(client, page.get('next'))
+            if next_path and items and (remaining is None or remaining > len(items)):
+                pending = pool.submit(client._make_request, 'GET', next_path)
+            else:
+                pending = None
+
+            tracer = trace.get_tracer()
+            for item in map(decode, items) if tracer is None else tracer.decode_page(decode, items):
+                yield item
+                if remaining is not None:
+                    remaining -= 1
+                    if remaining == 0:
+                        return
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_search_stories(client, query: str, limit: Optional[int] = None, detail: str = 'slim',
+                        **kwargs) -> Iterator[Any]:
+    """Yield stories matching a search query, across as many pages as needed.
+
+    Hits decode into StorySlim records unless another ``decode`` is given.
+    """
+    params = {'query': query, 'detail': detail}
+    kwargs.setdefault('decode', StorySlim.from_dict)
+    return iter_search(client, '/search/stories', params, limit=limit, **kwargs)
+
+
+def iter_search_epics(client, query: str, limit: Optional[int] = None, detail: str = 'slim',
+                      **kwargs) -> Iterator[Any]:
+    """Yield epics matching a search query, decoded into EpicSlim records."""
+    params = {'query': query, 'detail': detail}
+    kwargs.setdefault('decode', EpicSlim.from_dict)
+    return iter_search(client, '/search/epics', params, limit=limit, **kwargs)
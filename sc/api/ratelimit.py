@@ -0,0 +1,163 @@
+"""Client-side rate limiting for the Shortcut API.
+
+Shortcut allows each token a fixed number of requests per minute and
+answers anything beyond that with 429. ``RateLimiter`` keeps the CLI
+inside that budget with a token bucket, and caps how many requests are in
+flight at once with an AIMD limit: the cap halves on every 429 and
+creeps back up by one after each cap-sized run of successful requests.
+"""
+
+import random
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+# Shortcut's documented per-token budget.
+REQUESTS_PER_MINUTE = 200
+MAX_CONCURRENCY = 8
+MAX_RETRIES = 5
+
+# Slack for float rounding in refills; without it a wait can shrink to a
+# step too small to move the clock and never finish.
+EPSILON = 1e-6
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a request is still throttled after every retry."""
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (only the delta-seconds form)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+class RateLimiter:
+    """Token bucket plus adaptive concurrency limit, shared by every thread."""
+
+    def __init__(self, requests_per_minute: float = REQUESTS_PER_MINUTE,
+                 burst: Optional[int] = None, max_concurrency: int = MAX_CONCURRENCY,
+                 max_retries: int = MAX_RETRIES, base_delay: float = 0.5,
+                 max_delay: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep,
+                 log: Optional[Callable[[str], None]] = None):
+        self.rate = requests_per_minute / 60.0
+        self.capacity = float(burst if burst is not None else max(1, int(requests_per_minute // 10)))
+        self.tokens = self.capacity
+        self.max_concurrency = max(1, max_concurrency)
+        self.limit = float(self.max_concurrency)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.clock = clock
+        self.sleep = sleep
+        self.log = log
+
+        self._cond = threading.Condition()
+        self._last_refill = clock()
+        self._blocked_until = 0.0
+        self._successes = 0
+        self.in_flight = 0
+        self.counters = {'requests': 0, 'throttled': 0, 'retries': 0, 'waited': 0.0}
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+    def acquire(self) -> None:
+        """Block until a concurrency slot and a token are both available."""
+        waited = 0.0
+        with self._cond:
+            while self.in_flight >= int(self.limit):
+                self._cond.wait()
+            self.in_flight += 1
+
+        while True:
+            with self._cond:
+                now = self.clock()
+                self._refill(now)
+                delay = self._blocked_until - now
+                if delay <= EPSILON:
+                    if self.tokens >= 1 - EPSILON:
+                        self.tokens = max(0.0, self.tokens - 1)
+                        self.counters['requests'] += 1
+                        self.counters['waited'] += waited
+                        return
+                    delay = (1 - self.tokens) / self.rate
+            self.sleep(delay)
+            waited += delay
+
+    def release(self, throttled: bool = False, retry_after: Optional[float] = None) -> None:
+        """Give the slot back and adapt the concurrency limit to the outcome."""
+        with self._cond:
+            self.in_flight -= 1
+            if throttled:
+                self.counters['throttled'] += 1
+                self.limit = max(1.0, self.limit / 2)
+                self._successes = 0
+                if retry_after:
+                    self._blocked_until = max(self._blocked_until, self.clock() + retry_after)
+                # The server says the bucket is empty; stop spending ours
+                self.tokens = min(self.tokens, 0.0)
+            else:
+                self._successes += 1
+                if self._successes >= int(self.limit) and self.limit < self.max_concurrency:
+                    self.limit = min(float(self.max_concurrency), self.limit + 1)
+                    self._successes = 0
+            self._cond.notify_all()
+        if throttled and self.log:
+            self.log(f"429 received; concurrency limit now {int(self.limit)}"
+                     + (f", pausing {retry_after:.1f}s" if retry_after else ""))
+
+    def backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Delay before retry number ``attempt`` (1-based): Retry-After or full-jitter exponential."""
+        if retry_after is not None:
+            return retry_after
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+    def call(self, send: Callable[[], object], is_throttled: Callable[[Exception], Optional[float]]):
+        """Run ``send`` under the limiter, retrying while the API answers 429.
+
+        ``is_throttled`` inspects an exception raised by ``send`` and returns
+        the Retry-After delay (0.0 when absent) for a 429, or None otherwise.
+        """
+        attempt = 0
+        while True:
+            self.acquire()
+            try:
+                result = send()
+            except Exception as e:
+                retry_after = is_throttled(e)
+                if retry_after is None:
+                    self.release()
+                    raise
+                self.release(throttled=True, retry_after=retry_after or None)
+                attempt += 1
+                if attempt > self.max_retries:
+                    raise RateLimitExceeded(
+                        f"Shortcut API rate limit exceeded (gave up after {self.max_retries} retries)"
+                    ) from e
+                delay = self.backoff(attempt, retry_after or None)
+                self.counters['retries'] += 1
+                if self.log:
+                    self.log(f"retry {attempt}/{self.max_retries} in {delay:.2f}s")
+                self.sleep(delay)
+                continue
+            self.release()
+            return result
+
+    def stats(self) -> Dict[str, object]:
+        with self._cond:
+            self._refill(self.clock())
+            return {
+                **self.counters,
+                'concurrency_limit': int(self.limit),
+                'in_flight': self.in_flight,
+                'tokens': round(self.tokens, 2),
+                'rate_per_minute': round(self.rate * 60, 1),
+            }
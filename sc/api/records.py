@@ -0,0 +1,563 @@
+# Generated by `python -m sc.api.gen_records` from shortcut-api-v3.yaml.
+# Do not edit by hand: change RECORDS in gen_records.py and regenerate.
+"""Compact ``__slots__`` records for decoded API responses.
+
+Each class keeps only the fields the CLI reads; everything else in the
+payload is dropped at decode time. Missing fields decode as None.
+"""
+
+
+class LabelSlim:
+    """LabelSlim fields used by the CLI."""
+
+    __slots__ = (
+        'id',        # integer
+        'name',      # string
+        'color',     # string, nullable
+        'archived',  # boolean
+    )
+
+    def __init__(self, id=None, name=None, color=None, archived=None):
+        self.id = id
+        self.name = name
+        self.color = color
+        self.archived = archived
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'LabelSlim':
+        self = cls.__new__(cls)
+        get = data.get
+        self.id = get('id')
+        self.name = get('name')
+        self.color = get('color')
+        self.archived = get('archived')
+        return self
+
+    def to_dict(self) -> dict:
+        return {
+            'id': self.id,
+            'name': self.name,
+            'color': self.color,
+            'archived': self.archived,
+        }
+
+    def __repr__(self) -> str:
+        return f"LabelSlim(id={self.id!r}, name={self.name!r})"
+
+
+class ProfileSlim:
+    """Profile fields used by the CLI."""
+
+    __slots__ = (
+        'name',           # string, nullable
+        'mention_name',   # string
+        'email_address',  # string, nullable
+    )
+
+    def __init__(self, name=None, mention_name=None, email_address=None):
+        self.name = name
+        self.mention_name = mention_name
+        self.email_address = email_address
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'ProfileSlim':
+        self = cls.__new__(cls)
+        get = data.get
+        self.name = get('name')
+        self.mention_name = get('mention_name')
+        self.email_address = get('email_address')
+        return self
+
+    def to_dict(self) -> dict:
+        return {
+            'name': self.name,
+            'mention_name': self.mention_name,
+            'email_address': self.email_address,
+        }
+
+    def __repr__(self) -> str:
+        return f"ProfileSlim(name={self.name!r})"
+
+
+class MemberSlim:
+    """Member fields used by the CLI."""
+
+    __slots__ = (
+        'id',        # string
+        'disabled',  # boolean
+        'role',      # string
+        'profile',   # Profile
+    )
+
+    def __init__(self, id=None, disabled=None, role=None, profile=None):
+        self.id = id
+        self.disabled = disabled
+        self.role = role
+        self.profile = profile
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'MemberSlim':
+        self = cls.__new__(cls)
+        get = data.get
+        self.id = get('id')
+        self.disabled = get('disabled')
+        self.role = get('role')
+        value = get('profile')
+        self.profile = ProfileSlim.from_dict(value) if value is not None else None
+        return self
+
+    def to_dict(self) -> dict:
+        return {
+            'id': self.id,
+            'disabled': self.disabled,
+            'role': self.role,
+            'profile': self.profile.to_dict() if self.profile is not None else None,
+        }
+
+    def __repr__(self) -> str:
+        return f"MemberSlim(id={self.id!r})"
+
+
+class GroupSlim:
+    """Group fields used by the CLI."""
+
+    __slots__ = (
+        'id',            # string
+        'name',          # string
+        'mention_name',  # string
+        'archived',      # boolean
+        'description',   # string
+        'member_ids',    # array of string
+    )
+
+    def __init__(self, id=None, name=None, mention_name=None, archived=None,
+                 description=None, member_ids=None):
+        self.id = id
+        self.name = name
+        self.mention_name = mention_name
+        self.archived = archived
+        self.description = description
+        self.member_ids = member_ids
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'GroupSlim':
+        self = cls.__new__(cls)
+        get = data.get
+        self.id = get('id')
+        self.name = get('name')
+        self.mention_name = get('mention_name')
+        self.archived = get('archived')
+        self.description = get('description')
+        self.member_ids = get('member_ids')
+        return self
+
+    def to_dict(self) -> dict:
+        return {
+            'id': self.id,
+            'name': self.name,
+            'mention_name': self.mention_name,
+            'archived': self.archived,
+            'description': self.description,
+            'member_ids': self.member_ids,
+        }
+
+    def __repr__(self) -> str:
+        return f"GroupSlim(id={self.id!r}, name={self.name!r})"
+
+
+class StorySlim:
+    """StorySlim fields used by the CLI."""
+
+    __slots__ = (
+        'id',                 # integer
+        'name',               # string
+        'story_type',         # string
+        'workflow_state_id',  # integer
+        'owner_ids',          # array of string
+        'estimate',           # integer, nullable
+        'epic_id',            # integer, nullable
+        'iteration_id',       # integer, nullable
+        'group_id',           # string, nullable
+        'labels',             # array of LabelSlim
+        'archived',           # boolean
+        'blocked',            # boolean
+        'started',            # boolean
+        'completed',          # boolean
+        'created_at',         # string
+        'updated_at',         # string, nullable
+        'started_at',         # string, nullable
+        'completed_at',       # string, nullable
+        'deadline',           # string, nullable
+        'app_url',            # string
+    )
+
+    def __init__(self, id=None, name=None, story_type=None, workflow_state_id=None,
+                 owner_ids=None, estimate=None, epic_id=None, iteration_id=None,
+                 group_id=None, labels=None, archived=None, blocked=None, started=None,
+                 completed=None, created_at=None, updated_at=None, started_at=None,
+                 completed_at=None, deadline=None, app_url=None):
+        self.id = id
+        self.name = name
+        self.story_type = story_type
+        self.workflow_state_id = workflow_state_id
+        self.owner_ids = owner_ids
+        self.estimate = estimate
+        self.epic_id = epic_id
+        self.iteration_id = iteration_id
+        self.group_id = group_id
+        self.labels = labels
+        self.archived = archived
+        self.blocked = blocked
+        self.started = started
+        self.completed = completed
+        self.created_at = created_at
+        self.updated_at = updated_at
+        self.started_at = started_at
+        self.completed_at = completed_at
+        self.deadline = deadline
+        self.app_url = app_url
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'StorySlim':
+        self = cls.__new__(cls)
+        get = data.get
+        self.id = get('id')
+        self.name = get('name')
+        self.story_type = get('story_type')
+        self.workflow_state_id = get('workflow_state_id')
+        self.owner_ids = get('owner_ids')
+        self.estimate = get('estimate')
+        self.epic_id = get('epic_id')
+        self.iteration_id = get('iteration_id')
+        self.group_id = get('group_id')
+        self.labels = [LabelSlim.from_dict(v) for v in get('labels') or ()]
+        self.archived = get('archived')
+        self.blocked = get('blocked')
+        self.started = get('started')
+        self.completed = get('completed')
+        self.created_at = get('created_at')
+        self.updated_at = get('updated_at')
+        self.started_at = get('started_at')
+        self.completed_at = get('completed_at')
+        self.deadline = get('deadline')
+        self.app_url = get('app_url')
+        return self
+
+    def to_dict(self) -> dict:
+        return {
+            'id': self.id,
+            'name': self.name,
+            'story_type': self.story_type,
+            'workflow_state_id': self.workflow_state_id,
+            'owner_ids': self.owner_ids,
+            'estimate': self.estimate,
+            'epic_id': self.epic_id,
+            'iteration_id': self.iteration_id,
+            'group_id': self.group_id,
+            'labels': [v.to_dict() for v in self.labels or ()],
+            'archived': self.archived,
+            'blocked': self.blocked,
+            'started': self.started,
+            'completed': self.completed,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
+            'started_at': self.started_at,
+            'completed_at': self.completed_at,
+            'deadline': self.deadline,
+            'app_url': self.app_url,
+        }
+
+    def __repr__(self) -> str:
+        return f"StorySlim(id={self.id!r}, name={self.name!r})"
+
+
+class StoryDetail:
+    """StorySearchResult fields used by the CLI."""
+
+    __slots__ = (
+        'id',                 # integer
+        'name',               # string
+        'story_type',         # string
+        'workflow_state_id',  # integer
+        'owner_ids',          # array of string
+        'estimate',           # integer, nullable
+        'epic_id',            # integer, nullable
+        'iteration_id',       # integer, nullable
+        'group_id',           # string, nullable
+        'labels',             # array of LabelSlim
+        'archived',           # boolean
+        'blocked',            # boolean
+        'started',            # boolean
+        'completed',          # boolean
+        'created_at',         # string
+        'updated_at',         # string, nullable
+        'started_at',         # string, nullable
+        'completed_at',       # string, nullable
+        'deadline',           # string, nullable
+        'app_url',            # string
+        'description',        # string
+        'requested_by_id',    # string
+        'comments',           # array of StoryComment
+        'tasks',              # array of Task
+    )
+
+    def __init__(self, id=None, name=None, story_type=None, workflow_state_id=None,
+                 owner_ids=None, estimate=None, epic_id=None, iteration_id=None,
+                 group_id=None, labels=None, archived=None, blocked=None, started=None,
+                 completed=None, created_at=None, updated_at=None, started_at=None,
+                 completed_at=None, deadline=None, app_url=None, description=None,
+                 requested_by_id=None, comments=None, tasks=None):
+        self.id = id
+        self.name = name
+        self.story_type = story_type
+        self.workflow_state_id = workflow_state_id
+        self.owner_ids = owner_ids
+        self.estimate = estimate
+        self.epic_id = epic_id
+        self.iteration_id = iteration_id
+        self.group_id = group_id
+        self.labels = labels
+        self.archived = archived
+        self.blocked = blocked
+        self.started = started
+        self.completed = completed
+        self.created_at = created_at
+        self.updated_at = updated_at
+        self.started_at = started_at
+        self.completed_at = completed_at
+        self.deadline = deadline
+        self.app_url = app_url
+        self.description = description
+        self.requested_by_id = requested_by_id
+        self.comments = comments
+        self.tasks = tasks
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'StoryDetail':
+        self = cls.__new__(cls)
+        get = data.get
+        self.id = get('id')
+        self.name = get('name')
+        self.story_type = get('story_type')
+        self.workflow_state_id = get('workflow_state_id')
+        self.owner_ids = get('owner_ids')
+        self.estimate = get('estimate')
+        self.epic_id = get('epic_id')
+        self.iteration_id = get('iteration_id')
+        self.group_id = get('group_id')
+        self.labels = [LabelSlim.from_dict(v) for v in get('labels') or ()]
+        self.archived = get('archived')
+        self.blocked = get('blocked')
+        self.started = get('started')
+        self.completed = get('completed')
+        self.created_at = get('created_at')
+        self.updated_at = get('updated_at')
+        self.started_at = get('started_at')
+        self.completed_at = get('completed_at')
+        self.deadline = get('deadline')
+        self.app_url = get('app_url')
+        self.description = get('description')
+        self.requested_by_id = get('requested_by_id')
+        self.comments = get('comments')
+        self.tasks = get('tasks')
+        return self
+
+    def to_dict(self) -> dict:
+        return {
+            'id': self.id,
+            'name': self.name,
+            'story_type': self.story_type,
+            'workflow_state_id': self.workflow_state_id,
+            'owner_ids': self.owner_ids,
+            'estimate': self.estimate,
+            'epic_id': self.epic_id,
+            'iteration_id': self.iteration_id,
+            'group_id': self.group_id,
+            'labels': [v.to_dict() for v in self.labels or ()],
+            'archived': self.archived,
+            'blocked': self.blocked,
+            'started': self.started,
+            'completed': self.completed,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
+            'started_at': self.started_at,
+            'completed_at': self.completed_at,
+            'deadline': self.deadline,
+            'app_url': self.app_url,
+            'description': self.description,
+            'requested_by_id': self.requested_by_id,
+            'comments': self.comments,
+            'tasks': self.tasks,
+        }
+
+    def __repr__(self) -> str:
+        return f"StoryDetail(id={self.id!r}, name={self.name!r})"
+
+
+class EpicSlim:
+    """EpicSlim fields used by the CLI."""
+
+    __slots__ = (
+        'id',            # integer
+        'name',          # string
+        'state',         # string
+        'stats',         # EpicStats
+        'owner_ids',     # array of string
+        'group_ids',     # array of string
+        'archived',      # boolean
+        'started_at',    # string, nullable
+        'completed_at',  # string, nullable
+        'deadline',      # string, nullable
+        'updated_at',    # string, nullable
+        'app_url',       # string
+    )
+
+    def __init__(self, id=None, name=None, state=None, stats=None, owner_ids=None,
+                 group_ids=None, archived=None, started_at=None, completed_at=None,
+                 deadline=None, updated_at=None, app_url=None):
+        self.id = id
+        self.name = name
+        self.state = state
+        self.stats = stats
+        self.owner_ids = owner_ids
+        self.group_ids = group_ids
+        self.archived = archived
+        self.started_at = started_at
+        self.completed_at = completed_at
+        self.deadline = deadline
+        self.updated_at = updated_at
+        self.app_url = app_url
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'EpicSlim':
+        self = cls.__new__(cls)
+        get = data.get
+        self.id = get('id')
+        self.name = get('name')
+        self.state = get('state')
+        self.stats = get('stats')
+        self.owner_ids = get('owner_ids')
+        self.group_ids = get('group_ids')
+        self.archived = get('archived')
+        self.started_at = get('started_at')
+        self.completed_at = get('completed_at')
+        self.deadline = get('deadline')
+        self.updated_at = get('updated_at')
+        self.app_url = get('app_url')
+        return self
+
+    def to_dict(self) -> dict:
+        return {
+            'id': self.id,
+            'name': self.name,
+            'state': self.state,
+            'stats': self.stats,
+            'owner_ids': self.owner_ids,
+            'group_ids': self.group_ids,
+            'archived': self.archived,
+            'started_at': self.started_at,
+            'completed_at': self.completed_at,
+            'deadline': self.deadline,
+            'updated_at': self.updated_at,
+            'app_url': self.app_url,
+        }
+
+    def __repr__(self) -> str:
+        return f"EpicSlim(id={self.id!r}, name={self.name!r})"
+
+
+class ProjectSlim:
+    """Project fields used by the CLI."""
+
+    __slots__ = (
+        'id',        # integer
+        'name',      # string
+        'archived',  # boolean
+        'app_url',   # string
+    )
+
+    def __init__(self, id=None, name=None, archived=None, app_url=None):
+        self.id = id
+        self.name = name
+        self.archived = archived
+        self.app_url = app_url
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'ProjectSlim':
+        self = cls.__new__(cls)
+        get = data.get
+        self.id = get('id')
+        self.name = get('name')
+        self.archived = get('archived')
+        self.app_url = get('app_url')
+        return self
+
+    def to_dict(self) -> dict:
+        return {
+            'id': self.id,
+            'name': self.name,
+            'archived': self.archived,
+            'app_url': self.app_url,
+        }
+
+    def __repr__(self) -> str:
+        return f"ProjectSlim(id={self.id!r}, name={self.name!r})"
+
+
+class IterationSlim:
+    """IterationSlim fields used by the CLI."""
+
+    __slots__ = (
+        'id',          # integer
+        'name',        # string
+        'status',      # string
+        'start_date',  # string
+        'end_date',    # string
+        'stats',       # IterationStats
+        'group_ids',   # array of string
+        'updated_at',  # string
+        'app_url',     # string
+    )
+
+    def __init__(self, id=None, name=None, status=None, start_date=None, end_date=None,
+                 stats=None, group_ids=None, updated_at=None, app_url=None):
+        self.id = id
+        self.name = name
+        self.status = status
+        self.start_date = start_date
+        self.end_date = end_date
+        self.stats = stats
+        self.group_ids = group_ids
+        self.updated_at = updated_at
+        self.app_url = app_url
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'IterationSlim':
+        self = cls.__new__(cls)
+        get = data.get
+        self.id = get('id')
+        self.name = get('name')
+        self.status = get('status')
+        self.start_date = get('start_date')
+        self.end_date = get('end_date')
+        self.stats = get('stats')
+        self.group_ids = get('group_ids')
+        self.updated_at = get('updated_at')
+        self.app_url = get('app_url')
+        return self
+
+    def to_dict(self) -> dict:
+        return {
+            'id': self.id,
+            'name': self.name,
+            'status': self.status,
+            'start_date': self.start_date,
+            'end_date': self.end_date,
+            'stats': self.stats,
+            'group_ids': self.group_ids,
+            'updated_at': self.updated_at,
+            'app_url': self.app_url,
+        }
+
+    def __repr__(self) -> str:
+        return f"IterationSlim(id={self.id!r}, name={self.name!r})"
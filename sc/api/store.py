@@ -0,0 +1,353 @@
+"""Local SQLite mirror of stories, epics and iterations."""
+
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS stories (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    story_type TEXT,
+    workflow_state_id INTEGER,
+    epic_id INTEGER,
+    iteration_id INTEGER,
+    group_id TEXT,
+    estimate INTEGER,
+    owner_ids TEXT,
+    archived INTEGER,
+    updated_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS stories_iteration ON stories (iteration_id);
+CREATE INDEX IF NOT EXISTS stories_epic ON stories (epic_id);
+CREATE INDEX IF NOT EXISTS stories_state ON stories (workflow_state_id);
+CREATE TABLE IF NOT EXISTS epics (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    state TEXT,
+    updated_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS iterations (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    status TEXT,
+    start_date TEXT,
+    end_date TEXT,
+    updated_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    entity TEXT PRIMARY KEY,
+    high_water TEXT,
+    synced_at REAL
+);
+CREATE TABLE IF NOT EXISTS iteration_facts (
+    iteration_id INTEGER PRIMARY KEY,
+    facts TEXT NOT NULL,
+    cached_at REAL
+);
+"""
+
+# Full-text index over names and descriptions. Comment text is not
+# indexed: sync pulls stories from /stories/search, which returns only
+# comment_ids. Rows are keyed by id * 4 + kind so triggers can replace a
+# single row by rowid; INSERT OR REPLACE on the base tables only fires
+# the insert trigger.
+TEXT_INDEX_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS text_index USING fts5(
+    name, body, kind UNINDEXED, ref UNINDEXED, tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+TEXT_INDEX_TRIGGERS = """
+CREATE TRIGGER IF NOT EXISTS {table}_text_insert AFTER INSERT ON {table} BEGIN
+    DELETE FROM text_index WHERE rowid = new.id * 4 + {code};
+    INSERT INTO text_index (rowid, name, body, kind, ref) VALUES (
+        new.id * 4 + {code}, new.name, {body}, '{kind}', new.id
+    );
+END;
+CREATE TRIGGER IF NOT EXISTS {table}_text_delete AFTER DELETE ON {table} BEGIN
+    DELETE FROM text_index WHERE rowid = old.id * 4 + {code};
+END;
+"""
+
+INDEXED = {
+    # table: (kind, code, body expression)
+    'stories': ('story', 1, "coalesce(json_extract(new.data, '$.description'), '')"),
+    'epics': ('epic', 2, "coalesce(json_extract(new.data, '$.description'), '')"),
+    'iterations': ('iteration', 3, "coalesce(json_extract(new.data, '$.description'), '')"),
+}
+
+ENTITIES = ('stories', 'epics', 'iterations')
+
+# Markers around matched terms in snippets; callers swap them for markup.
+MATCH_START = "\x02"
+MATCH_END = "\x03"
+
+
+def text_query(text: str) -> str:
+    """Turn free text into an FTS5 query: every word must match, the last as a prefix."""
+    words = [w.replace('"', '') for w in text.split()]
+    words = [w for w in words if w]
+    if not words:
+        return ''
+    terms = [f'"{w}"' for w in words]
+    terms[-1] += '*'
+    return ' '.join(terms)
+
+
+class LocalStore:
+    """Stories, epics and iterations as last synced, keyed by ID.
+
+    Each row keeps a few indexed columns for filtering plus the full JSON
+    document in ``data``. ``sync_state`` records the newest ``updated_at``
+    seen per entity type so the next sync only asks for changes.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+        has_index = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'text_index'"
+        ).fetchone()
+        self.conn.executescript(TEXT_INDEX_SCHEMA)
+        for table, (kind, code, body) in INDEXED.items():
+            self.conn.executescript(
+                TEXT_INDEX_TRIGGERS.format(table=table, kind=kind, code=code, body=body)
+            )
+        if not has_index:
+            self.rebuild_text_index()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    # Sync bookkeeping
+
+    def high_water(self, entity: str) -> Optional[str]:
+        row = self.conn.execute(
+            "SELECT high_water FROM sync_state WHERE entity = ?", (entity,)
+        ).fetchone()
+        return row['high_water'] if row else None
+
+    def set_high_water(self, entity: str, value: Optional[str]) -> None:
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO sync_state (entity, high_water, synced_at) VALUES (?, ?, ?)",
+                (entity, value, time.time())
+            )
+
+    def last_synced(self, entity: str) -> Optional[float]:
+        row = self.conn.execute(
+            "SELECT synced_at FROM sync_state WHERE entity = ?", (entity,)
+        ).fetchone()
+        return row['synced_at'] if row else None
+
+    def reset(self) -> None:
+        """Forget everything so the next sync is a full pull."""
+        with self.conn:
+            for entity in ENTITIES:
+                self.conn.execute(f"DELETE FROM {entity}")
+            self.conn.execute("DELETE FROM sync_state")
+
+    def rebuild_text_index(self) -> None:
+        """Re-index every row; only needed for mirrors created before the index."""
+        with self.conn:
+            self.conn.execute("DELETE FROM text_index")
+            for table, (kind, code, body) in INDEXED.items():
+                body = body.replace('new.', f'{table}.')
+                self.conn.execute(
+                    f"INSERT INTO text_index (rowid, name, body, kind, ref) "
+                    f"SELECT id * 4 + {code}, name, {body}, '{kind}', id FROM {table}"
+                )
+
+    def counts(self) -> Dict[str, int]:
+        return {
+            entity: self.conn.execute(f"SELECT COUNT(*) FROM {entity}").fetchone()[0]
+            for entity in ENTITIES
+        }
+
+    # Writes
+
+    def upsert_stories(self, stories: Iterable[Dict[str, Any]]) -> int:
+        rows = [
+            (s['id'], s.get('name') or '', s.get('story_type'), s.get('workflow_state_id'),
+             s.get('epic_id'), s.get('iteration_id'), s.get('group_id'), s.get('estimate'),
+             json.dumps(s.get('owner_ids') or []), int(bool(s.get('archived'))),
+             s.get('updated_at'), json.dumps(s))
+            for s in stories
+        ]
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO stories (id, name, story_type, workflow_state_id, epic_id,"
+                " iteration_id, group_id, estimate, owner_ids, archived, updated_at, data)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+        return len(rows)
+
+    def upsert_epics(self, epics: Iterable[Dict[str, Any]]) -> int:
+        rows = [
+            (e['id'], e.get('name') or '', e.get('state'), e.get('updated_at'), json.dumps(e))
+            for e in epics
+        ]
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO epics (id, name, state, updated_at, data) VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+        return len(rows)
+
+    def upsert_iterations(self, iterations: Iterable[Dict[str, Any]]) -> int:
+        rows = [
+            (i['id'], i.get('name') or '', i.get('status'), i.get('start_date'),
+             i.get('end_date'), i.get('updated_at'), json.dumps(i))
+            for i in iterations
+        ]
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO iterations (id, name, status, start_date, end_date,"
+                " updated_at, data) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+        return len(rows)
+
+    def set_iteration_facts(self, iteration_id: int, facts: List[Any]) -> None:
+        """Keep the per-story velocity facts of a finished iteration; they never change."""
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO iteration_facts (iteration_id, facts, cached_at) VALUES (?, ?, ?)",
+                (iteration_id, json.dumps(facts), time.time())
+            )
+
+    def delete(self, entity: str, entity_id: int) -> None:
+        with self.conn:
+            self.conn.execute(f"DELETE FROM {entity} WHERE id = ?", (entity_id,))
+
+    # Reads
+
+    def get_story(self, story_id: int) -> Optional[Dict[str, Any]]:
+        row = self.conn.execute("SELECT data FROM stories WHERE id = ?", (story_id,)).fetchone()
+        return json.loads(row['data']) if row else None
+
+    def get_epic(self, epic_id: int) -> Optional[Dict[str, Any]]:
+        row = self.conn.execute("SELECT data FROM epics WHERE id = ?", (epic_id,)).fetchone()
+        return json.loads(row['data']) if row else None
+
+    def get_iteration(self, iteration_id: int) -> Optional[Dict[str, Any]]:
+        row = self.conn.execute("SELECT data FROM iterations WHERE id = ?", (iteration_id,)).fetchone()
+        return json.loads(row['data']) if row else None
+
+    def get_iteration_facts(self, iteration_ids: Iterable[int]) -> Dict[int, List[Any]]:
+        """Cached velocity facts for whichever of the iterations have them."""
+        ids = list(iteration_ids)
+        if not ids:
+            return {}
+        rows = self.conn.execute(
+            f"SELECT iteration_id, facts FROM iteration_facts"
+            f" WHERE iteration_id IN ({', '.join('?' * len(ids))})", ids
+        )
+        return {r['iteration_id']: json.loads(r['facts']) for r in rows}
+
+    def find_iterations(self, name: Optional[str] = None, status: Optional[str] = None) -> List[Dict[str, Any]]:
+        clauses, params = [], []
+        if name:
+            clauses.append("name LIKE ?")
+            params.append(f"%{name}%")
+        if status:
+            clauses.append("status = ?")
+            params.append(status)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self.conn.execute(f"SELECT data FROM iterations {where} ORDER BY start_date", params)
+        return [json.loads(r['data']) for r in rows]
+
+    def find_epics(self, name: str) -> List[Dict[str, Any]]:
+        rows = self.conn.execute("SELECT data FROM epics WHERE name LIKE ?", (f"%{name}%",))
+        return [json.loads(r['data']) for r in rows]
+
+    def search_stories(self, text: Optional[str] = None, story_type: Optional[str] = None,
+                       state_ids: Optional[Iterable[int]] = None,
+                       owner_ids: Optional[Iterable[str]] = None,
+                       epic_ids: Optional[Iterable[int]] = None,
+                       iteration_ids: Optional[Iterable[int]] = None,
+                       group_ids: Optional[Iterable[str]] = None,
+                       label: Optional[str] = None,
+                       include_archived: bool = False,
+                       limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Filter mirrored stories; every given filter must match."""
+        clauses, params = [], []
+
+        def any_of(column, values):
+            values = list(values)
+            clauses.append(f"{column} IN ({', '.join('?' * len(values))})" if values else "0")
+            params.extend(values)
+
+        if text:
+            clauses.append("name LIKE ?")
+            params.append(f"%{text}%")
+        if story_type:
+            clauses.append("story_type = ?")
+            params.append(story_type)
+        if state_ids is not None:
+            any_of("workflow_state_id", state_ids)
+        if epic_ids is not None:
+            any_of("epic_id", epic_ids)
+        if iteration_ids is not None:
+            any_of("iteration_id", iteration_ids)
+        if group_ids is not None:
+            any_of("group_id", group_ids)
+        if owner_ids is not None:
+            owner_ids = list(owner_ids)
+            clauses.append(
+                "EXISTS (SELECT 1 FROM json_each(stories.owner_ids) WHERE value IN "
+                f"({', '.join('?' * len(owner_ids))}))" if owner_ids else "0"
+            )
+            params.extend(owner_ids)
+        if label:
+            clauses.append(
+                "EXISTS (SELECT 1 FROM json_each(stories.data, '$.labels') "
+                "WHERE lower(json_extract(value, '$.name')) = lower(?))"
+            )
+            params.append(label)
+        if not include_archived:
+            clauses.append("archived = 0")
+
+        sql = "SELECT data FROM stories"
+        if clauses:
+            sql += f" WHERE {' AND '.join(clauses)}"
+        sql += " ORDER BY updated_at DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [json.loads(r['data']) for r in self.conn.execute(sql, params)]
+
+    def search_text(self, text: str, kind: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Ranked full-text matches of one kind (story, epic or iteration).
+
+        Each result is the mirrored document plus ``_snippet``, a short
+        excerpt with matched terms between MATCH_START and MATCH_END.
+        """
+        query = text_query(text)
+        if not query:
+            return []
+        table = {v[0]: k for k, v in INDEXED.items()}[kind]
+        rows = self.conn.execute(
+            f"SELECT {table}.data AS data, "
+            f"snippet(text_index, -1, ?, ?, '…', 12) AS snippet "
+            f"FROM text_index JOIN {table} ON {table}.id = text_index.ref "
+            f"WHERE text_index MATCH ? AND text_index.kind = ? "
+            f"ORDER BY bm25(text_index, 10.0, 1.0) LIMIT ?",
+            (MATCH_START, MATCH_END, query, kind, limit)
+        )
+        results = []
+        for row in rows:
+            doc = json.loads(row['data'])
+            doc['_snippet'] = row['snippet']
+            results.append(doc)
+        return results
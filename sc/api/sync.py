@@ -0,0 +1,121 @@
+"""Incremental sync of the local store from the Shortcut API."""
+
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from .store import LocalStore
+
+# POST /stories/search returns at most this many stories per call, in no
+# documented order; a full batch means the window may hold more, so it is
+# split in two and each half fetched on its own.
+STORY_SEARCH_CAP = 1000
+
+EPOCH = "1970-01-01T00:00:00Z"
+
+# Story timestamp ranges a search window can be narrowed by, in order:
+# stories sharing one updated_at are told apart by when they were created
+SPLIT_FIELDS = ('updated_at', 'created_at')
+
+Window = Dict[str, Tuple[int, int]]
+
+
+def _newest(items, current):
+    stamps = [item['updated_at'] for item in items if item.get('updated_at')]
+    if current:
+        stamps.append(current)
+    return max(stamps) if stamps else None
+
+
+def _to_ms(stamp: str) -> int:
+    return round(datetime.fromisoformat(stamp.replace('Z', '+00:00')).timestamp() * 1000)
+
+
+def _from_ms(ms: int) -> str:
+    return time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(ms // 1000)) + f".{ms % 1000:03d}Z"
+
+
+def _split(window: Window) -> Optional[List[Window]]:
+    """Halve a window on its first range wider than an instant; None if there is none."""
+    for field in SPLIT_FIELDS:
+        # Nothing is created after it was last updated
+        lo, hi = window.get(field, (0, window['updated_at'][1]))
+        if lo < hi:
+            mid = (lo + hi) // 2
+            return [{**window, field: (lo, mid)}, {**window, field: (mid + 1, hi)}]
+    return None
+
+
+def _search_window(client, window: Window) -> list:
+    body = {'includes_description': True}
+    for field, (lo, hi) in window.items():
+        body[f'{field}_start'] = _from_ms(lo)
+        body[f'{field}_end'] = _from_ms(hi)
+    return client._make_request('POST', '/stories/search', json=body)
+
+
+def sync_stories(client, store: LocalStore) -> int:
+    """Pull stories updated since the last sync.
+
+    Each request names an explicit ``updated_at_start``/``updated_at_end``
+    window (both inclusive, to the millisecond), so the result order does
+    not matter; a window that comes back capped is split until every part
+    fits. The high-water mark moves only once the whole range is fetched.
+    Stories deleted in Shortcut are not reported by the search and stay
+    in the mirror until ``sync --full`` (or ``sc listen`` applying their
+    delete event).
+    """
+    high_water = store.high_water('stories')
+    start = _to_ms(high_water or EPOCH)
+    windows = [{'updated_at': (start, max(start, round(time.time() * 1000)))}]
+    newest = high_water
+    total = 0
+    while windows:
+        window = windows.pop()
+        batch = _search_window(client, window)
+        if len(batch) >= STORY_SEARCH_CAP:
+            halves = _split(window)
+            if halves is None:
+                raise RuntimeError(
+                    f"More than {STORY_SEARCH_CAP} stories were created and updated at the same "
+                    f"instant ({_from_ms(window['updated_at'][0])}); cannot sync them"
+                )
+            windows.extend(reversed(halves))  # oldest first
+            continue
+        total += store.upsert_stories(batch)
+        newest = _newest(batch, newest)
+    if newest:
+        store.set_high_water('stories', newest)
+    return total
+
+
+def _sync_collection(client, store: LocalStore, name: str, upsert) -> int:
+    """Fetch a whole collection but only write rows changed since the last sync."""
+    high_water = store.high_water(name)
+    if hasattr(client, 'fetch_reference'):
+        items = client.fetch_reference(name)
+    else:
+        items = client._make_request('GET', f'/{name}')
+    changed = [i for i in items if not high_water or (i.get('updated_at') or '') > high_water]
+    upsert(changed)
+    store.set_high_water(name, _newest(items, high_water))
+    return len(changed)
+
+
+def sync_epics(client, store: LocalStore) -> int:
+    return _sync_collection(client, store, 'epics', store.upsert_epics)
+
+
+def sync_iterations(client, store: LocalStore) -> int:
+    return _sync_collection(client, store, 'iterations', store.upsert_iterations)
+
+
+def sync_all(client, store: LocalStore, full: bool = False) -> Dict[str, int]:
+    """Bring the store up to date; returns the number of rows written per entity."""
+    if full:
+        store.reset()
+    return {
+        'stories': sync_stories(client, store),
+        'epics': sync_epics(client, store),
+        'iterations': sync_iterations(client, store),
+    }
@@ -0,0 +1,184 @@
+"""Opt-in request and phase timing, behind ``sc --trace``.
+
+While a Tracer is installed, the client records every request (method,
+path, status, latency, bytes, and whether it was served over HTTP, from
+the reference cache or shared with an identical request of the same
+command) and time is attributed to phases: ``http``, ``decode`` (JSON
+parsing), ``model`` (building typed objects and records), ``rate-limit``
+(waits and backoff) and ``render`` (Rich output). Spans nest and each
+phase counts only its own time, so a typed call that spends 80 ms on
+HTTP and 5 ms in ``from_json`` shows as 5 ms of ``model``. With no
+tracer installed every hook is a single ``None`` check.
+"""
+
+import itertools
+import json
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TextIO
+
+PHASES = ('http', 'decode', 'model', 'rate-limit', 'render')
+
+_tracer: Optional['Tracer'] = None
+
+
+def get_tracer() -> Optional['Tracer']:
+    return _tracer
+
+
+@dataclass
+class RequestEvent:
+    """One API call as the client saw it."""
+    method: str
+    path: str
+    status: Optional[int]
+    started: float
+    elapsed: float
+    bytes: int
+    source: str  # 'http', 'cache' or 'memo'
+    thread: int
+
+
+class Tracer:
+    """Collects request events and per-phase exclusive times for one run."""
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self.clock = clock
+        self.started = clock()
+        self.requests: List[RequestEvent] = []
+        self.phases: Counter = Counter()
+        self.spans: List[tuple] = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._threads: Dict[int, int] = {}
+        self._numbers = itertools.count(1)
+        self._restore: List[Callable[[], None]] = []
+
+    def _thread(self) -> int:
+        ident = threading.get_ident()
+        if ident not in self._threads:
+            self._threads[ident] = next(self._numbers)
+        return self._threads[ident]
+
+    @contextmanager
+    def span(self, phase: str, name: Optional[str] = None, **args) -> Iterator[None]:
+        """Time a block; nested spans on the same thread are subtracted from it."""
+        stack = self._local.__dict__.setdefault('stack', [])
+        started = self.clock()
+        stack.append(0.0)
+        try:
+            yield
+        finally:
+            elapsed = self.clock() - started
+            nested = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            with self._lock:
+                self.phases[phase] += elapsed - nested
+                self.spans.append((phase, name or phase, started, elapsed, self._thread(), args))
+
+    def request(self, method: str, path: str, status: Optional[int], started: float,
+                elapsed: float, size: int = 0, source: str = 'http') -> None:
+        with self._lock:
+            self.requests.append(RequestEvent(method.upper(), path, status, started, elapsed,
+                                              size, source, self._thread()))
+
+    def decode_page(self, decode: Callable[[Any], Any], items: Iterable[Any]) -> List[Any]:
+        """Decode a page of search hits eagerly, under one ``model`` span."""
+        items = list(items)
+        with self.span('model', f"decode {len(items)} hits"):
+            return [decode(item) for item in items]
+
+    # -- instrumentation ---------------------------------------------------
+
+    def instrument_client(self, client) -> None:
+        """Time the typed API methods of a client instance as ``model`` spans."""
+        from useshortcut.client import APIClient
+
+        def wrap(name, method):
+            def traced(*args, **kwargs):
+                with self.span('model', name):
+                    return method(*args, **kwargs)
+            return traced
+
+        for name in dir(APIClient):
+            if not name.startswith('_') and callable(getattr(APIClient, name)):
+                setattr(client, name, wrap(name, getattr(client, name)))
+                self._restore.append(lambda name=name: client.__dict__.pop(name, None))
+
+    def instrument_rendering(self) -> None:
+        """Time Rich console output as ``render`` spans until uninstalled."""
+        from rich.console import Console
+
+        original = Console.print
+        tracer = self
+
+        def traced_print(console, *args, **kwargs):
+            with tracer.span('render', 'console.print'):
+                return original(console, *args, **kwargs)
+
+        Console.print = traced_print
+        self._restore.append(lambda: setattr(Console, 'print', original))
+
+    def uninstall(self) -> None:
+        while self._restore:
+            self._restore.pop()()
+
+    # -- reporting ---------------------------------------------------------
+
+    def summary(self, out: TextIO) -> None:
+        """Write the request table and phase totals."""
+        wall = self.clock() - self.started
+        http = [r for r in self.requests if r.source == 'http']
+        sources = Counter(r.source for r in self.requests)
+        out.write(f"[trace] {len(self.requests)} request(s): {len(http)} over HTTP, "
+                  f"{sources['cache']} from cache, {sources['memo']} shared, "
+                  f"{sum(r.bytes for r in http)} bytes\n")
+        out.write(f"[trace] {'start ms':>9} {'ms':>8} {'status':>6} {'bytes':>9} {'source':<6} request\n")
+        for r in sorted(self.requests, key=lambda r: r.started):
+            out.write(f"[trace] {(r.started - self.started) * 1000:>9.1f} {r.elapsed * 1000:>8.1f} "
+                      f"{r.status if r.status is not None else '-':>6} {r.bytes:>9} {r.source:<6} "
+                      f"{r.method} {r.path}\n")
+        phases = ", ".join(f"{phase} {self.phases.get(phase, 0.0) * 1000:.1f}ms" for phase in PHASES)
+        out.write(f"[trace] phases: {phases}; wall {wall * 1000:.1f}ms\n")
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """The run in Chrome's trace event format (load it in chrome://tracing or Perfetto)."""
+        def us(seconds: float) -> float:
+            return round(seconds * 1e6, 1)
+
+        events = [
+            {'name': name, 'cat': phase, 'ph': 'X', 'ts': us(started - self.started),
+             'dur': us(elapsed), 'pid': 1, 'tid': thread, 'args': args}
+            for phase, name, started, elapsed, thread, args in self.spans
+        ]
+        events += [
+            {'name': f"{r.method} {r.path}", 'cat': f"request,{r.source}", 'ph': 'X',
+             'ts': us(r.started - self.started), 'dur': us(r.elapsed), 'pid': 1, 'tid': r.thread,
+             'args': {'status': r.status, 'bytes': r.bytes, 'source': r.source}}
+            for r in self.requests
+        ]
+        return {'traceEvents': sorted(events, key=lambda e: e['ts']), 'displayTimeUnit': 'ms'}
+
+    def write_chrome_trace(self, path: str) -> None:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.chrome_trace(), f)
+
+
+def install(tracer: Optional[Tracer] = None) -> Tracer:
+    """Make a tracer the process-wide one; clients and commands report to it."""
+    global _tracer
+    _tracer = tracer or Tracer()
+    return _tracer
+
+
+def uninstall() -> Optional[Tracer]:
+    """Remove the process-wide tracer and undo its instrumentation."""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    if tracer is not None:
+        tracer.uninstall()
+    return tracer
@@ -0,0 +1,266 @@
+"""Apply Shortcut outgoing-webhook events to the local mirror and cache.
+
+Shortcut POSTs one JSON event per change to every webhook registered
+with ``/api/v3/integrations/webhook``. An event lists ``actions``, each
+with an ``entity_type``, an ``action`` (create, update or delete), the
+entity ``id`` and, for updates, the ``changes`` as ``{"old", "new"}``
+pairs (``{"adds", "removes"}`` for list fields). When the webhook has a
+secret, the ``Payload-Signature`` header is the hex HMAC-SHA256 of the
+raw body keyed with it.
+
+Story, epic and iteration actions are applied to the local store so
+``--local`` reads see them at once; epic and iteration changes also patch
+the reference cache, and other cached collections are invalidated when
+their entities change. Updates to entities the mirror does not hold are
+skipped: an event carries only the changed fields, and ``sc sync``
+fills in the rest.
+"""
+
+import hashlib
+import hmac
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sc.api.memo import copy_json
+
+SIGNATURE_HEADER = 'Payload-Signature'
+
+# Largest request body accepted; real events are a few kilobytes
+MAX_BODY = 1024 * 1024
+
+# Entity type -> (store table, upsert method, read method)
+STORE_ENTITIES = {
+    'story': ('stories', 'upsert_stories', 'get_story'),
+    'epic': ('epics', 'upsert_epics', 'get_epic'),
+    'iteration': ('iterations', 'upsert_iterations', 'get_iteration'),
+}
+
+# Entity type -> reference-cache collection holding it
+CACHED_COLLECTIONS = {
+    'epic': 'epics',
+    'iteration': 'iterations',
+    'label': 'labels',
+    'group': 'groups',
+    'member': 'members',
+    'workflow': 'workflows',
+}
+# Collections patched in place from an event; the rest are dropped and refetched,
+# since their events carry too little of the entity to update a cached entry
+PATCHED_COLLECTIONS = {'epics', 'iterations'}
+
+# Fields a new story starts without, which the local views read
+STORY_DEFAULTS = {
+    'owner_ids': [], 'follower_ids': [], 'label_ids': [], 'labels': [], 'estimate': None,
+    'epic_id': None, 'iteration_id': None, 'group_id': None, 'archived': False, 'blocked': False,
+    'started': False, 'started_at': None, 'completed': False, 'completed_at': None,
+}
+
+
+def sign(body: bytes, secret: str) -> str:
+    """Signature Shortcut sends for a body; also used to replay recorded events."""
+    return hmac.new(secret.encode('utf-8'), body, hashlib.sha256).hexdigest()
+
+
+def verify_signature(body: bytes, signature: Optional[str], secret: str) -> bool:
+    """Whether ``signature`` is the signature of ``body`` under ``secret``."""
+    if not signature:
+        return False
+    return hmac.compare_digest(sign(body, secret), signature.strip().lower())
+
+
+def apply_changes(doc: Dict[str, Any], changes: Dict[str, Any]) -> None:
+    """Apply an action's ``changes`` to an entity document in place."""
+    for field, change in changes.items():
+        if not isinstance(change, dict):
+            continue
+        if 'adds' in change or 'removes' in change:
+            removes = change.get('removes') or []
+            values = [v for v in doc.get(field) or [] if v not in removes]
+            values += [v for v in change.get('adds') or [] if v not in values]
+            doc[field] = values
+        else:
+            doc[field] = change.get('new')
+
+
+def _sync_labels(doc: Dict[str, Any], references: Dict[Any, Dict[str, Any]]) -> None:
+    """Rebuild a story's ``labels`` after its ``label_ids`` changed."""
+    known = {label.get('id'): label for label in doc.get('labels') or []}
+    labels = []
+    for label_id in doc.get('label_ids') or []:
+        label = known.get(label_id)
+        if label is None and label_id in references:
+            label = {'id': label_id, 'name': references[label_id].get('name'), 'entity_type': 'label'}
+        if label is not None:
+            labels.append(label)
+    doc['labels'] = labels
+
+
+def _is_older(changed_at: Optional[str], doc: Dict[str, Any]) -> bool:
+    """Whether an event predates what the mirror already holds (late delivery)."""
+    return bool(changed_at and doc.get('updated_at') and changed_at < doc['updated_at'])
+
+
+class WebhookReceiver:
+    """Applies events to the store from ``open_store`` and to a reference cache.
+
+    The store is opened per event, so the receiver can be driven from any
+    thread (SQLite connections are per thread); events are applied one at
+    a time.
+    """
+
+    def __init__(self, open_store: Callable[[], Any], cache=None, secret: Optional[str] = None):
+        self.open_store = open_store
+        self.cache = cache
+        self.secret = secret
+        self.received = 0
+        self._lock = threading.Lock()
+
+    def receive(self, body: bytes, signature: Optional[str] = None) -> Tuple[int, Dict[str, Any]]:
+        """Verify and apply one request body; returns an HTTP status and a JSON reply."""
+        if self.secret is not None and not verify_signature(body, signature, self.secret):
+            return 401, {'error': 'bad signature'}
+        try:
+            event = json.loads(body)
+        except ValueError:
+            return 400, {'error': 'body is not JSON'}
+        if not isinstance(event, dict) or not isinstance(event.get('actions'), list):
+            return 400, {'error': 'not a webhook event'}
+        with self._lock:
+            results = self.apply(event)
+            self.received += 1
+        return 200, {'applied': results}
+
+    def apply(self, event: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Apply every action of an event; one result per action."""
+        references = {ref.get('id'): ref for ref in event.get('references') or [] if isinstance(ref, dict)}
+        changed_at = event.get('changed_at')
+        store = self.open_store()
+        try:
+            return [self._apply_action(store, action, references, changed_at)
+                    for action in event['actions'] if isinstance(action, dict)]
+        finally:
+            store.close()
+
+    def _apply_action(self, store, action: Dict[str, Any], references: Dict[Any, Dict[str, Any]],
+                      changed_at: Optional[str]) -> Dict[str, Any]:
+        entity_type = action.get('entity_type')
+        verb = action.get('action')
+        entity_id = action.get('id')
+        result = {'entity_type': entity_type, 'action': verb, 'id': entity_id, 'outcome': 'ignored'}
+        if entity_id is None:
+            return result
+
+        if entity_type in STORE_ENTITIES:
+            result['outcome'] = self._apply_to_store(store, entity_type, verb, action, references, changed_at)
+        if entity_type in CACHED_COLLECTIONS:
+            cached = self._apply_to_cache(CACHED_COLLECTIONS[entity_type], verb, entity_id,
+                                          action.get('changes') or {}, changed_at)
+            if cached and result['outcome'] == 'ignored':
+                result['outcome'] = 'cached'
+        return result
+
+    def _apply_to_store(self, store, entity_type: str, verb: str, action: Dict[str, Any],
+                        references: Dict[Any, Dict[str, Any]], changed_at: Optional[str]) -> str:
+        table, upsert, read = STORE_ENTITIES[entity_type]
+        entity_id = action['id']
+        if verb == 'delete':
+            store.delete(table, entity_id)
+            return 'deleted'
+
+        doc = getattr(store, read)(entity_id)
+        if verb == 'create':
+            # The event carries the fields set at creation; keep anything synced since
+            fields = {k: v for k, v in action.items() if k not in ('action', 'changes')}
+            if doc is None:
+                doc = dict(copy_json(STORY_DEFAULTS), created_at=changed_at) if entity_type == 'story' else {}
+            doc.update(fields)
+            if entity_type == 'story' and 'label_ids' in fields:
+                _sync_labels(doc, references)
+        elif verb == 'update':
+            if doc is None:
+                return 'skipped'
+            if _is_older(changed_at, doc):
+                return 'stale'
+            changes = action.get('changes') or {}
+            apply_changes(doc, changes)
+            if 'name' in action:
+                doc['name'] = action['name']
+            if entity_type == 'story' and 'label_ids' in changes:
+                _sync_labels(doc, references)
+        else:
+            return 'ignored'
+
+        if changed_at:
+            doc['updated_at'] = changed_at
+        getattr(store, upsert)([doc])
+        return 'applied'
+
+    def _apply_to_cache(self, collection: str, verb: str, entity_id: Any,
+                        changes: Dict[str, Any], changed_at: Optional[str]) -> bool:
+        """Patch or drop a cached collection; returns whether it held anything to change."""
+        if self.cache is None:
+            return False
+        items = self.cache.get(collection)
+        if not isinstance(items, list):
+            return False  # missing or stale: the next read fetches it anyway
+
+        if collection not in PATCHED_COLLECTIONS:
+            self.cache.invalidate(collection)
+            return True
+        if verb == 'delete':
+            self.cache.replace(collection, [i for i in items if i.get('id') != entity_id])
+            return True
+        item = next((i for i in items if i.get('id') == entity_id), None)
+        # A created entity, or a change to a field the list response lacks, needs
+        # the full object the API would return: refetch the collection instead
+        if verb != 'update' or item is None or any(field not in item for field in changes):
+            self.cache.invalidate(collection)
+            return True
+        apply_changes(item, changes)
+        if changed_at and 'updated_at' in item:
+            item['updated_at'] = changed_at
+        self.cache.replace(collection, items)
+        return True
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = 'sc-listen'
+
+    def do_POST(self):
+        try:
+            length = int(self.headers.get('Content-Length'))
+        except (TypeError, ValueError):
+            length = -1
+        if not 0 <= length <= MAX_BODY:
+            self._reply(400, {'error': f'Content-Length must be 0 to {MAX_BODY}'})
+            return
+        body = self.rfile.read(length)
+        status, reply = self.server.receiver.receive(body, self.headers.get(SIGNATURE_HEADER))
+        self._reply(status, reply)
+        if self.server.on_event is not None:
+            self.server.on_event(status, reply)
+
+    def do_GET(self):
+        self._reply(200, {'received': self.server.receiver.received})
+
+    def _reply(self, status: int, payload: Dict[str, Any]) -> None:
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # on_event reports each event instead
+
+
+def make_server(receiver: WebhookReceiver, host: str = '127.0.0.1', port: int = 0,
+                on_event: Optional[Callable[[int, Dict[str, Any]], None]] = None) -> HTTPServer:
+    """HTTP server that feeds POSTed events to ``receiver`` (port 0 picks a free one)."""
+    server = HTTPServer((host, port), _Handler)
+    server.receiver = receiver
+    server.on_event = on_event
+    return server
@@ -1,12 +1,34 @@
+import os
+import sys
 import click
-from sc.commands.teams import team
-from sc.commands.iteration import iteration
-from sc.commands.search import search
-from sc.commands.story import story
-
-@click.group()
-@click.version_option()
-def cli():
+from sc import __version__
+from sc.lazy import LazyGroup
+
+# Command groups, imported only when dispatched. The help text is what
+# `sc --help` shows, so it must match each group's docstring summary.
+COMMANDS = {
+    'team': ('sc.commands.teams:team', 'Manage teams in Shortcut.'),
+    'iteration': ('sc.commands.iteration:iteration', 'Manage iterations in Shortcut.'),
+    'search': ('sc.commands.search:search', 'Search across Shortcut resources.'),
+    'story': ('sc.commands.story:story', 'Manage stories in Shortcut.'),
+    'cache': ('sc.commands.cache:cache', 'Manage the local cache of workspace reference data.'),
+    'sync': ('sc.commands.sync:sync', 'Sync stories, epics and iterations into the local mirror.'),
+    'listen': ('sc.commands.listen:listen', 'Apply Shortcut webhook events to the local cache and mirror.'),
+    'daemon': ('sc.commands.daemon:daemon', 'Run commands through a long-lived process with a warm client.'),
+}
+
+@click.group(cls=LazyGroup, lazy_subcommands=COMMANDS)
+@click.version_option(__version__, prog_name='sc')
+@click.option('--no-cache', is_flag=True, envvar='SC_NO_CACHE',
+              help='Bypass the local reference-data cache for this run.')
+@click.option('--debug', is_flag=True, envvar='SC_DEBUG',
+              help='Report rate-limit waits, 429 retries and limiter state on stderr.')
+@click.option('--trace', '--profile', 'trace', is_flag=True, envvar='SC_TRACE',
+              help='Time every request and the decode, model and render phases; summary on stderr.')
+@click.option('--trace-file', type=click.Path(dir_okay=False, writable=True),
+              help='Also write a Chrome trace JSON file (implies --trace).')
+@click.pass_context
+def cli(ctx, no_cache, debug, trace, trace_file):
     """SC - Shortcut Command Line Interface.
 
     A command-line tool for interacting with Shortcut project management.
@@ -15,13 +37,27 @@ def cli():
     - Set SHORTCUT_API_TOKEN environment variable, or
     - Save your token in ~/.config/shortcut/config.yml
     """
-    pass
+    # Imported here: it pulls in requests and the API client
+    from sc.utils.client import configure_client, report_limiter, report_trace, start_trace
 
-# Add command groups
-cli.add_command(team)
-cli.add_command(iteration)
-cli.add_command(search)
-cli.add_command(story)
+    configure_client(use_cache=not no_cache, debug=debug)
+    if debug:
+        ctx.call_on_close(report_limiter)
+    if trace or trace_file:
+        start_trace()
+        ctx.call_on_close(lambda: report_trace(trace_file))
 
-if __name__ == '__main__':
+
+def main():
+    """Console entry point: forward to `sc daemon` when one is running."""
+    if not os.environ.get('SC_NO_DAEMON'):
+        from sc.daemon import forward
+
+        code = forward(sys.argv[1:])
+        if code is not None:
+            sys.exit(code)
     cli()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""Reference-data cache commands for Shortcut CLI."""
+
+import click
+from rich.console import Console
+from rich.table import Table
+from sc.api.cache import DEFAULT_TTLS, record_count
+from sc.utils import get_client
+
+console = Console()
+
+
+def _format_age(seconds):
+    if seconds is None:
+        return "-"
+    if seconds < 60:
+        return f"{int(seconds)}s"
+    if seconds < 3600:
+        return f"{int(seconds // 60)}m"
+    return f"{seconds / 3600:.1f}h"
+
+
+def _cached_client():
+    client = get_client()
+    if client.cache is None:
+        console.print("[yellow]Cache is disabled (--no-cache)[/yellow]")
+        return None
+    return client
+
+
+@click.group()
+def cache():
+    """Manage the local cache of workspace reference data."""
+    pass
+
+
+@cache.command()
+def status():
+    """Show what is cached and how fresh it is."""
+    client = _cached_client()
+    if not client:
+        return
+
+    table = Table(title=f"Cache: {client.cache.directory}")
+    table.add_column("Collection", style="cyan")
+    table.add_column("Items", justify="right")
+    table.add_column("Age", justify="right")
+    table.add_column("TTL", justify="right")
+    table.add_column("Fresh")
+
+    for row in client.cache.status():
+        table.add_row(
+            row['name'],
+            str(row['count']) if row['age'] is not None else "-",
+            _format_age(row['age']),
+            _format_age(row['ttl']),
+            "[green]yes[/green]" if row['fresh'] else "[yellow]no[/yellow]"
+        )
+
+    console.print(table)
+
+
+@cache.command()
+@click.argument('names', nargs=-1, type=click.Choice(sorted(DEFAULT_TTLS)))
+def refresh(names):
+    """Re-fetch cached collections now (all of them by default)."""
+    client = _cached_client()
+    if not client:
+        return
+
+    for name in names or client.cache.names:
+        try:
+            data = client.fetch_reference(name)
+        except Exception as e:
+            console.print(f"[red]Error refreshing {name}: {str(e)}[/red]")
+            continue
+        console.print(f"[green]✓ Refreshed {name} ({record_count(data)} items)[/green]")
+
+
+@cache.command()
+def clear():
+    """Delete all cached reference data."""
+    client = _cached_client()
+    if not client:
+        return
+
+    client.cache.invalidate()
+    console.print(f"[green]✓ Cleared cache in {client.cache.directory}[/green]")
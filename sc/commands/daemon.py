@@ -0,0 +1,63 @@
+"""Long-lived daemon commands for Shortcut CLI."""
+
+import os
+import click
+from rich.console import Console
+from sc.daemon import Daemon, control, socket_path
+
+console = Console()
+
+
+@click.group()
+def daemon():
+    """Run commands through a long-lived process with a warm client."""
+    pass
+
+
+@daemon.command()
+@click.option('--idle-timeout', type=int, default=3600, show_default=True,
+              help='Exit after this many seconds without a command (0 to never exit)')
+def start(idle_timeout):
+    """Start the daemon in the foreground (Ctrl-C to stop).
+
+    While it runs, other `sc` invocations are forwarded to it over a Unix
+    socket and reuse its API client, connection pool and reference data.
+    Set SC_NO_DAEMON=1 to run a command in-process anyway.
+    """
+    path = socket_path()
+    running = control('status', path)
+    if running is not None:
+        console.print(f"[yellow]A daemon is already running (pid {running['pid']})[/yellow]")
+        return
+
+    server = Daemon(path, idle_timeout=idle_timeout)
+    server.warm()
+    console.print(f"[green]sc daemon listening on {path}[/green] (pid {os.getpid()})")
+    try:
+        server.serve()
+    except KeyboardInterrupt:
+        pass
+    console.print(f"sc daemon stopped after {server.served} command(s)")
+
+
+@daemon.command()
+def status():
+    """Show whether a daemon is running and what it has served."""
+    state = control('status')
+    if state is None:
+        console.print("No daemon running; commands run in-process")
+        return
+    console.print(f"[bold]Daemon:[/bold] pid {state['pid']} on {state['socket']}")
+    console.print(f"[bold]Uptime:[/bold] {state['uptime']:.0f}s, idle {state['idle']:.0f}s")
+    console.print(f"[bold]Commands served:[/bold] {state['served']}"
+                  + (" [yellow](busy)[/yellow]" if state['busy'] else ""))
+
+
+@daemon.command()
+def stop():
+    """Stop the running daemon."""
+    state = control('stop')
+    if state is None:
+        console.print("[yellow]No daemon running[/yellow]")
+        return
+    console.print(f"[green]Stopped daemon (pid {state['pid']})[/green]")
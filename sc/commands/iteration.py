@@ -1,23 +1,37 @@
 import click
-from datetime import datetime
+from types import SimpleNamespace
 from rich.console import Console
 from rich.table import Table
-from sc.utils import get_client
+from sc.api.pagination import iter_search_stories
+from sc.api.records import StorySlim
+from sc.formatters import emit_rows, emit_stories, format_option, story_detail, story_fields_option
+from sc.utils import get_client, get_store
+from sc.utils.common import format_date, get_workflow_index
+from sc.utils.resolver import EntityResolver
+from sc.utils.stats import StoryStats
+from sc.utils.velocity import VelocityTable, load_iteration_facts, percentile, rolling_mean
 
 console = Console()
 
 
 
 
+def _story_count(i) -> int:
+    """Stories in an iteration, from its stats."""
+    if not i.stats:
+        return 0
+    return i.stats['num_stories_done'] + i.stats['num_stories_started'] + i.stats['num_stories_unstarted']
+
+
 @click.group()
 def iteration():
     """Manage iterations in Shortcut."""
     pass
 
 
-@iteration.command()
+@iteration.command('list')
 @click.option('--include-archived', is_flag=True, help='Include archived iterations')
-def list(include_archived):
+def list_iterations(include_archived):
     """List all iterations."""
     client = get_client()
     try:
@@ -32,7 +46,7 @@ def list(include_archived):
         iterations = [i for i in iterations if i.status != 'done']
     
     # Sort by start date
-    iterations.sort(key=lambda x: x.start_date if x.start_date else datetime.min.isoformat())
+    iterations.sort(key=lambda x: format_date(x.start_date, ''))
     
     table = Table(title="Iterations")
     table.add_column("ID", style="cyan")
@@ -53,9 +67,9 @@ def list(include_archived):
             str(i.id),
             i.name,
             f"[{status_color}]{i.status}[/{status_color}]",
-            i.start_date[:10] if i.start_date else "-",
-            i.end_date[:10] if i.end_date else "-",
-            str(i.stats['num_stories_done'] + i.stats['num_stories_started'] + i.stats['num_stories_unstarted']) if i.stats else "0"
+            format_date(i.start_date),
+            format_date(i.end_date),
+            str(_story_count(i))
         )
     
     console.print(table)
@@ -80,10 +94,10 @@ def current():
     console.print(f"\n[bold]Current Iteration: {current_iter.name}[/bold]")
     console.print(f"ID: [cyan]{current_iter.id}[/cyan]")
     console.print(f"Status: [green]{current_iter.status}[/green]")
-    console.print(f"Start Date: {current_iter.start_date[:10] if current_iter.start_date else 'Not set'}")
-    console.print(f"End Date: {current_iter.end_date[:10] if current_iter.end_date else 'Not set'}")
-    console.print(f"Stories: {len(current_iter.story_ids)}")
-    if current_iter.description:
+    console.print(f"Start Date: {format_date(current_iter.start_date, 'Not set')}")
+    console.print(f"End Date: {format_date(current_iter.end_date, 'Not set')}")
+    console.print(f"Stories: {_story_count(current_iter)}")
+    if getattr(current_iter, 'description', None):  # not in list responses
         console.print(f"Description: {current_iter.description}")
 
 
@@ -105,10 +119,10 @@ def next():
     console.print(f"\n[bold]Next Iteration: {next_iter.name}[/bold]")
     console.print(f"ID: [cyan]{next_iter.id}[/cyan]")
     console.print(f"Status: [yellow]{next_iter.status}[/yellow]")
-    console.print(f"Start Date: {next_iter.start_date[:10] if next_iter.start_date else 'Not set'}")
-    console.print(f"End Date: {next_iter.end_date[:10] if next_iter.end_date else 'Not set'}")
-    console.print(f"Stories: {len(next_iter.story_ids)}")
-    if next_iter.description:
+    console.print(f"Start Date: {format_date(next_iter.start_date, 'Not set')}")
+    console.print(f"End Date: {format_date(next_iter.end_date, 'Not set')}")
+    console.print(f"Stories: {_story_count(next_iter)}")
+    if getattr(next_iter, 'description', None):  # not in list responses
         console.print(f"Description: {next_iter.description}")
 
 
@@ -133,9 +147,9 @@ def view(iteration_id):
     console.print(f"\n[bold]Iteration: {i.name}[/bold]")
     console.print(f"ID: [cyan]{i.id}[/cyan]")
     console.print(f"Status: [{status_color}]{i.status}[/{status_color}]")
-    console.print(f"Start Date: {i.start_date[:10] if i.start_date else 'Not set'}")
-    console.print(f"End Date: {i.end_date[:10] if i.end_date else 'Not set'}")
-    console.print(f"Stories: {i.stats['num_stories_done'] + i.stats['num_stories_started'] + i.stats['num_stories_unstarted'] if i.stats else 0}")
+    console.print(f"Start Date: {format_date(i.start_date, 'Not set')}")
+    console.print(f"End Date: {format_date(i.end_date, 'Not set')}")
+    console.print(f"Stories: {_story_count(i)}")
     console.print(f"Entity Type: {i.entity_type}")
     if i.description:
         console.print(f"Description: {i.description}")
@@ -144,9 +158,18 @@ def view(iteration_id):
 @iteration.command()
 @click.argument('iteration_id', type=int)
 @click.option('--limit', '-l', default=20, help='Limit number of stories')
-def stories(iteration_id, limit):
+@format_option
+@story_fields_option
+def stories(iteration_id, limit, output_format, fields):
     """List stories in an iteration."""
     client = get_client()
+    
+    if fields or output_format != 'table':
+        stories = iter_search_stories(client, f"iteration:{iteration_id}", limit=limit,
+                                      **story_detail(fields))
+        emit_stories(client, stories, output_format, fields, title=f"Stories in iteration {iteration_id}")
+        return
+    
     try:
         i = client.get_iteration(iteration_id)
     except Exception as e:
@@ -155,12 +178,8 @@ def stories(iteration_id, limit):
         return
     
     # Search for stories in this iteration
-    from useshortcut.models import SearchInputs
-    search_params = SearchInputs(query=f"iteration:{iteration_id}", page_size=limit)
     try:
-        search_results = client.search_stories(search_params)
-        stories = search_results.data if hasattr(search_results, 'data') else search_results
-        stories = stories[:limit] if isinstance(stories, list) else []
+        stories = list(iter_search_stories(client, f"iteration:{iteration_id}", limit=limit))
     except Exception as e:
         console.print(f"[red]Error searching stories: {str(e)}[/red]")
         return
@@ -175,25 +194,15 @@ def stories(iteration_id, limit):
     table.add_column("Estimate")
     table.add_column("Owner")
     
-    workflows = client.list_workflows()
+    workflow_index = get_workflow_index(client)
+    resolver = EntityResolver(client)
+    resolver.collect(stories, kinds=('member',))
+    resolver.resolve()
     
     for story in stories:
-        owner_ids = story.owner_ids
-        owner_name = "Unassigned"
-        if owner_ids:
-            try:
-                owner = client.get_member(owner_ids[0])
-                owner_name = owner.profile.name
-            except:
-                owner_name = owner_ids[0]
+        owner_name = resolver.owner_name(story)
         
-        # Get workflow state name
-        state_name = "Unknown"
-        for workflow in workflows:
-            for state in workflow.states:
-                if state.id == story.workflow_state_id:
-                    state_name = state.name
-                    break
+        state_name = workflow_index.state_name(story.workflow_state_id, "Unknown")
         
         table.add_row(
             str(story.id),
@@ -209,68 +218,164 @@ def stories(iteration_id, limit):
 
 @iteration.command()
 @click.argument('iteration_id', type=int)
-def stats(iteration_id):
-    """Show statistics for an iteration."""
+@click.option('--local', is_flag=True, help='Compute from the local mirror (see `sc sync`)')
+def stats(iteration_id, local):
+    """Show statistics for an iteration.
+
+    Every story in the iteration comes from the iteration's own story
+    list, which unlike search has no 1000-result cap, and is streamed
+    through a running aggregator, so the numbers are exact for iterations
+    of any size.
+    """
     client = get_client()
-    try:
-        i = client.get_iteration(iteration_id)
-    except Exception as e:
-        console.print(f"[red]Error: Could not find iteration with ID '{iteration_id}'[/red]")
-        console.print(f"[dim]Details: {str(e)}[/dim]")
-        return
-    
-    # Search for all stories in this iteration
-    from useshortcut.models import SearchInputs
-    search_params = SearchInputs(query=f"iteration:{iteration_id}", page_size=100)
-    try:
-        search_results = client.search_stories(search_params)
-        stories = search_results.data if hasattr(search_results, 'data') else search_results
-        stories = stories if isinstance(stories, list) else []
-    except Exception as e:
-        console.print(f"[red]Error searching stories: {str(e)}[/red]")
-        return
-    
-    # Get done states
-    workflows = client.list_workflows()
-    done_state_ids = []
-    for workflow in workflows:
-        for state in workflow.states:
-            if state.type == "done":
-                done_state_ids.append(state.id)
-    
-    completed_stories = [s for s in stories if s.workflow_state_id in done_state_ids]
-    total_points = sum(s.estimate or 0 for s in stories)
-    completed_points = sum(s.estimate or 0 for s in completed_stories)
+    workflow_index = get_workflow_index(client)
+    totals = StoryStats(workflow_index)
+    if local:
+        store = get_store()
+        try:
+            data = store.get_iteration(iteration_id)
+            if data is not None:
+                totals.consume(SimpleNamespace(**s) for s in
+                               store.search_stories(iteration_ids=[iteration_id], include_archived=True))
+        finally:
+            store.close()
+        if data is None:
+            console.print(f"[red]Error: Iteration '{iteration_id}' is not in the local mirror (run `sc sync`)[/red]")
+            return
+        i = SimpleNamespace(**data)
+    else:
+        try:
+            i = client.get_iteration(iteration_id)
+        except Exception as e:
+            console.print(f"[red]Error: Could not find iteration with ID '{iteration_id}'[/red]")
+            console.print(f"[dim]Details: {str(e)}[/dim]")
+            return
+        
+        # Aggregate every story in the iteration, decoding one at a time
+        try:
+            stories = client._make_request('GET', f'/iterations/{iteration_id}/stories')
+            totals.consume(StorySlim.from_dict(s) for s in stories)
+        except Exception as e:
+            console.print(f"[red]Error searching stories: {str(e)}[/red]")
+            return
     
     console.print(f"\n[bold]Statistics for {i.name}:[/bold]")
     console.print(f"Status: {i.status}")
-    console.print(f"Total Stories: {len(stories)}")
-    console.print(f"Completed Stories: {len(completed_stories)}")
-    console.print(f"Completion Rate: {len(completed_stories)/len(stories)*100:.1f}%" if stories else "N/A")
-    console.print(f"Total Points: {total_points}")
-    console.print(f"Completed Points: {completed_points}")
-    console.print(f"Points Completion Rate: {completed_points/total_points*100:.1f}%" if total_points > 0 else "N/A")
+    console.print(f"Total Stories: {totals.total}")
+    console.print(f"Completed Stories: {totals.completed}")
+    console.print(f"Completion Rate: {totals.completed/totals.total*100:.1f}%" if totals.total else "N/A")
+    console.print(f"Total Points: {totals.points}")
+    console.print(f"Completed Points: {totals.completed_points}")
+    console.print(f"Points Completion Rate: {totals.completed_points/totals.points*100:.1f}%" if totals.points > 0 else "N/A")
     
     # Story type breakdown
-    story_types = {}
-    for story in stories:
-        story_types[story.story_type] = story_types.get(story.story_type, 0) + 1
-    
     console.print("\n[bold]Story Type Breakdown:[/bold]")
-    for story_type, count in story_types.items():
+    for story_type, count in totals.by_type.items():
         console.print(f"  {story_type}: {count}")
     
     # State breakdown
-    state_counts = {}
-    for story in stories:
-        state_name = "Unknown"
-        for workflow in workflows:
-            for state in workflow.states:
-                if state.id == story.workflow_state_id:
-                    state_name = state.name
-                    break
-        state_counts[state_name] = state_counts.get(state_name, 0) + 1
-    
     console.print("\n[bold]State Breakdown:[/bold]")
-    for state, count in state_counts.items():
-        console.print(f"  {state}: {count}")
\ No newline at end of file
+    for state, count in totals.by_state().items():
+        console.print(f"  {state}: {count}")
+
+
+VELOCITY_COLUMNS = ['iteration_id', 'name', 'status', 'end_date', 'committed', 'completed',
+                    'carry_over', 'carried_in', 'stories_done', 'rolling_mean']
+
+
+def _points(value) -> str:
+    return "-" if value is None else f"{value:g}" if float(value).is_integer() else f"{value:.1f}"
+
+
+@iteration.command()
+@click.option('--last', '-n', default=10, show_default=True, help='Number of most recent iterations')
+@click.option('--window', default=3, show_default=True, help='Iterations in the rolling mean')
+@format_option
+def velocity(last, window, output_format):
+    """Show velocity and throughput across recent iterations.
+
+    Stories for every iteration are fetched concurrently. Finished
+    iterations never change, so their numbers are kept in the local store
+    and later runs only fetch the ones still in progress.
+    """
+    client = get_client()
+    try:
+        iterations = [i for i in client.list_iterations() if i.status in ('started', 'done')]
+    except Exception as e:
+        console.print(f"[red]Error listing iterations: {str(e)}[/red]")
+        return
+    iterations.sort(key=lambda x: format_date(x.end_date, ''))
+    iterations = iterations[-last:] if last > 0 else []
+    if not iterations:
+        console.print("[yellow]No started or finished iterations found[/yellow]")
+        return
+
+    store = get_store()
+    try:
+        facts, cached = load_iteration_facts(client, store, iterations)
+    except Exception as e:
+        console.print(f"[red]Error fetching iteration stories: {str(e)}[/red]")
+        return
+    finally:
+        store.close()
+
+    table = VelocityTable(iterations, facts)
+    totals = table.per_iteration()
+    means = rolling_mean(totals['completed'], window)
+
+    rows = [
+        {
+            'iteration_id': it.id,
+            'name': it.name,
+            'status': it.status,
+            'end_date': format_date(it.end_date, None),
+            **{key: values[n] for key, values in totals.items()},
+            'rolling_mean': means[n],
+        }
+        for n, it in enumerate(iterations)
+    ]
+    if output_format != 'table':
+        emit_rows(rows, output_format, VELOCITY_COLUMNS, error="Error computing velocity")
+        return
+
+    velocity_table = Table(title=f"Velocity, last {len(iterations)} iterations")
+    velocity_table.add_column("Iteration", style="green")
+    velocity_table.add_column("End Date")
+    velocity_table.add_column("Committed", justify="right")
+    velocity_table.add_column("Completed", justify="right")
+    velocity_table.add_column("Carry-over", justify="right")
+    velocity_table.add_column("Carried in", justify="right")
+    velocity_table.add_column("Stories Done", justify="right")
+    velocity_table.add_column(f"Mean ({window})", justify="right")
+    for row in rows:
+        velocity_table.add_row(
+            row['name'] if row['status'] == 'done' else f"{row['name']} [dim](in progress)[/dim]",
+            row['end_date'] or "-",
+            _points(row['committed']),
+            _points(row['completed']),
+            _points(row['carry_over']),
+            _points(row['carried_in']),
+            _points(row['stories_done']),
+            _points(row['rolling_mean']),
+        )
+    console.print(velocity_table)
+
+    done = [r['completed'] for r in rows if r['status'] == 'done']
+    if done:
+        console.print(f"Completed points per finished iteration: "
+                      f"mean {_points(sum(done) / len(done))}, "
+                      f"p50 {_points(percentile(done, 50))}, p90 {_points(percentile(done, 90))}")
+
+    resolver = EntityResolver(client)
+    for by, title, label in (('type', "Throughput by Type", lambda t: t or "-"),
+                             ('team', "Throughput by Team", lambda g: resolver.name('group', g, "No team"))):
+        throughput = Table(title=title)
+        throughput.add_column(by.title(), style="green")
+        throughput.add_column("Stories Done", justify="right")
+        throughput.add_column("Points Done", justify="right")
+        for key, stories_done, points_done in table.throughput(by):
+            throughput.add_row(label(key), _points(stories_done), _points(points_done))
+        console.print(throughput)
+
+    if cached:
+        console.print(f"[dim]{cached} finished iteration(s) read from the local cache[/dim]")
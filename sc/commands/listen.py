@@ -0,0 +1,59 @@
+"""Webhook receiver command for Shortcut CLI."""
+
+import click
+from rich.console import Console
+from sc.api.webhook import WebhookReceiver, make_server
+from sc.utils import get_client, get_store
+from sc.config import get_config
+
+console = Console()
+
+
+def _report(status, reply):
+    if status != 200:
+        console.print(f"[red]Rejected event ({status}): {reply['error']}[/red]")
+        return
+    for result in reply['applied']:
+        style = 'green' if result['outcome'] in ('applied', 'deleted', 'cached') else 'dim'
+        console.print(f"[{style}]{result['action']} {result['entity_type']} {result['id']}: "
+                      f"{result['outcome']}[/{style}]")
+
+
+@click.command()
+@click.option('--port', type=int, default=8080, show_default=True, help='Port to listen on')
+@click.option('--host', default='127.0.0.1', show_default=True,
+              help='Address to bind (put a tunnel or reverse proxy in front for Shortcut to reach it)')
+@click.option('--secret', help='Webhook secret (default: SHORTCUT_WEBHOOK_SECRET or webhook.secret in config)')
+@click.option('--insecure', is_flag=True, help='Accept unsigned payloads when no secret is set')
+def listen(port, host, secret, insecure):
+    """Apply Shortcut webhook events to the local cache and mirror.
+
+    Register the receiver's public URL as an outgoing webhook in Shortcut
+    (Settings > Integrations > Webhooks, or POST /api/v3/integrations/webhook).
+    Story, epic and iteration changes are then written to the local mirror
+    and reference cache as they happen, so cached and --local reads stay
+    current without polling. Recorded payloads can be replayed by POSTing
+    them with a Payload-Signature header (see sc.api.webhook.sign).
+    """
+    secret = secret or get_config().get_webhook_secret()
+    if secret is None and not insecure:
+        console.print("[red]Error: No webhook secret set.[/red]")
+        console.print("Pass --secret, set SHORTCUT_WEBHOOK_SECRET, or use --insecure to accept unsigned payloads")
+        return
+
+    receiver = WebhookReceiver(get_store, cache=get_client().cache, secret=secret)
+    try:
+        server = make_server(receiver, host, port, on_event=_report)
+    except OSError as e:
+        console.print(f"[red]Error: Could not listen on {host}:{port}: {str(e)}[/red]")
+        return
+
+    console.print(f"[green]Listening for Shortcut webhooks on http://{host}:{server.server_port}/[/green]")
+    if secret is None:
+        console.print("[yellow]Warning: payload signatures are not checked[/yellow]")
+    try:
+        with server:
+            server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    console.print(f"Stopped after {receiver.received} event(s)")
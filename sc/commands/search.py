@@ -1,12 +1,21 @@
 import click
-from useshortcut.models import SearchInputs
+from concurrent.futures import ThreadPoolExecutor
 from rich.console import Console
+from rich.markup import escape
 from rich.table import Table
-from sc.utils import get_client
+from sc.api.pagination import iter_search_stories, iter_search_epics
+from sc.formatters import (
+    EPIC_COLUMNS, emit_rows, emit_stories, epic_rows, format_option, story_detail, story_fields_option,
+)
+from sc.api.store import MATCH_START, MATCH_END
+from sc.utils import get_client, get_store
+from sc.utils.common import get_workflow_index
+from sc.utils.resolver import EntityResolver
 
 console = Console()
 
-
+# Columns of `search all` in machine formats: one row per hit, any type
+SEARCH_COLUMNS = ['type', 'id', 'name', 'state', 'app_url']
 
 
 @click.group()
@@ -15,119 +24,227 @@ def search():
     pass
 
 
+def _highlight(snippet):
+    """Escape a full-text snippet and bold its matched terms."""
+    return escape(snippet).replace(MATCH_START, "[bold]").replace(MATCH_END, "[/bold]")
+
+
+def _search_offline(query, limit):
+    """Ranked full-text search over the local mirror (see `sc sync`)."""
+    store = get_store()
+    try:
+        sections = [
+            ("[bold green]Stories:[/bold green]", store.search_text(query, 'story', limit),
+             lambda s: s.get('story_type') or ""),
+            ("[bold blue]Epics:[/bold blue]", store.search_text(query, 'epic', limit),
+             lambda e: e.get('state') or ""),
+            ("[bold yellow]Iterations:[/bold yellow]", store.search_text(query, 'iteration', limit),
+             lambda i: i.get('status') or ""),
+        ]
+    finally:
+        store.close()
+    
+    if not any(results for _, results, _ in sections):
+        console.print("[yellow]No matches in the local mirror (run `sc sync` to update it)[/yellow]")
+        return
+    
+    for heading, results, kind_column in sections:
+        if not results:
+            continue
+        console.print(heading)
+        table = Table()
+        table.add_column("ID", style="cyan")
+        table.add_column("Name", style="green")
+        table.add_column("Type")
+        table.add_column("Match")
+        for doc in results:
+            name = doc['name']
+            table.add_row(
+                str(doc['id']),
+                escape(name[:60] + "..." if len(name) > 60 else name),
+                kind_column(doc),
+                _highlight(doc['_snippet'])
+            )
+        console.print(table)
+        console.print()
+
+
 @search.command(name='all')
 @click.argument('query')
 @click.option('--limit', '-l', default=10, help='Limit results per type')
-def search_all(query, limit):
+@click.option('--offline', is_flag=True, help='Search the local mirror\'s full-text index (see `sc sync`)')
+@format_option
+@click.pass_context
+def search_all(ctx, query, limit, offline, output_format):
     """Global search across all resources."""
+    if output_format != 'table':
+        failed = []
+        rows = _offline_rows(query, limit) if offline else _search_rows(get_client(), query, limit, failed)
+        emit_rows(rows, output_format, SEARCH_COLUMNS, error="Error searching")
+        if failed:
+            ctx.exit(1)
+        return
+    
+    if offline:
+        console.print(f"\n[bold]Searching local mirror for: '{escape(query)}'[/bold]\n")
+        try:
+            _search_offline(query, limit)
+        except Exception as e:
+            console.print(f"[red]Error searching local mirror: {e}[/red]")
+        return
+    
     client = get_client()
     
     console.print(f"\n[bold]Searching for: '{query}'[/bold]\n")
     
-    # Search stories
-    try:
-        search_params = SearchInputs(query=query, page_size=limit)
+    # The searches are independent, so run them side by side and print
+    # each section, in order, as soon as its own result is in.
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        workflow_index = pool.submit(get_workflow_index, client)
+        stories = pool.submit(lambda: list(iter_search_stories(client, query, limit=limit)))
+        epics = pool.submit(lambda: list(iter_search_epics(client, query, limit=limit)))
+        iterations = pool.submit(client.list_iterations)
+        
         try:
-            search_results = client.search_stories(search_params)
-            stories = search_results.data if hasattr(search_results, 'data') else search_results
-            stories = stories[:limit] if isinstance(stories, list) else []
-        except TypeError as e:
-            # Fallback: use raw API if model parsing fails
-            import requests
-            headers = {'Shortcut-Token': client.api_token}
-            response = requests.get(f"{client.base_url}/search/stories", headers=headers, params={'query': query, 'page_size': limit})
-            if response.status_code == 200:
-                data = response.json()
-                stories = data.get('data', [])
-                # Convert raw dicts to objects with necessary attributes
-                from types import SimpleNamespace
-                stories = [SimpleNamespace(**s) for s in stories[:limit]]
-            else:
-                raise
-        if stories:
-            console.print("[bold green]Stories:[/bold green]")
-            table = Table()
-            table.add_column("ID", style="cyan")
-            table.add_column("Name", style="green")
-            table.add_column("Type")
-            table.add_column("State")
-            
-            workflows = client.list_workflows()
-            
-            for story in stories:
-                # Get workflow state name
-                state_name = "Unknown"
-                for workflow in workflows:
-                    for state in workflow.states:
-                        if state.id == story.workflow_state_id:
-                            state_name = state.name
-                            break
-                
-                table.add_row(
-                    str(story.id),
-                    story.name[:60] + "..." if len(story.name) > 60 else story.name,
-                    story.story_type,
-                    state_name
-                )
-            
-            console.print(table)
-            console.print()
-    except Exception as e:
-        console.print(f"[red]Error searching stories: {e}[/red]")
-    
-    # Search epics
+            _print_story_section(stories.result(), workflow_index)
+        except Exception as e:
+            console.print(f"[red]Error searching stories: {e}[/red]")
+        
+        try:
+            _print_epic_section(epics.result())
+        except Exception as e:
+            console.print(f"[red]Error searching epics: {e}[/red]")
+        
+        try:
+            query_lower = query.lower()
+            matching = [i for i in iterations.result() if query_lower in i.name.lower()][:limit]
+            _print_iteration_section(matching)
+        except Exception as e:
+            console.print(f"[red]Error searching iterations: {e}[/red]")
+
+
+def _search_rows(client, query, limit, failed):
+    """`search all` hits as records, stories then epics then iterations.
+
+    As in the table output, a section that fails is reported on stderr
+    and skipped, and the others are still written; its name is added to
+    ``failed``.
+    """
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        workflow_index = pool.submit(get_workflow_index, client)
+        stories = pool.submit(lambda: list(iter_search_stories(client, query, limit=limit)))
+        epics = pool.submit(lambda: list(iter_search_epics(client, query, limit=limit)))
+        iterations = pool.submit(client.list_iterations)
+        
+        def story_section():
+            return [{'type': 'story', 'id': story.id, 'name': story.name,
+                     'state': workflow_index.result().state_name(story.workflow_state_id),
+                     'app_url': getattr(story, 'app_url', None)} for story in stories.result()]
+        
+        def epic_section():
+            return [{'type': 'epic', **{c: row[c] for c in SEARCH_COLUMNS[1:]}}
+                    for row in epic_rows(epics.result())]
+        
+        def iteration_section():
+            query_lower = query.lower()
+            matching = [i for i in iterations.result() if query_lower in i.name.lower()][:limit]
+            return [{'type': 'iteration', 'id': i.id, 'name': i.name, 'state': i.status,
+                     'app_url': getattr(i, 'app_url', None)} for i in matching]
+        
+        for name, section in (('stories', story_section), ('epics', epic_section),
+                              ('iterations', iteration_section)):
+            try:
+                rows = section()
+            except Exception as e:
+                click.echo(f"Error searching {name}: {e}", err=True)
+                failed.append(name)
+                continue
+            yield from rows
+
+
+def _offline_rows(query, limit):
+    """`search all --offline` hits as records, in the same columns."""
+    store = get_store()
     try:
-        # Note: search_epics doesn't exist in the API, using general search instead
-        search_params = SearchInputs(query=f"{query} type:epic", page_size=limit)
-        search_results = client.search(search_params)
-        epics = [r for r in (search_results.data if hasattr(search_results, 'data') else search_results) if hasattr(r, 'epic_id')]
-        epics = epics[:limit]
-        if epics:
-            console.print("[bold blue]Epics:[/bold blue]")
-            table = Table()
-            table.add_column("ID", style="cyan")
-            table.add_column("Name", style="green")
-            table.add_column("State")
-            table.add_column("Stories")
-            
-            for epic in epics:
-                table.add_row(
-                    str(epic.id),
-                    epic.name[:60] + "..." if len(epic.name) > 60 else epic.name,
-                    epic.state,
-                    str(len(epic.story_ids))
-                )
-            
-            console.print(table)
-            console.print()
-    except Exception as e:
-        console.print(f"[red]Error searching epics: {e}[/red]")
+        for kind, state in (('story', None), ('epic', 'state'), ('iteration', 'status')):
+            for doc in store.search_text(query, kind, limit):
+                yield {'type': kind, 'id': doc['id'], 'name': doc['name'],
+                       'state': doc.get(state) if state else None, 'app_url': doc.get('app_url')}
+    finally:
+        store.close()
+
+
+def _print_story_section(stories, workflow_index):
+    if not stories:
+        return
+    workflow_index = workflow_index.result()
     
-    # Search iterations
-    try:
-        iterations = client.list_iterations()
-        matching_iterations = [i for i in iterations if query.lower() in i.name.lower()][:limit]
+    console.print("[bold green]Stories:[/bold green]")
+    table = Table()
+    table.add_column("ID", style="cyan")
+    table.add_column("Name", style="green")
+    table.add_column("Type")
+    table.add_column("State")
+    
+    for story in stories:
+        state_name = workflow_index.state_name(story.workflow_state_id, "Unknown")
         
-        if matching_iterations:
-            console.print("[bold yellow]Iterations:[/bold yellow]")
-            table = Table()
-            table.add_column("ID", style="cyan")
-            table.add_column("Name", style="green")
-            table.add_column("Status")
-            table.add_column("Stories")
-            
-            for i in matching_iterations:
-                table.add_row(
-                    str(i.id),
-                    i.name,
-                    i.status,
-                    str(len(i.story_ids))
-                )
-            
-            console.print(table)
-            console.print()
-    except Exception as e:
-        console.print(f"[red]Error searching iterations: {e}[/red]")
+        table.add_row(
+            str(story.id),
+            story.name[:60] + "..." if len(story.name) > 60 else story.name,
+            story.story_type,
+            state_name
+        )
+    
+    console.print(table)
+    console.print()
+
+
+def _print_epic_section(epics):
+    if not epics:
+        return
+    
+    console.print("[bold blue]Epics:[/bold blue]")
+    table = Table()
+    table.add_column("ID", style="cyan")
+    table.add_column("Name", style="green")
+    table.add_column("State")
+    table.add_column("Stories")
+    
+    for epic in epics:
+        stats = epic.stats or {}
+        table.add_row(
+            str(epic.id),
+            epic.name[:60] + "..." if len(epic.name) > 60 else epic.name,
+            epic.state,
+            str(stats.get('num_stories_total', "-"))
+        )
+    
+    console.print(table)
+    console.print()
+
+
+def _print_iteration_section(iterations):
+    if not iterations:
+        return
+    
+    console.print("[bold yellow]Iterations:[/bold yellow]")
+    table = Table()
+    table.add_column("ID", style="cyan")
+    table.add_column("Name", style="green")
+    table.add_column("Status")
+    table.add_column("Stories")
+    
+    for i in iterations:
+        table.add_row(
+            str(i.id),
+            i.name,
+            i.status,
+            str(i.stats['num_stories_done'] + i.stats['num_stories_started'] + i.stats['num_stories_unstarted']) if i.stats else "0"
+        )
+    
+    console.print(table)
+    console.print()
 
 
 @search.command()
@@ -135,7 +252,9 @@ def search_all(query, limit):
 @click.option('--limit', '-l', default=20, help='Limit number of results')
 @click.option('--type', '-t', help='Filter by story type (feature, bug, chore)')
 @click.option('--state', '-s', help='Filter by workflow state')
-def stories(query, limit, type, state):
+@format_option
+@story_fields_option
+def stories(query, limit, type, state, output_format, fields):
     """Search for stories."""
     client = get_client()
     
@@ -146,27 +265,15 @@ def stories(query, limit, type, state):
     if state:
         full_query += f" state:{state}"
     
+    if fields or output_format != 'table':
+        stories = iter_search_stories(client, full_query, limit=limit, **story_detail(fields))
+        emit_stories(client, stories, output_format, fields, title=f"Stories matching: {full_query}")
+        return
+    
     console.print(f"\n[bold]Searching stories for: '{full_query}'[/bold]\n")
     
     try:
-        search_params = SearchInputs(query=full_query, page_size=limit)
-        try:
-            search_results = client.search_stories(search_params)
-            stories = search_results.data if hasattr(search_results, 'data') else search_results
-            stories = stories[:limit] if isinstance(stories, list) else []
-        except TypeError as e:
-            # Fallback: use raw API if model parsing fails
-            import requests
-            headers = {'Shortcut-Token': client.api_token}
-            response = requests.get(f"{client.base_url}/search/stories", headers=headers, params={'query': full_query, 'page_size': limit})
-            if response.status_code == 200:
-                data = response.json()
-                stories = data.get('data', [])
-                # Convert raw dicts to objects with necessary attributes
-                from types import SimpleNamespace
-                stories = [SimpleNamespace(**s) for s in stories[:limit]]
-            else:
-                raise
+        stories = list(iter_search_stories(client, full_query, limit=limit))
         
         if not stories:
             console.print("[yellow]No stories found[/yellow]")
@@ -180,25 +287,15 @@ def stories(query, limit, type, state):
         table.add_column("Estimate")
         table.add_column("Owner")
         
-        workflows = client.list_workflows()
+        workflow_index = get_workflow_index(client)
+        resolver = EntityResolver(client)
+        resolver.collect(stories, kinds=('member',))
+        resolver.resolve()
         
         for story in stories:
-            owner_ids = story.owner_ids
-            owner_name = "Unassigned"
-            if owner_ids:
-                try:
-                    owner = client.get_member(owner_ids[0])
-                    owner_name = owner.profile.name
-                except:
-                    owner_name = owner_ids[0]
+            owner_name = resolver.owner_name(story)
             
-            # Get workflow state name
-            state_name = "Unknown"
-            for workflow in workflows:
-                for state in workflow.states:
-                    if state.id == story.workflow_state_id:
-                        state_name = state.name
-                        break
+            state_name = workflow_index.state_name(story.workflow_state_id, "Unknown")
             
             table.add_row(
                 str(story.id),
@@ -220,7 +317,8 @@ def stories(query, limit, type, state):
 @click.argument('query')
 @click.option('--limit', '-l', default=20, help='Limit number of results')
 @click.option('--state', '-s', help='Filter by epic state')
-def epics(query, limit, state):
+@format_option
+def epics(query, limit, state, output_format):
     """Search for epics."""
     client = get_client()
     
@@ -229,20 +327,15 @@ def epics(query, limit, state):
     if state:
         full_query += f" state:{state}"
     
+    if output_format != 'table':
+        emit_rows(epic_rows(iter_search_epics(client, full_query, limit=limit)),
+                  output_format, EPIC_COLUMNS, error="Error searching epics")
+        return
+    
     console.print(f"\n[bold]Searching epics for: '{full_query}'[/bold]\n")
     
     try:
-        # Note: search_epics doesn't exist in the API, using general search instead
-        search_params = SearchInputs(query=f"{full_query} type:epic", page_size=limit)
-        search_results = client.search(search_params)
-        # Filter for epic results
-        all_results = search_results.data if hasattr(search_results, 'data') else search_results
-        epics = []
-        if isinstance(all_results, list):
-            for result in all_results:
-                if hasattr(result, 'entity_type') and result.entity_type == 'epic':
-                    epics.append(result)
-        epics = epics[:limit]
+        epics = list(iter_search_epics(client, full_query, limit=limit))
         
         if not epics:
             console.print("[yellow]No epics found[/yellow]")
@@ -257,12 +350,13 @@ def epics(query, limit, state):
         table.add_column("Started")
         
         for epic in epics:
+            stats = epic.stats or {}
             table.add_row(
                 str(epic.id),
                 epic.name[:50] + "..." if len(epic.name) > 50 else epic.name,
                 epic.state,
-                str(len(epic.story_ids)),
-                str(epic.stats.num_stories_done) if epic.stats else "-",
+                str(stats.get('num_stories_total', "-")),
+                str(stats.get('num_stories_done', "-")),
                 epic.started_at[:10] if epic.started_at else "-"
             )
         
@@ -1,17 +1,31 @@
 """Story management commands for Shortcut CLI."""
 
 import click
-import questionary
-import requests
+import json
+import re
+import sys
+import yaml
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from types import SimpleNamespace
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich.markdown import Markdown
-from useshortcut.models import SearchInputs, StoryInput, UpdateStoryInput
-from sc.utils import get_client
-from sc.utils.common import get_workflow_state_map, get_state_id_by_name
+from rich.markup import escape
+from sc.api.bulk import BULK_CHUNK_SIZE, BULK_WORKERS, bulk_create_stories, bulk_update_stories
+from sc.api.pagination import iter_search_stories
+from sc.formatters import emit_stories, format_option, story_detail, story_fields_option
+from sc.lazy import lazy_import
+from sc.utils import get_client, get_store
+from sc.utils.common import format_date, get_workflow_index, get_state_id_by_name, get_member_id_by_name
+from sc.utils.importer import (
+    MappingWriter, RowError, StoryRowBuilder, default_mapping_path, detect_format, read_mapping, read_rows,
+)
+from sc.utils.lookup import NameNotFound, get_lookup_index
+from sc.utils.resolver import EntityResolver
+
+# Only `story create` prompts; load prompt_toolkit when it does
+questionary = lazy_import('questionary')
 
 console = Console()
 
@@ -22,6 +36,66 @@ def story():
     pass
 
 
+def _search_local(client, query, limit, owner, state, type, label, epic, iteration, team):
+    """Answer a story search from the local mirror (see `sc sync`).
+
+    Free text is matched against story names; the option filters are
+    resolved to IDs and applied in SQL.
+    """
+    filters = {}
+    if state:
+        filters['state_ids'] = [s.id for s in get_workflow_index(client).states_named(state)]
+    if owner:
+        owner_id = get_member_id_by_name(client, owner)
+        filters['owner_ids'] = [owner_id] if owner_id else []
+    if team:
+        try:
+            filters['group_ids'] = [get_lookup_index(client).resolve('group', team)]
+        except NameNotFound:
+            filters['group_ids'] = []
+
+    store = get_store()
+    try:
+        if epic:
+            filters['epic_ids'] = [int(epic)] if epic.isdigit() else [e['id'] for e in store.find_epics(epic)]
+        if iteration:
+            if iteration.isdigit():
+                filters['iteration_ids'] = [int(iteration)]
+            elif iteration == 'current':
+                filters['iteration_ids'] = [i['id'] for i in store.find_iterations(status='started')]
+            else:
+                filters['iteration_ids'] = [i['id'] for i in store.find_iterations(name=iteration)]
+        rows = store.search_stories(text=query or None, story_type=type, label=label,
+                                    limit=limit, **filters)
+    finally:
+        store.close()
+    return [SimpleNamespace(**s) for s in rows]
+
+
+def _build_query(query, project, owner, state, type, label, epic, iteration, team):
+    """Combine free text and filter options into one Shortcut search query."""
+    query_parts = []
+    if query:
+        query_parts.append(query)
+    if project:
+        query_parts.append(f'project:"{project}"')
+    if owner:
+        query_parts.append(f'owner:{owner}')
+    if state:
+        query_parts.append(f'state:"{state}"')
+    if type:
+        query_parts.append(f'type:{type}')
+    if label:
+        query_parts.append(f'label:"{label}"')
+    if epic:
+        query_parts.append(f'epic:"{epic}"')
+    if iteration:
+        query_parts.append(f'iteration:{iteration}')
+    if team:
+        query_parts.append(f'group:"{team}"')
+    return ' '.join(query_parts)
+
+
 @story.command()
 @click.argument('query', required=False, default='')
 @click.option('--limit', '-l', default=25, help='Maximum number of results')
@@ -33,7 +107,10 @@ def story():
 @click.option('--epic', '-e', help='Filter by epic')
 @click.option('--iteration', '-i', help='Filter by iteration (use "current" for current iteration)')
 @click.option('--team', help='Filter by team/group')
-def search(query, limit, project, owner, state, type, label, epic, iteration, team):
+@click.option('--local', is_flag=True, help='Search the local mirror instead of the API (see `sc sync`)')
+@format_option
+@story_fields_option
+def search(query, limit, project, owner, state, type, label, epic, iteration, team, local, output_format, fields):
     """Search for stories using Shortcut's search syntax.
     
     Examples:
@@ -41,55 +118,38 @@ def search(query, limit, project, owner, state, type, label, epic, iteration, te
         sc story search --owner @me --state "In Progress"
         sc story search --type bug --label urgent
         sc story search "label:security state:todo"
+        sc story search --local --iteration current
+        sc story search --type bug --format ndjson | jq .name
+        sc story search --iteration current --fields id,name,owner,labels
     """
     client = get_client()
     
-    # Build search query from options
-    query_parts = []
-    if query:
-        query_parts.append(query)
-    if project:
-        query_parts.append(f'project:"{project}"')
-    if owner:
-        query_parts.append(f'owner:{owner}')
-    if state:
-        query_parts.append(f'state:"{state}"')
-    if type:
-        query_parts.append(f'type:{type}')
-    if label:
-        query_parts.append(f'label:"{label}"')
-    if epic:
-        query_parts.append(f'epic:"{epic}"')
-    if iteration:
-        query_parts.append(f'iteration:{iteration}')
-    if team:
-        query_parts.append(f'group:"{team}"')
+    if local:
+        if project:
+            click.echo("Warning: --project is ignored with --local", err=True)
+        try:
+            stories = _search_local(client, query, limit, owner, state, type, label, epic, iteration, team)
+        except Exception as e:
+            if output_format != 'table':
+                raise click.ClickException(f"Error searching local mirror: {str(e)}")
+            console.print(f"[red]Error searching local mirror: {str(e)}[/red]")
+            return
+        if fields or output_format != 'table':
+            emit_stories(client, stories, output_format, fields, title="Local stories",
+                         error="Error searching local mirror")
+        else:
+            _print_story_table(client, stories, "Local stories")
+        return
+    
+    final_query = _build_query(query, project, owner, state, type, label, epic, iteration, team) or '*'
     
-    final_query = ' '.join(query_parts) if query_parts else '*'
+    if fields or output_format != 'table':
+        stories = iter_search_stories(client, final_query, limit=limit, **story_detail(fields))
+        emit_stories(client, stories, output_format, fields, title=f"Stories matching: {final_query}")
+        return
     
     try:
-        search_params = SearchInputs(query=final_query, page_size=limit)
-        
-        # Try the search
-        try:
-            search_results = client.search_stories(search_params)
-            stories = search_results.data if hasattr(search_results, 'data') else search_results
-            stories = stories[:limit] if isinstance(stories, list) else []
-        except:
-            # Fallback to raw API
-            headers = {'Shortcut-Token': client.api_token}
-            response = requests.get(
-                f"{client.base_url}/search/stories",
-                headers=headers,
-                params={'query': final_query, 'page_size': limit}
-            )
-            if response.status_code == 200:
-                data = response.json()
-                stories = data.get('data', [])
-                stories = [SimpleNamespace(**s) for s in stories[:limit]]
-            else:
-                raise Exception(f"Search failed: {response.status_code}")
-                
+        stories = list(iter_search_stories(client, final_query, limit=limit))
     except Exception as e:
         console.print(f"[red]Error searching stories: {str(e)}[/red]")
         return
@@ -98,8 +158,16 @@ def search(query, limit, project, owner, state, type, label, epic, iteration, te
         console.print(f"No stories found matching: {final_query}")
         return
     
-    # Display results in a table
-    table = Table(title=f"Stories matching: {final_query}")
+    _print_story_table(client, stories, f"Stories matching: {final_query}")
+
+
+def _print_story_table(client, stories, title):
+    """Render search results as a table."""
+    if not stories:
+        console.print("No stories found")
+        return
+    
+    table = Table(title=title)
     table.add_column("ID", style="cyan", no_wrap=True)
     table.add_column("Name", style="green")
     table.add_column("Type", style="yellow")
@@ -108,17 +176,18 @@ def search(query, limit, project, owner, state, type, label, epic, iteration, te
     table.add_column("Estimate")
     
     # Get workflows for state name mapping
-    state_map = get_workflow_state_map(client)
+    workflow_index = get_workflow_index(client)
+    
+    # Resolve all owner names with one bulk request
+    resolver = EntityResolver(client)
+    resolver.collect(stories, kinds=('member',))
+    resolver.resolve()
     
     for story in stories:
-        # Get owner name
-        owner_name = "Unassigned"
-        if hasattr(story, 'owner_ids') and story.owner_ids:
-            owner = client.get_member(story.owner_ids[0])
-            owner_name = owner.profile.name
+        owner_name = resolver.owner_name(story)
         
         # Get state name
-        state_name = state_map.get(story.workflow_state_id, str(story.workflow_state_id))
+        state_name = workflow_index.state_name(story.workflow_state_id)
         
         # Truncate long names
         name = story.name[:60] + "..." if len(story.name) > 60 else story.name
@@ -137,27 +206,40 @@ def search(query, limit, project, owner, state, type, label, epic, iteration, te
 
 @story.command()
 @click.argument('story_id')
-def view(story_id):
+@click.option('--local', is_flag=True, help='Read the story from the local mirror (see `sc sync`)')
+def view(story_id, local):
     """View detailed information about a story."""
     client = get_client()
     
-    try:
-        story = client.get_story(story_id)
-    except Exception as e:
-        console.print(f"[red]Error: Could not find story with ID '{story_id}'[/red]")
-        console.print(f"[dim]Details: {str(e)}[/dim]")
-        return
+    if local:
+        store = get_store()
+        try:
+            data = store.get_story(int(story_id)) if story_id.isdigit() else None
+        finally:
+            store.close()
+        if data is None:
+            console.print(f"[red]Error: Story '{story_id}' is not in the local mirror (run `sc sync`)[/red]")
+            return
+        # Mirrored stories are slim: no tasks or comments, labels as dicts
+        data['labels'] = [SimpleNamespace(**label) for label in data.get('labels') or []]
+        story = SimpleNamespace(**{'description': None, 'tasks': [], 'comments': [], **data})
+    else:
+        try:
+            story = client.get_story(story_id)
+        except Exception as e:
+            console.print(f"[red]Error: Could not find story with ID '{story_id}'[/red]")
+            console.print(f"[dim]Details: {str(e)}[/dim]")
+            return
+        # The typed Story model leaves nested labels and tasks as dicts
+        story.labels = [SimpleNamespace(**l) if isinstance(l, dict) else l for l in story.labels or []]
+        story.tasks = [SimpleNamespace(**t) if isinstance(t, dict) else t for t in story.tasks or []]
     
     # Get related data
-    state_map = get_workflow_state_map(client)
-    state_name = state_map.get(story.workflow_state_id, str(story.workflow_state_id))
+    state_name = get_workflow_index(client).state_name(story.workflow_state_id)
     
     # Format owners
-    owners = []
-    if story.owner_ids:
-        for owner_id in story.owner_ids:
-            owner = client.get_member(owner_id)
-            owners.append(owner.profile.name)
+    resolver = EntityResolver(client)
+    owners = [resolver.member_name(owner_id) for owner_id in story.owner_ids or []]
     
     # Basic info panel
     info_lines = [
@@ -166,14 +248,14 @@ def view(story_id):
         f"[bold]State:[/bold] {state_name}",
         f"[bold]Owners:[/bold] {', '.join(owners) if owners else 'Unassigned'}",
         f"[bold]Estimate:[/bold] {story.estimate if story.estimate else 'Unestimated'}",
-        f"[bold]Created:[/bold] {story.created_at[:10]}",
-        f"[bold]Updated:[/bold] {story.updated_at[:10]}",
+        f"[bold]Created:[/bold] {format_date(story.created_at)}",
+        f"[bold]Updated:[/bold] {format_date(story.updated_at)}",
     ]
     
     if story.started_at:
-        info_lines.append(f"[bold]Started:[/bold] {story.started_at[:10]}")
+        info_lines.append(f"[bold]Started:[/bold] {format_date(story.started_at)}")
     if story.completed_at:
-        info_lines.append(f"[bold]Completed:[/bold] {story.completed_at[:10]}")
+        info_lines.append(f"[bold]Completed:[/bold] {format_date(story.completed_at)}")
     
     if story.blocked:
         info_lines.append(f"[bold red]BLOCKED[/bold red]")
@@ -187,6 +269,7 @@ def view(story_id):
     
     # Description
     if story.description:
+        from rich.markdown import Markdown
         console.print("\n[bold]Description:[/bold]")
         console.print(Panel(Markdown(story.description)))
     
@@ -209,14 +292,26 @@ def view(story_id):
 def create():
     """Create a new story (interactive)."""
     client = get_client()
-    
-    # Get available options
-    workflows = client.list_workflows()
-    members = client.list_members()
-    epics = client.list_epics()
-    iterations = client.list_iterations()
-    groups = client.list_groups()
-    
+
+    # Reference data is only needed by the select prompts further down, so
+    # fetch it in the background while the user types the title and details
+    pool = ThreadPoolExecutor(max_workers=6)
+    try:
+        _create_story(
+            client,
+            projects=pool.submit(client.list_projects),
+            workflows=pool.submit(client.list_workflows),
+            members=pool.submit(client.list_members),
+            epics=pool.submit(client.list_epics),
+            iterations=pool.submit(client.list_iterations),
+            groups=pool.submit(client.list_groups),
+        )
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _create_story(client, projects, workflows, members, epics, iterations, groups):
+    """Prompt for a story and create it; the reference-data arguments are futures."""
     # Story name
     name = questionary.text("Story title:").ask()
     if not name:
@@ -229,6 +324,19 @@ def create():
         choices=["feature", "bug", "chore"]
     ).ask()
     
+    # Project
+    all_projects = projects.result()
+    if not all_projects:
+        console.print("[red]No projects available. Please create a project first.[/red]")
+        return
+    active_projects = [p for p in all_projects if not p.archived]
+    if not active_projects:
+        console.print("[red]No active projects available. All projects are archived.[/red]")
+        return
+    project_id = questionary.select(
+        "Project:",
+        choices=[{"name": p.name, "value": p.id} for p in active_projects]
+    ).ask()
 
     # Description
     description = questionary.text(
@@ -244,7 +352,7 @@ def create():
     owner_choices = [{"name": "Unassigned", "value": None}]
     owner_choices.extend([
         {"name": f"{m.profile.name} ({m.profile.email_address})", "value": m.id}
-        for m in members if not m.disabled
+        for m in members.result() if not m.disabled
     ])
     owner_id = questionary.select("Assign to:", choices=owner_choices).ask()
     
@@ -252,12 +360,12 @@ def create():
     epic_choices = [{"name": "No epic", "value": None}]
     epic_choices.extend([
         {"name": e.name, "value": e.id}
-        for e in epics if not e.archived and e.project_ids and project_id in e.project_ids
+        for e in epics.result() if not e.archived and e.project_ids and project_id in e.project_ids
     ])
     epic_id = questionary.select("Add to epic:", choices=epic_choices).ask()
     
     # Iteration assignment (optional)
-    active_iterations = [i for i in iterations if i.status in ["unstarted", "started"]]
+    active_iterations = [i for i in iterations.result() if i.status in ["unstarted", "started"]]
     iteration_choices = [{"name": "No iteration", "value": None}]
     iteration_choices.extend([
         {"name": f"{i.name} ({i.status})", "value": i.id}
@@ -269,27 +377,42 @@ def create():
     group_choices = [{"name": "No team", "value": None}]
     group_choices.extend([
         {"name": g.name, "value": g.id}
-        for g in groups if not g.archived
+        for g in groups.result() if not g.archived
     ])
     group_id = questionary.select("Assign to team:", choices=group_choices).ask()
     
     # Get default workflow state (first state of first workflow)
+    workflows = workflows.result()
     default_state_id = workflows[0].states[0].id if workflows and workflows[0].states else None
     if not default_state_id:
         console.print("[red]Error: No workflow states found[/red]")
         return
     
     # Create the story with basic fields
+    from useshortcut.models import StoryInput
     story_data = StoryInput(
         name=name,
         story_type=story_type,
         description=description or None,
         workflow_state_id=default_state_id,
+        project_id=project_id,
         epic_id=epic_id
     )
     
     story = client.create_story(story_data)
 
+    # StoryInput has no owner, estimate, iteration or team: set them afterwards
+    extra = {
+        'estimate': estimate,
+        'owner_ids': [owner_id] if owner_id else None,
+        'iteration_id': iteration_id,
+        'group_id': group_id,
+    }
+    extra = {k: v for k, v in extra.items() if v is not None}
+    if extra:
+        from useshortcut.models import UpdateStoryInput
+        story = client.update_story(story.id, UpdateStoryInput(**extra))
+
     console.print(f"\n[green]✓ Created story #{story.id}[/green]")
     console.print(f"[dim]View in browser: {story.app_url}[/dim]")
 
@@ -320,23 +443,289 @@ def delete(story_id):
 @story.command()
 @click.argument('story_id')
 @click.argument('state')
-def move(story_id, state):
+@click.option('--workflow', '-w', help='Workflow to pick the state from when several share its name')
+def move(story_id, state, workflow):
     """Move a story to a different workflow state."""
     client = get_client()
     
     # Get the state ID from name
-    state_id = get_state_id_by_name(client, state)
+    state_id = get_state_id_by_name(client, state, workflow)
     if not state_id:
         console.print(f"[red]Error: Could not find workflow state '{state}'[/red]")
         return
     
     # Update the story
+    from useshortcut.models import UpdateStoryInput
     update = UpdateStoryInput(workflow_state_id=state_id)
     story = client.update_story(story_id, update)
     
     console.print(f"[green]✓ Moved story {story_id} to '{state}'[/green]")
 
 
+def _parse_story_ids(text):
+    """Story IDs from free text: numbers, #123, sc-123 or story URLs, in order, deduplicated."""
+    ids = []
+    for token in re.split(r'[\s,]+', text):
+        if not token:
+            continue
+        match = re.search(r'/story/(\d+)', token) or re.fullmatch(r'(?:sc-|#)?(\d+)', token, re.IGNORECASE)
+        if not match:
+            raise click.BadParameter(f"'{token}' is not a story ID", param_hint='stdin')
+        ids.append(int(match.group(1)))
+    return list(dict.fromkeys(ids))
+
+
+def _find_named(client, kind, value):
+    """ID of the entity whose ID or (fuzzy) name matches ``value``; 'none' clears the field."""
+    if value.lower() == 'none':
+        return None
+    if value.isdigit():
+        return int(value)
+    return get_lookup_index(client).resolve(kind, value)
+
+
+def _bulk_changes(client, set_state, workflow, add_labels, remove_labels, add_owners,
+                  remove_owners, set_epic, set_iteration, set_team, set_estimate, archive):
+    """Build the UpdateStories body shared by every chunk."""
+    changes = {}
+    if set_state:
+        state_id = get_state_id_by_name(client, set_state, workflow)
+        if not state_id:
+            raise click.ClickException(f"Could not find workflow state '{set_state}'")
+        changes['workflow_state_id'] = state_id
+    if add_labels:
+        changes['labels_add'] = [{'name': name} for name in add_labels]
+    if remove_labels:
+        changes['labels_remove'] = [{'name': name} for name in remove_labels]
+    for key, names in (('owner_ids_add', add_owners), ('owner_ids_remove', remove_owners)):
+        if names:
+            changes[key] = [get_lookup_index(client).resolve('member', name) for name in names]
+    if set_epic:
+        changes['epic_id'] = _find_named(client, 'epic', set_epic)
+    if set_iteration:
+        changes['iteration_id'] = _find_named(client, 'iteration', set_iteration)
+    if set_team:
+        changes['group_id'] = _find_named(client, 'group', set_team)
+    if set_estimate is not None:
+        if set_estimate.lower() != 'none' and not set_estimate.isdigit():
+            raise click.ClickException(f"Estimate must be a number or 'none', not '{set_estimate}'")
+        changes['estimate'] = int(set_estimate) if set_estimate.isdigit() else None
+    if archive is not None:
+        changes['archived'] = archive
+    return changes
+
+
+# Bulk-update fields whose values were looked up by name, and the kind looked up
+RESOLVED_FIELDS = {
+    'owner_ids_add': 'member',
+    'owner_ids_remove': 'member',
+    'epic_id': 'epic',
+    'iteration_id': 'iteration',
+    'group_id': 'group',
+}
+
+
+def _describe_changes(client, changes):
+    """``field: name [id]`` for each looked-up value, so a dry run shows what a name matched."""
+    lookup = get_lookup_index(client)
+    lines = []
+    for field, kind in RESOLVED_FIELDS.items():
+        values = changes.get(field)
+        for value in values if isinstance(values, list) else [values]:
+            if value is not None:
+                lines.append(f"{field}: {lookup.name(kind, value)} [{value}]")
+    return lines
+
+
+@story.command('bulk-update')
+@click.argument('query', required=False, default='')
+@click.option('--stdin', 'from_stdin', is_flag=True, help='Read story IDs from stdin instead of searching')
+@click.option('--limit', '-l', type=int, help='Update at most this many matching stories')
+@click.option('--project', '-p', help='Select by project')
+@click.option('--owner', '-o', help='Select by owner')
+@click.option('--state', '-s', help='Select by workflow state')
+@click.option('--type', '-t', help='Select by story type (feature, bug, chore)')
+@click.option('--label', help='Select by label')
+@click.option('--epic', '-e', help='Select by epic')
+@click.option('--iteration', '-i', help='Select by iteration (use "current" for current iteration)')
+@click.option('--team', help='Select by team/group')
+@click.option('--set-state', help='Move the stories to this workflow state')
+@click.option('--workflow', '-w', help='Workflow to pick --set-state from when several share its name')
+@click.option('--add-label', 'add_labels', multiple=True, help='Add a label (repeatable)')
+@click.option('--remove-label', 'remove_labels', multiple=True, help='Remove a label (repeatable)')
+@click.option('--add-owner', 'add_owners', multiple=True, help='Add an owner (repeatable)')
+@click.option('--remove-owner', 'remove_owners', multiple=True, help='Remove an owner (repeatable)')
+@click.option('--set-epic', help='Move the stories to this epic ("none" to clear)')
+@click.option('--set-iteration', help='Move the stories to this iteration ("none" to clear)')
+@click.option('--set-team', help='Assign the stories to this team ("none" to clear)')
+@click.option('--set-estimate', help='Set the estimate ("none" to clear)')
+@click.option('--archive/--unarchive', default=None, help='Archive or unarchive the stories')
+@click.option('--chunk-size', default=BULK_CHUNK_SIZE, show_default=True, help='Stories per bulk request')
+@click.option('--concurrency', default=BULK_WORKERS, show_default=True, help='Bulk requests in flight at once')
+@click.option('--dry-run', is_flag=True, help='Show what would change without updating anything')
+@click.pass_context
+def bulk_update(ctx, query, from_stdin, limit, project, owner, state, type, label, epic, iteration, team,
+                set_state, workflow, add_labels, remove_labels, add_owners, remove_owners,
+                set_epic, set_iteration, set_team, set_estimate, archive,
+                chunk_size, concurrency, dry_run):
+    """Apply the same change to many stories with a few bulk requests.
+
+    Stories are selected with the same options as `story search`, or read
+    as IDs from stdin. Errors and failed chunks exit with status 1, so a
+    script can tell a partial update from a complete one.
+
+    Examples:
+        sc story bulk-update --iteration current --state "Ready" --set-state "In Progress"
+        sc story bulk-update --label legacy --add-label cleanup --remove-label legacy --dry-run
+        cut -f1 stories.tsv | sc story bulk-update --stdin --set-iteration "Sprint 12"
+    """
+    client = get_client()
+
+    search_query = _build_query(query, project, owner, state, type, label, epic, iteration, team)
+    if from_stdin == bool(search_query):
+        console.print("[red]Error: Select stories with a query/filters or with --stdin (not both)[/red]")
+        ctx.exit(1)
+
+    try:
+        changes = _bulk_changes(client, set_state, workflow, add_labels, remove_labels, add_owners,
+                                remove_owners, set_epic, set_iteration, set_team, set_estimate, archive)
+    except click.ClickException as e:
+        console.print(f"[red]Error: {e.message}[/red]")
+        ctx.exit(1)
+    if not changes:
+        console.print("[red]Error: Nothing to change (use --set-state, --add-label, ...)[/red]")
+        ctx.exit(1)
+
+    if from_stdin:
+        story_ids = _parse_story_ids(sys.stdin.read())[:limit]
+    else:
+        try:
+            story_ids = [s.id for s in iter_search_stories(client, search_query, limit=limit)]
+        except Exception as e:
+            console.print(f"[red]Error searching stories: {str(e)}[/red]")
+            ctx.exit(1)
+
+    if not story_ids:
+        console.print("No stories selected")
+        return
+
+    chunks = -(-len(story_ids) // chunk_size)
+    if dry_run:
+        console.print(f"[yellow]Dry run:[/yellow] would update {len(story_ids)} stories "
+                      f"in {chunks} bulk request(s)")
+        console.print(f"[dim]Changes: {json.dumps(changes)}[/dim]")
+        for line in _describe_changes(client, changes):
+            console.print(f"[dim]  {escape(line)}[/dim]")
+        console.print(f"[dim]Stories: {', '.join(str(i) for i in story_ids)}[/dim]")
+        return
+
+    def report(chunk):
+        if chunk.ok:
+            console.print(f"[green]✓ Chunk {chunk.index + 1}/{chunks}: updated {len(chunk.items)} stories[/green]")
+        else:
+            console.print(f"[red]✗ Chunk {chunk.index + 1}/{chunks} "
+                          f"(stories {chunk.items[0]}..{chunk.items[-1]}) failed: {chunk.error}[/red]")
+
+    results = bulk_update_stories(client, story_ids, changes, chunk_size=chunk_size,
+                                  workers=concurrency, on_chunk=report)
+    failed = [story_id for r in results if not r.ok for story_id in r.items]
+    updated = len(story_ids) - len(failed)
+    console.print(f"\nUpdated {updated} of {len(story_ids)} stories")
+    if failed:
+        console.print(f"[red]Failed story IDs: {' '.join(str(i) for i in failed)}[/red]")
+        ctx.exit(1)
+
+
+@story.command('import')
+@click.argument('file', type=click.Path(exists=True, dir_okay=False))
+@click.option('--input-format', type=click.Choice(['csv', 'tsv', 'yaml', 'ndjson']),
+              help='Input format (default: from the file extension)')
+@click.option('--mapping', '-m', type=click.Path(dir_okay=False),
+              help='Row-to-story-ID mapping file (default: FILE.ids.csv)')
+@click.option('--workflow', '-w', help='Workflow to pick states from when several share a name')
+@click.option('--chunk-size', default=BULK_CHUNK_SIZE, show_default=True, help='Stories per bulk request')
+@click.option('--concurrency', default=BULK_WORKERS, show_default=True, help='Bulk requests in flight at once')
+@click.option('--dry-run', is_flag=True, help='Validate and resolve every row without creating anything')
+@click.pass_context
+def import_stories(ctx, file, input_format, mapping, workflow, chunk_size, concurrency, dry_run):
+    """Create stories in bulk from a CSV, TSV, YAML or NDJSON file.
+
+    Each row needs a name; state, owners, epic, iteration, team, labels,
+    estimate, description, type, deadline and external_id are optional and
+    may use names or IDs. Created stories are appended to the mapping file
+    as row,story_id,name. Rows already in the mapping file are skipped, so
+    re-running the same command resumes a partial import. Errors and
+    failed rows exit with status 1, so a script knows to fix and re-run.
+
+    Examples:
+        sc story import sprint.csv
+        sc story import backlog.yaml --workflow Engineering --dry-run
+    """
+    fmt = input_format or detect_format(file)
+    if not fmt:
+        console.print(f"[red]Error: Cannot tell the format of '{file}'; pass --input-format[/red]")
+        ctx.exit(1)
+    mapping = mapping or default_mapping_path(file)
+    done = read_mapping(mapping)
+    if done:
+        console.print(f"Resuming: {len(done)} rows already imported (from {mapping})")
+
+    client = get_client()
+    try:
+        builder = StoryRowBuilder(client, workflow)
+    except Exception as e:
+        console.print(f"[red]Error loading workspace metadata: {str(e)}[/red]")
+        ctx.exit(1)
+
+    invalid = []
+
+    def stories():
+        for number, row in read_rows(file, fmt):
+            if number in done:
+                continue
+            try:
+                yield number, builder.build(row)
+            except RowError as e:
+                invalid.append(number)
+                console.print(f"[yellow]Row {number}: {e}[/yellow]")
+
+    if dry_run:
+        try:
+            count = sum(1 for _ in stories())
+        except (OSError, ValueError, yaml.YAMLError) as e:
+            console.print(f"[red]Error reading {file}: {str(e)}[/red]")
+            ctx.exit(1)
+        console.print(f"[yellow]Dry run:[/yellow] {count} stories ready to create, {len(invalid)} rows with errors")
+        return
+
+    writer = MappingWriter(mapping)
+
+    def report(chunk):
+        first, last = chunk.items[0][0], chunk.items[-1][0]
+        if chunk.ok:
+            writer.write(chunk.result)
+            console.print(f"[green]✓ Rows {first}-{last}: created {len(chunk.result)} stories[/green]")
+        else:
+            console.print(f"[red]✗ Rows {first}-{last} failed: {chunk.error}[/red]")
+
+    try:
+        results = bulk_create_stories(client, stories(), chunk_size=chunk_size,
+                                      workers=concurrency, on_chunk=report)
+    except (OSError, ValueError, yaml.YAMLError) as e:
+        console.print(f"[red]Error reading {file}: {str(e)}[/red]")
+        ctx.exit(1)
+    finally:
+        writer.close()
+
+    created = sum(len(r.result) for r in results if r.ok)
+    failed = sum(len(r.items) for r in results if not r.ok)
+    console.print(f"\nCreated {created} stories; mapping written to {mapping}")
+    if failed or invalid:
+        console.print(f"[red]{failed} rows failed and {len(invalid)} rows were invalid; "
+                      f"fix them and re-run to resume[/red]")
+        ctx.exit(1)
+
+
 @story.command()
 @click.argument('story_id')
 def start(story_id):
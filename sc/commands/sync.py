@@ -0,0 +1,34 @@
+"""Local mirror sync command for Shortcut CLI."""
+
+import click
+from rich.console import Console
+from sc.api.sync import sync_all
+from sc.utils import get_client, get_store
+
+console = Console()
+
+
+@click.command()
+@click.option('--full', is_flag=True, help='Discard the mirror and pull everything again')
+def sync(full):
+    """Sync stories, epics and iterations into the local mirror.
+
+    The first run pulls everything; later runs only fetch what changed
+    since the last sync. Read commands use the mirror with --local.
+    Stories deleted in Shortcut stay in the mirror until a --full sync,
+    unless `sc listen` applied their delete event.
+    """
+    client = get_client()
+    store = get_store()
+
+    try:
+        written = sync_all(client, store, full=full)
+    except Exception as e:
+        console.print(f"[red]Error syncing: {str(e)}[/red]")
+        return
+    finally:
+        counts = store.counts()
+        store.close()
+
+    for entity, count in written.items():
+        console.print(f"[green]✓ {entity}:[/green] {count} updated, {counts[entity]} in mirror")
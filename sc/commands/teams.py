@@ -1,10 +1,25 @@
+import re
 import click
 from rich.console import Console
 from rich.table import Table
+from sc.api.pagination import iter_search_stories
+from sc.formatters import emit_stories, format_option, story_detail, story_fields_option
 from sc.utils import get_client
+from sc.utils.common import get_workflow_index
+from sc.utils.lookup import get_lookup_index
+from sc.utils.resolver import EntityResolver
 
 console = Console()
 
+UUID_RE = re.compile(r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}', re.IGNORECASE)
+
+
+def _team_id(client, value):
+    """Team ID for an ID or a (partial) team name."""
+    if UUID_RE.fullmatch(value):
+        return value
+    return get_lookup_index(client).resolve('group', value)
+
 
 @click.group()
 def team():
@@ -12,8 +27,8 @@ def team():
     pass
 
 
-@team.command()
-def list():
+@team.command('list')
+def list_teams():
     """List all teams."""
     client = get_client()
     groups = client.list_groups()
@@ -38,8 +53,9 @@ def list():
 @team.command()
 @click.argument('group_id')
 def view(group_id):
-    """View details of a specific team."""
+    """View details of a specific team (by ID or name)."""
     client = get_client()
+    group_id = _team_id(client, group_id)
     try:
         g = client.get_group(group_id)
     except Exception as e:
@@ -59,8 +75,9 @@ def view(group_id):
 @team.command()
 @click.argument('group_id')
 def members(group_id):
-    """List members of a team."""
+    """List members of a team (by ID or name)."""
     client = get_client()
+    group_id = _team_id(client, group_id)
     try:
         g = client.get_group(group_id)
         members = client.list_members()
@@ -94,9 +111,19 @@ def members(group_id):
 @click.argument('group_id')
 @click.option('--limit', '-l', default=20, help='Limit number of stories')
 @click.option('--state', '-s', help='Filter by workflow state')
-def stories(group_id, limit, state):
-    """List stories assigned to a team."""
+@format_option
+@story_fields_option
+def stories(group_id, limit, state, output_format, fields):
+    """List stories assigned to a team (by ID or name)."""
     client = get_client()
+    group_id = _team_id(client, group_id)
+    
+    if fields or output_format != 'table':
+        query = f"group:{group_id}" + (f" state:{state}" if state else "")
+        stories = iter_search_stories(client, query, limit=limit, **story_detail(fields))
+        emit_stories(client, stories, output_format, fields, title=f"Stories for team {group_id}")
+        return
+    
     try:
         g = client.get_group(group_id)
     except Exception as e:
@@ -104,31 +131,12 @@ def stories(group_id, limit, state):
         console.print(f"[dim]Details: {str(e)}[/dim]")
         return
     
-    from useshortcut.models import SearchInputs
-    
     query = f"group:{group_id}"
     if state:
         query += f" state:{state}"
     
     try:
-        search_params = SearchInputs(query=query, page_size=limit)
-        try:
-            search_results = client.search_stories(search_params)
-            stories = search_results.data if hasattr(search_results, 'data') else search_results
-            stories = stories[:limit] if isinstance(stories, list) else []
-        except TypeError as e:
-            # Fallback: use raw API if model parsing fails
-            import requests
-            headers = {'Shortcut-Token': client.api_token}
-            response = requests.get(f"{client.base_url}/search/stories", headers=headers, params={'query': query, 'page_size': limit})
-            if response.status_code == 200:
-                data = response.json()
-                stories = data.get('data', [])
-                # Convert raw dicts to objects with necessary attributes
-                from types import SimpleNamespace
-                stories = [SimpleNamespace(**s) for s in stories[:limit]]
-            else:
-                raise
+        stories = list(iter_search_stories(client, query, limit=limit))
     except Exception as e:
         console.print(f"[red]Error searching stories: {str(e)}[/red]")
         return
@@ -143,26 +151,22 @@ def stories(group_id, limit, state):
     table.add_column("Estimate")
     table.add_column("Owner")
     
+    resolver = EntityResolver(client)
+    resolver.collect(stories, kinds=('member',))
+    resolver.resolve()
+    
+    try:
+        workflow_index = get_workflow_index(client)
+    except Exception:
+        workflow_index = None
+    
     for story in stories:
-        owner_ids = story.owner_ids
-        owner_name = "Unassigned"
-        if owner_ids:
-            try:
-                owner = client.get_member(owner_ids[0])
-                owner_name = owner.profile.name
-            except:
-                owner_name = owner_ids[0]
+        owner_name = resolver.owner_name(story)
         
         # Get workflow state name
-        state_name = "Unknown"
-        try:
-            workflows = client.list_workflows()
-            for workflow in workflows:
-                for state in workflow.states:
-                    if state.id == story.workflow_state_id:
-                        state_name = state.name
-                        break
-        except:
+        if workflow_index is not None:
+            state_name = workflow_index.state_name(story.workflow_state_id, "Unknown")
+        else:
             state_name = str(story.workflow_state_id)
         
         table.add_row(
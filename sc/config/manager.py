@@ -3,7 +3,7 @@
 import os
 import yaml
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 
 class ConfigManager:
@@ -37,6 +37,23 @@ class ConfigManager:
         
         return None
 
+    def get_api_url(self) -> Optional[str]:
+        """Get an alternative API base URL (a proxy or local stand-in) from environment or config."""
+        return os.environ.get('SHORTCUT_API_URL') or self.config.get('api_url')
+
+    def get_webhook_secret(self) -> Optional[str]:
+        """Get the secret Shortcut signs webhook payloads with, from environment or config."""
+        return os.environ.get('SHORTCUT_WEBHOOK_SECRET') or (self.config.get('webhook') or {}).get('secret')
+
+    def get_cache_ttls(self) -> Dict[str, int]:
+        """Get per-collection cache TTL overrides (seconds) from config."""
+        cache = self.config.get('cache') or {}
+        return cache.get('ttl') or {}
+
+    def get_rate_limit(self) -> Dict[str, int]:
+        """Get rate-limit overrides (requests_per_minute, max_concurrency) from config."""
+        return self.config.get('rate_limit') or {}
+
 
 # Global instance
 _config = None
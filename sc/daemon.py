@@ -0,0 +1,418 @@
+"""Optional long-lived ``sc daemon`` that runs commands with a warm client.
+
+``sc daemon start`` keeps one process alive with the API client, its
+pooled HTTP connections, the rate limiter and the workflow and name
+lookup indexes loaded, and re-fetches the cached member, iteration and
+other reference collections as they go stale, so commands never wait on
+them. The ``sc`` entry point forwards each invocation over a Unix socket
+and streams the output back; when no daemon is listening it runs the
+command in-process.
+
+Frames are JSON objects, one per line. The front-end sends
+``{"run": {...}}`` and receives ``{"out": text}`` / ``{"err": text}``
+frames, then ``{"exit": code}``. A daemon that cannot take the command
+(another token, or busy with one already) answers ``{"decline": reason}``
+before running anything, and the front-end falls back to in-process.
+
+Every ``sc`` run imports this module, so it only needs the standard
+library until a daemon is actually started.
+"""
+
+import io
+import json
+import os
+import shutil
+import socket
+import socketserver
+import sys
+import threading
+import time
+import traceback
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Mapping, Optional, Sequence, Tuple
+
+# Environment a forwarded command runs with. The token and API URL must
+# match the daemon's own; the rest is applied for the length of the command.
+FORWARDED_ENV = ('SHORTCUT_API_TOKEN', 'SHORTCUT_API_URL', 'SC_NO_CACHE', 'SC_DEBUG', 'SC_TRACE',
+                 'TERM', 'COLORTERM', 'NO_COLOR', 'FORCE_COLOR')
+IDENTITY_ENV = ('SHORTCUT_API_TOKEN', 'SHORTCUT_API_URL')
+
+# Commands that prompt, serve, or manage the daemon itself always run in-process
+LOCAL_COMMANDS = {('daemon',), ('listen',), ('story', 'create'), ('story', 'delete')}
+
+# Top-level options that take a value, skipped when finding the command name
+_VALUE_OPTIONS = {'--trace-file'}
+
+CONNECT_TIMEOUT = 0.5
+
+
+def socket_path() -> Path:
+    """Where the daemon listens: $SC_DAEMON_SOCKET, or next to the reference cache."""
+    return Path(os.environ.get('SC_DAEMON_SOCKET') or Path.home() / ".cache" / "shortcut" / "daemon.sock")
+
+
+def command_path(argv: Sequence[str]) -> Tuple[str, ...]:
+    """The command and subcommand names in an ``sc`` argument list."""
+    names = []
+    skip = False
+    for arg in argv:
+        if skip:
+            skip = False
+        elif arg == '--':
+            break
+        elif arg.startswith('-'):
+            skip = arg in _VALUE_OPTIONS
+        else:
+            names.append(arg)
+            if len(names) == 2:
+                break
+    return tuple(names)
+
+
+def _identity(env: Mapping[str, str]) -> Tuple[Optional[str], ...]:
+    return tuple(env.get(k) or None for k in IDENTITY_ENV)
+
+
+def _send(sock: socket.socket, frame: Dict[str, Any]) -> None:
+    sock.sendall(json.dumps(frame).encode('utf-8') + b'\n')
+
+
+def _connect(path: Optional[Path] = None) -> Optional[socket.socket]:
+    path = path or socket_path()
+    if not path.exists():
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(CONNECT_TIMEOUT)
+    try:
+        sock.connect(str(path))
+    except OSError:
+        sock.close()
+        return None
+    sock.settimeout(None)
+    return sock
+
+
+def control(command: str, path: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    """Send ``status`` or ``stop`` to the daemon; None when none is listening."""
+    sock = _connect(path)
+    if sock is None:
+        return None
+    with sock, sock.makefile('rb') as frames:
+        try:
+            _send(sock, {'control': command})
+            line = frames.readline()
+        except OSError:
+            return None
+    return json.loads(line) if line else None
+
+
+# -- front-end -------------------------------------------------------------
+
+def forward(argv: Sequence[str], path: Optional[Path] = None) -> Optional[int]:
+    """Run an ``sc`` command in the daemon and return its exit code.
+
+    Returns None, having run nothing, when the command must run in-process
+    or no daemon can take it.
+    """
+    names = command_path(argv)
+    if names[:1] in LOCAL_COMMANDS or names[:2] in LOCAL_COMMANDS:
+        return None
+    sock = _connect(path)
+    if sock is None:
+        return None
+
+    request = {
+        'argv': list(argv),
+        'cwd': os.getcwd(),
+        'env': {k: os.environ[k] for k in FORWARDED_ENV if k in os.environ},
+        'columns': shutil.get_terminal_size().columns,
+        'tty': sys.stdout.isatty(),
+        'err_tty': sys.stderr.isatty(),
+    }
+    if '--stdin' in argv:
+        request['stdin'] = sys.stdin.read()
+
+    with sock, sock.makefile('rb') as frames:
+        try:
+            _send(sock, {'run': request})
+            for line in frames:
+                frame = json.loads(line)
+                if 'out' in frame:
+                    sys.stdout.write(frame['out'])
+                    sys.stdout.flush()
+                elif 'err' in frame:
+                    sys.stderr.write(frame['err'])
+                    sys.stderr.flush()
+                elif 'exit' in frame:
+                    return frame['exit']
+                elif 'decline' in frame:
+                    if 'stdin' in request:
+                        sys.stdin = io.StringIO(request['stdin'])
+                    return None
+        except OSError:
+            pass
+    sys.stderr.write("Error: sc daemon disconnected before the command finished\n")
+    return 1
+
+
+# -- server ----------------------------------------------------------------
+
+class _FrameSink(io.RawIOBase):
+    """Binary stream that sends each write to the front-end as one frame."""
+
+    def __init__(self, sock: socket.socket, key: str, tty: bool, lock: threading.Lock):
+        self.sock = sock
+        self.key = key
+        self.tty = tty
+        self.lock = lock
+
+    def writable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return self.tty
+
+    def write(self, data) -> int:
+        with self.lock:
+            _send(self.sock, {self.key: bytes(data).decode('utf-8', errors='replace')})
+        return len(data)
+
+
+@contextmanager
+def _environ(values: Mapping[str, Optional[str]]) -> Iterator[None]:
+    saved = {k: os.environ.get(k) for k in values}
+
+    def apply(env):
+        for k, v in env.items():
+            if v is None:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = v
+
+    apply(values)
+    try:
+        yield
+    finally:
+        apply(saved)
+
+
+@contextmanager
+def _redirected(stdout, stderr, stdin, cwd: Optional[str]) -> Iterator[None]:
+    saved = sys.stdout, sys.stderr, sys.stdin, os.getcwd()
+    sys.stdout, sys.stderr, sys.stdin = stdout, stderr, stdin
+    if cwd and os.path.isdir(cwd):
+        os.chdir(cwd)
+    try:
+        yield
+    finally:
+        stdout.flush()
+        stderr.flush()
+        sys.stdout, sys.stderr, sys.stdin = saved[:3]
+        os.chdir(saved[3])
+
+
+@contextmanager
+def _fresh_consoles() -> Iterator[None]:
+    """Give every loaded sc module a Rich console for this run's terminal.
+
+    Module-level consoles fix their width and colour support when created,
+    so each forwarded command gets new ones built under its own environment.
+    """
+    from rich.console import Console
+
+    swapped = []
+    for name, module in list(sys.modules.items()):
+        if name.startswith('sc.') and isinstance(getattr(module, 'console', None), Console):
+            swapped.append((module, module.console))
+            module.console = Console()
+    try:
+        yield
+    finally:
+        for module, console in swapped:
+            module.console = console
+
+
+def _exit_code(code) -> int:
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    sys.stderr.write(f"{code}\n")
+    return 1
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        line = self.rfile.readline()
+        if line:
+            self.server.daemon.handle(self.connection, json.loads(line))
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class Daemon:
+    """Runs forwarded commands, one at a time, against a shared warm client."""
+
+    def __init__(self, path: Optional[Path] = None, idle_timeout: float = 0,
+                 refresh_interval: float = 60):
+        self.path = Path(path or socket_path())
+        self.idle_timeout = idle_timeout
+        self.refresh_interval = refresh_interval
+        self.identity = _identity(os.environ)
+        self.started = time.time()
+        self.last_used = time.monotonic()
+        self.last_refresh = time.monotonic()
+        self.served = 0
+        self._modified: Dict[str, Optional[float]] = {}  # cache file mtimes the indexes were built from
+        self._busy = threading.Lock()
+        self._stopping = threading.Event()
+
+    def warm(self) -> None:
+        """Import every command and build the workflow, member and iteration indexes."""
+        import importlib
+        from sc.cli import COMMANDS
+        from sc.utils.client import get_client
+        from sc.utils.common import get_workflow_index
+        from sc.utils.lookup import get_lookup_index
+
+        for module_path, _ in COMMANDS.values():
+            importlib.import_module(module_path.split(':')[0])
+        client = get_client()
+        get_workflow_index(client)
+        lookup = get_lookup_index(client)
+        lookup.load('member')
+        lookup.load('iteration')
+        if client.cache is not None:
+            self._modified = {row['name']: row['modified'] for row in client.cache.status()}
+
+    def refresh(self) -> None:
+        """Re-fetch every stale collection that is in the reference cache.
+
+        Indexes built from a collection are also dropped when another process
+        rewrote it (``sc listen`` applying a webhook, or a refresh elsewhere).
+        """
+        from sc.utils.client import get_client
+        from sc.utils.common import refresh_workflow_index
+        from sc.utils.lookup import KINDS_BY_COLLECTION, get_lookup_index
+
+        self.last_refresh = time.monotonic()
+        client = get_client()
+        if client.cache is None:
+            return
+        for row in client.cache.status():
+            if row['fresh'] or row['age'] is None:
+                continue
+            try:
+                client.fetch_reference(row['name'])
+            except Exception:
+                pass
+        for row in client.cache.status():
+            if row['modified'] == self._modified.get(row['name']):
+                continue
+            self._modified[row['name']] = row['modified']
+            try:
+                if row['name'] == 'workflows':
+                    refresh_workflow_index(client)
+                elif row['name'] in KINDS_BY_COLLECTION:
+                    get_lookup_index(client).invalidate(KINDS_BY_COLLECTION[row['name']])
+            except Exception:
+                pass
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            'pid': os.getpid(),
+            'socket': str(self.path),
+            'uptime': round(time.time() - self.started, 1),
+            'served': self.served,
+            'busy': self._busy.locked(),
+            'idle': round(time.monotonic() - self.last_used, 1),
+        }
+
+    def stop(self) -> None:
+        self._stopping.set()
+
+    def handle(self, sock: socket.socket, frame: Dict[str, Any]) -> None:
+        try:
+            if 'run' in frame:
+                self.run(sock, frame['run'])
+            elif frame.get('control') == 'status':
+                _send(sock, self.status())
+            elif frame.get('control') == 'stop':
+                self.stop()
+                _send(sock, {'stopping': True, 'pid': os.getpid()})
+        except OSError:
+            pass  # the front-end went away
+
+    def run(self, sock: socket.socket, request: Dict[str, Any]) -> None:
+        if _identity(request.get('env', {})) != self.identity:
+            _send(sock, {'decline': 'different API token or URL'})
+            return
+        if not self._busy.acquire(blocking=False):
+            _send(sock, {'decline': 'busy'})
+            return
+        try:
+            self.last_used = time.monotonic()
+            code = self._execute(sock, request)
+            self.served += 1
+        finally:
+            self.last_used = time.monotonic()
+            self._busy.release()
+        _send(sock, {'exit': code})
+
+    def _execute(self, sock: socket.socket, request: Dict[str, Any]) -> int:
+        from sc.cli import cli
+
+        lock = threading.Lock()
+        stdout = io.TextIOWrapper(_FrameSink(sock, 'out', request.get('tty', False), lock),
+                                  encoding='utf-8', write_through=True)
+        stderr = io.TextIOWrapper(_FrameSink(sock, 'err', request.get('err_tty', False), lock),
+                                  encoding='utf-8', write_through=True)
+        env = {k: request['env'].get(k) for k in FORWARDED_ENV}
+        env['COLUMNS'] = str(request.get('columns') or 80)
+
+        with _environ(env), _redirected(stdout, stderr, io.StringIO(request.get('stdin', '')),
+                                        request.get('cwd')), _fresh_consoles():
+            try:
+                cli.main(args=request['argv'], prog_name='sc', standalone_mode=True)
+            except SystemExit as e:
+                return _exit_code(e.code)
+            except Exception:
+                traceback.print_exc()
+                return 1
+        return 0
+
+    def _tick(self) -> None:
+        now = time.monotonic()
+        if self.idle_timeout and now - self.last_used > self.idle_timeout and not self._busy.locked():
+            self.stop()
+        elif now - self.last_refresh > self.refresh_interval and self._busy.acquire(blocking=False):
+            try:
+                self.refresh()
+            finally:
+                self._busy.release()
+
+    def serve(self, poll_interval: float = 1.0) -> None:
+        """Listen until stopped, idle for ``idle_timeout`` seconds, or interrupted."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.path.exists():
+            self.path.unlink()  # left behind by a daemon that did not exit cleanly
+        umask = os.umask(0o177)  # the socket carries the user's token: owner only
+        try:
+            server = _Server(str(self.path), _Handler)
+        finally:
+            os.umask(umask)
+        server.daemon = self
+        server.timeout = poll_interval
+        try:
+            with server:
+                while not self._stopping.is_set():
+                    server.handle_request()
+                    self._tick()
+        finally:
+            try:
+                self.path.unlink()
+            except OSError:
+                pass
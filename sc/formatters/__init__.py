@@ -0,0 +1,13 @@
+"""Output formatters for Shortcut CLI."""
+
+from .base import FORMATS, format_option, write_rows, emit_rows, print_table
+from .stories import (
+    STORY_COLUMNS, EPIC_COLUMNS, STORY_FIELDS, story_rows, epic_rows, emit_stories,
+    story_detail, story_fields_option,
+)
+
+__all__ = [
+    'FORMATS', 'format_option', 'write_rows', 'emit_rows', 'print_table',
+    'STORY_COLUMNS', 'EPIC_COLUMNS', 'STORY_FIELDS', 'story_rows', 'epic_rows', 'emit_stories',
+    'story_detail', 'story_fields_option',
+]
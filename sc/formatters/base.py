@@ -0,0 +1,91 @@
+"""Streaming machine-readable output (JSON, NDJSON, CSV, TSV), plus projected tables.
+
+These writers never build the full result in memory and never touch
+Rich: each row is written to stdout as soon as it is produced, so a
+paginated search piped into ``jq`` starts printing after the first page.
+"""
+
+import csv
+import json
+import sys
+from typing import Any, Dict, Iterable, List, Optional, TextIO
+
+import click
+
+FORMATS = ['table', 'json', 'ndjson', 'csv', 'tsv']
+
+
+def format_option(f):
+    """Shared ``--format`` option for list commands."""
+    return click.option(
+        '--format', '-f', 'output_format', type=click.Choice(FORMATS), default='table',
+        show_default=True, help='Output format; anything but table streams rows to stdout'
+    )(f)
+
+
+def _dumps(row: Dict[str, Any]) -> str:
+    return json.dumps(row, default=str, ensure_ascii=False)
+
+
+def write_rows(rows: Iterable[Dict[str, Any]], output_format: str, columns: List[str],
+               out: Optional[TextIO] = None) -> int:
+    """Write rows one at a time in a machine format; returns the row count."""
+    out = out or sys.stdout
+    count = 0
+
+    if output_format == 'ndjson':
+        for row in rows:
+            out.write(_dumps(row) + '\n')
+            count += 1
+    elif output_format == 'json':
+        out.write('[')
+        for row in rows:
+            out.write((',\n' if count else '\n') + _dumps(row))
+            count += 1
+        out.write('\n]\n' if count else ']\n')
+    elif output_format in ('csv', 'tsv'):
+        writer = csv.writer(out, delimiter='\t' if output_format == 'tsv' else ',',
+                            lineterminator='\n')
+        writer.writerow(columns)
+        for row in rows:
+            writer.writerow(['' if row.get(c) is None else row.get(c) for c in columns])
+            count += 1
+    else:
+        raise ValueError(f"Unsupported output format: {output_format}")
+
+    out.flush()
+    return count
+
+
+def emit_rows(rows: Iterable[Dict[str, Any]], output_format: str, columns: List[str],
+              error: str = "Error") -> int:
+    """write_rows() for commands: failures go to stderr with a non-zero exit."""
+    try:
+        return write_rows(rows, output_format, columns)
+    except click.ClickException:
+        raise
+    except Exception as e:
+        raise click.ClickException(f"{error}: {e}")
+
+
+def print_table(rows: Iterable[Dict[str, Any]], columns: List[str], title: Optional[str] = None,
+                error: str = "Error", empty: str = "No results") -> int:
+    """Render rows as a Rich table with one column per field; returns the row count."""
+    from rich.console import Console
+    from rich.table import Table
+
+    try:
+        rows = list(rows)
+    except Exception as e:
+        raise click.ClickException(f"{error}: {e}")
+    console = Console()
+    if not rows:
+        console.print(empty)
+        return 0
+    table = Table(title=title)
+    for column in columns:
+        table.add_column(column.replace('_', ' ').title(), style="cyan" if column == 'id' else None)
+    for row in rows:
+        table.add_row(*('-' if row.get(c) is None else str(row.get(c)) for c in columns))
+    console.print(table)
+    return len(rows)
@@ -0,0 +1,141 @@
+"""Row builders that turn stories and epics into flat records."""
+
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import click
+
+from sc.api.records import StoryDetail
+from sc.utils.common import get_workflow_index
+from sc.utils.resolver import EntityResolver
+from .base import emit_rows, print_table
+
+STORY_COLUMNS = ['id', 'name', 'type', 'state', 'owner', 'estimate', 'app_url']
+EPIC_COLUMNS = ['id', 'name', 'state', 'stories', 'completed', 'started_at', 'app_url']
+
+
+class _RowContext:
+    """Lookups shared by every row, each built only if a projected field needs it."""
+
+    def __init__(self, client):
+        self.client = client
+        self.resolver = EntityResolver(client)
+        self._workflow_index = None
+
+    @property
+    def workflow_index(self):
+        if self._workflow_index is None:
+            self._workflow_index = get_workflow_index(self.client)
+        return self._workflow_index
+
+
+def _label_names(story) -> Optional[str]:
+    labels = getattr(story, 'labels', None) or []
+    names = [label['name'] if isinstance(label, dict) else label.name for label in labels]
+    return ', '.join(names) or None
+
+
+def _tasks_done(story) -> Optional[str]:
+    tasks = getattr(story, 'tasks', None)
+    if not tasks:
+        return None
+    done = sum(1 for task in tasks if task.get('complete'))
+    return f"{done}/{len(tasks)}"
+
+
+def _attr(name: str) -> Callable:
+    return lambda story, ctx: getattr(story, name, None)
+
+
+# Projectable story fields: name -> (value getter, needs detail=full).
+# Full detail costs a much larger search payload; only the fields slim
+# results leave out ask for it.
+STORY_FIELDS: Dict[str, Tuple[Callable[[Any, _RowContext], Any], bool]] = {
+    'id': (_attr('id'), False),
+    'name': (_attr('name'), False),
+    'type': (_attr('story_type'), False),
+    'state': (lambda s, ctx: ctx.workflow_index.state_name(s.workflow_state_id, "Unknown"), False),
+    'owner': (lambda s, ctx: ctx.resolver.owner_name(s, None), False),
+    'owners': (lambda s, ctx: ', '.join(ctx.resolver.member_name(o) for o in s.owner_ids or []) or None,
+               False),
+    'estimate': (_attr('estimate'), False),
+    'epic': (lambda s, ctx: ctx.resolver.name('epic', getattr(s, 'epic_id', None)), False),
+    'iteration': (lambda s, ctx: ctx.resolver.name('iteration', getattr(s, 'iteration_id', None)), False),
+    'team': (lambda s, ctx: ctx.resolver.name('group', getattr(s, 'group_id', None)), False),
+    'labels': (lambda s, ctx: _label_names(s), False),
+    'blocked': (_attr('blocked'), False),
+    'archived': (_attr('archived'), False),
+    'created_at': (_attr('created_at'), False),
+    'updated_at': (_attr('updated_at'), False),
+    'started_at': (_attr('started_at'), False),
+    'completed_at': (_attr('completed_at'), False),
+    'deadline': (_attr('deadline'), False),
+    'app_url': (_attr('app_url'), False),
+    'description': (_attr('description'), True),
+    'requester': (lambda s, ctx: ctx.resolver.name('member', getattr(s, 'requested_by_id', None)), True),
+    'comments': (lambda s, ctx: len(getattr(s, 'comments', None) or []), True),
+    'tasks': (lambda s, ctx: _tasks_done(s), True),
+}
+
+
+def _parse_fields(ctx, param, value) -> Optional[List[str]]:
+    if not value:
+        return None
+    fields = [f.strip() for f in value.split(',') if f.strip()]
+    unknown = [f for f in fields if f not in STORY_FIELDS]
+    if unknown:
+        raise click.BadParameter(
+            f"unknown field(s) {', '.join(unknown)}; choose from {', '.join(STORY_FIELDS)}")
+    return fields
+
+
+def story_fields_option(f):
+    """Shared ``--fields`` projection option for story list commands."""
+    return click.option(
+        '--fields', callback=_parse_fields,
+        help=f"Comma-separated columns to show ({', '.join(STORY_FIELDS)}); "
+             "description, requester, comments and tasks fetch full story detail"
+    )(f)
+
+
+def story_detail(fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    """iter_search_stories() arguments for a projection: slim unless a field needs full detail."""
+    if fields and any(STORY_FIELDS[f][1] for f in fields):
+        return {'detail': 'full', 'decode': StoryDetail.from_dict}
+    return {'detail': 'slim'}
+
+
+def story_rows(client, stories: Iterable, fields: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
+    """Map stories to records, resolving names as they stream by.
+
+    Only the lookups the projected ``fields`` use are made: a projection
+    without state or owner columns never fetches workflows or members.
+    """
+    ctx = _RowContext(client)
+    getters = [(field, STORY_FIELDS[field][0]) for field in fields or STORY_COLUMNS]
+    for story in stories:
+        yield {field: getter(story, ctx) for field, getter in getters}
+
+
+def emit_stories(client, stories: Iterable, output_format: str, fields: Optional[List[str]] = None,
+                 title: Optional[str] = None, error: str = "Error searching stories") -> int:
+    """Render stories in any format, as the projected columns."""
+    columns = fields or STORY_COLUMNS
+    rows = story_rows(client, stories, columns)
+    if output_format == 'table':
+        return print_table(rows, columns, title=title, error=error, empty="No stories found")
+    return emit_rows(rows, output_format, columns, error=error)
+
+
+def epic_rows(epics: Iterable) -> Iterator[Dict[str, Any]]:
+    """Map epics to records."""
+    for epic in epics:
+        stats = getattr(epic, 'stats', None) or {}
+        yield {
+            'id': epic.id,
+            'name': epic.name,
+            'state': epic.state,
+            'stories': stats.get('num_stories_total'),
+            'completed': stats.get('num_stories_done'),
+            'started_at': getattr(epic, 'started_at', None),
+            'app_url': getattr(epic, 'app_url', None),
+        }
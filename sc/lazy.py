@@ -0,0 +1,80 @@
+"""Deferred imports so the CLI starts without loading every command."""
+
+import importlib
+import importlib.util
+import sys
+from typing import Dict, Tuple
+
+import click
+
+
+def lazy_import(name: str):
+    """Return a module that is only executed on first attribute access.
+
+    Use for heavy dependencies needed by a single command. The module is
+    registered in ``sys.modules`` right away, so later imports share it.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+class LazyGroup(click.Group):
+    """A click group whose subcommands are imported only when dispatched.
+
+    ``lazy_subcommands`` maps a command name to ``("module:attribute",
+    short help)``. The help text is kept here so ``--help`` and shell
+    completion can list commands without importing them.
+    """
+
+    def __init__(self, *args, lazy_subcommands: Dict[str, Tuple[str, str]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands and cmd_name not in self.commands:
+            self.add_command(self._load(cmd_name), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load(self, cmd_name):
+        path, _ = self.lazy_subcommands[cmd_name]
+        module_name, attribute = path.split(':')
+        command = getattr(importlib.import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            raise ValueError(f"{path} is not a click command")
+        return command
+
+    def format_commands(self, ctx, formatter):
+        rows = []
+        limit = formatter.width - 6 - max((len(name) for name in self.list_commands(ctx)), default=0)
+        for name in self.list_commands(ctx):
+            if name in self.commands:
+                command = self.commands[name]
+                if command.hidden:
+                    continue
+                rows.append((name, command.get_short_help_str(limit)))
+            else:
+                rows.append((name, self.lazy_subcommands[name][1]))
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+    def shell_complete(self, ctx, incomplete):
+        from click.shell_completion import CompletionItem
+
+        results = [
+            CompletionItem(name, help=self.lazy_subcommands[name][1] if name not in self.commands
+                           else self.commands[name].get_short_help_str())
+            for name in self.list_commands(ctx) if name.startswith(incomplete)
+        ]
+        results.extend(click.Command.shell_complete(self, ctx, incomplete))
+        return results
@@ -1,5 +1,5 @@
 """Utilities for Shortcut CLI."""
 
-from .client import get_client
+from .client import get_client, get_session, get_store
 
-__all__ = ['get_client']
\ No newline at end of file
+__all__ = ['get_client', 'get_session', 'get_store']
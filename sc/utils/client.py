@@ -1,21 +1,129 @@
 """Utility for getting the Shortcut API client."""
 
+import sys
+from typing import Optional
+
 import click
-from useshortcut.client import APIClient
 from rich.console import Console
+from sc.api import ShortcutClient, ReferenceCache, trace
+from sc.api.client import make_session
+from sc.api.memo import RequestMemo
+from sc.api.cache import CACHE_DIR, workspace_key
+from sc.api.ratelimit import RateLimiter
+from sc.api.store import LocalStore
 from sc.config import get_config
 
 console = Console()
 
+# Process-wide client settings, set once by the top-level `cli` group.
+_settings = {
+    'use_cache': True,
+    'debug': False,
+}
+_client = None
+_session = None
+_limiter = None
 
-def get_client() -> APIClient:
-    """Get Shortcut client with API token from config or environment."""
+
+def configure_client(**settings) -> None:
+    """Update client settings; the next get_client() call picks them up.
+
+    An unchanged configuration keeps the current client, so a long-lived
+    process (``sc daemon``) reuses it and the indexes built from it. Its
+    per-command memo of API responses is cleared either way.
+    """
+    global _client
+    if any(_settings.get(k) != v for k, v in settings.items()):
+        _client = None
+    elif _client is not None:
+        _client.memo.clear()
+    _settings.update(settings)
+
+
+def get_session():
+    """Get the process-wide pooled HTTP session.
+
+    Every API call - the typed client and any raw request - should go
+    through this session so connections are reused across calls.
+    """
+    global _session
+    if _session is None:
+        _session = make_session()
+    return _session
+
+
+def _debug_log(message: str) -> None:
+    click.echo(f"[rate-limit] {message}", err=True)
+
+
+def get_limiter() -> RateLimiter:
+    """Get the process-wide rate limiter shared by every API call."""
+    global _limiter
+    if _limiter is None:
+        settings = get_config().get_rate_limit()
+        _limiter = RateLimiter(**{k: v for k, v in settings.items()
+                                  if k in ('requests_per_minute', 'burst', 'max_concurrency', 'max_retries')})
+    _limiter.log = _debug_log if _settings['debug'] else None
+    return _limiter
+
+
+def report_limiter() -> None:
+    """Print the rate limiter's counters to stderr, if any request was made."""
+    if _limiter is None:
+        return
+    stats = _limiter.stats()
+    click.echo("[rate-limit] " + " ".join(f"{k}={v}" for k, v in stats.items()), err=True)
+
+
+def start_trace() -> None:
+    """Record requests and phase timings for this run (``sc --trace``)."""
+    global _client
+    trace.install().instrument_rendering()
+    _client = None  # rebuilt, and instrumented, by the next get_client()
+
+
+def report_trace(trace_file: Optional[str] = None) -> None:
+    """Print the trace summary to stderr and optionally write a Chrome trace file."""
+    tracer = trace.uninstall()
+    if tracer is None:
+        return
+    tracer.summary(sys.stderr)
+    if trace_file:
+        tracer.write_chrome_trace(trace_file)
+        click.echo(f"[trace] Chrome trace written to {trace_file}", err=True)
+
+
+def get_cache(token: str) -> ReferenceCache:
+    """Get the reference-data cache for the workspace behind a token."""
     config = get_config()
-    token = config.get_api_token()
-    
+    return ReferenceCache(CACHE_DIR / workspace_key(token), ttls=config.get_cache_ttls())
+
+
+def _get_token() -> str:
+    token = get_config().get_api_token()
     if not token:
         console.print("[red]Error: No API token found.[/red]")
         console.print("Set SHORTCUT_API_TOKEN environment variable or save token in ~/.config/shortcut/config.yml")
         raise click.Abort()
-    
-    return APIClient(api_token=token)
\ No newline at end of file
+    return token
+
+
+def get_store() -> LocalStore:
+    """Get the local story mirror for the current workspace."""
+    return LocalStore(CACHE_DIR / workspace_key(_get_token()) / "store.sqlite3")
+
+
+def get_client() -> ShortcutClient:
+    """Get Shortcut client with API token from config or environment."""
+    global _client
+    if _client is not None:
+        return _client
+
+    token = _get_token()
+    cache = get_cache(token) if _settings['use_cache'] else None
+    _client = ShortcutClient(api_token=token, base_url=get_config().get_api_url(), cache=cache,
+                             session=get_session(), limiter=get_limiter(), memo=RequestMemo())
+    tracer = trace.get_tracer()
+    if tracer is not None:
+        tracer.instrument_client(_client)
+    return _client
@@ -1,45 +1,109 @@
 """Common utilities for Shortcut CLI commands."""
 
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Set
 from rich.console import Console
+from sc.utils.lookup import NameNotFound, get_lookup_index
 
 console = Console()
 
 
+class WorkflowIndex:
+    """Workflow states indexed by id, lower-cased name and state type."""
+
+    def __init__(self, workflows):
+        self.workflows = list(workflows)
+        self.by_id = {}
+        self.workflow_by_state_id = {}
+        self._by_name: Dict[str, List] = {}
+        self._by_type: Dict[str, Set[int]] = {}
+        for workflow in self.workflows:
+            for state in workflow.states:
+                self.by_id[state.id] = state
+                self.workflow_by_state_id[state.id] = workflow
+                self._by_name.setdefault(state.name.lower(), []).append(state)
+                self._by_type.setdefault(state.type, set()).add(state.id)
+
+    def state_name(self, state_id: int, default: Optional[str] = None) -> Optional[str]:
+        """Name of a state, or default (the ID itself if not given) when unknown."""
+        state = self.by_id.get(state_id)
+        if state is not None:
+            return state.name
+        return default if default is not None else str(state_id)
+
+    def states_named(self, name: str, workflow: Optional[str] = None) -> List:
+        """States matching a name (case insensitive), optionally within one workflow.
+
+        ``workflow`` may be a workflow name or ID. A name of the form
+        ``"Workflow/State"`` is also accepted when no state has that exact name.
+        """
+        states = self._by_name.get(name.lower(), [])
+        if not states and workflow is None and '/' in name:
+            workflow, name = name.split('/', 1)
+            states = self._by_name.get(name.strip().lower(), [])
+        if workflow is not None:
+            wanted = str(workflow).lower()
+            states = [
+                s for s in states
+                if self.workflow_by_state_id[s.id].name.lower() == wanted
+                or str(self.workflow_by_state_id[s.id].id) == wanted
+            ]
+        return states
+
+    def state_id_by_name(self, name: str, workflow: Optional[str] = None) -> Optional[int]:
+        """First state ID matching a name, in workflow order."""
+        states = self.states_named(name.strip(), workflow)
+        return states[0].id if states else None
+
+    def state_ids_of_type(self, state_type: str) -> Set[int]:
+        """IDs of every state of a type (done, started, unstarted)."""
+        return self._by_type.get(state_type, set())
+
+    def state_type(self, state_id: int) -> Optional[str]:
+        state = self.by_id.get(state_id)
+        return state.type if state is not None else None
+
+
+# Built once per process (per client) by get_workflow_index()
+_workflow_index = None
+_workflow_index_client = None
+
+
+def get_workflow_index(client) -> WorkflowIndex:
+    """Get the shared workflow-state index, fetching workflows on first use."""
+    global _workflow_index, _workflow_index_client
+    if _workflow_index is None or _workflow_index_client is not client:
+        _workflow_index = WorkflowIndex(client.list_workflows())
+        _workflow_index_client = client
+    return _workflow_index
+
+
+def refresh_workflow_index(client) -> WorkflowIndex:
+    """Rebuild the shared workflow-state index, e.g. after workflows were re-fetched."""
+    global _workflow_index
+    _workflow_index = None
+    return get_workflow_index(client)
+
+
 def get_workflow_state_map(client) -> Dict[int, str]:
     """Get a mapping of workflow state IDs to names."""
-    state_map = {}
-    workflows = client.list_workflows()
-    for workflow in workflows:
-        for state in workflow.states:
-            state_map[state.id] = state.name
-    return state_map
+    return {state_id: state.name for state_id, state in get_workflow_index(client).by_id.items()}
 
 
-def get_state_id_by_name(client, state_name: str) -> Optional[int]:
+def get_state_id_by_name(client, state_name: str, workflow: Optional[str] = None) -> Optional[int]:
     """Find workflow state ID by name (case insensitive)."""
-    state_name_lower = state_name.lower()
-    workflows = client.list_workflows()
-    for workflow in workflows:
-        for state in workflow.states:
-            if state.name.lower() == state_name_lower:
-                return state.id
-    return None
+    return get_workflow_index(client).state_id_by_name(state_name, workflow)
 
 
 def get_member_id_by_name(client, member_name: str) -> Optional[str]:
-    """Find member ID by name or email (partial match)."""
-    if member_name == "@me":
-        # TODO: Get current user ID from API
+    """Find member ID by name, mention name, email or a fragment of one.
+
+    ``@me`` is the member who owns the API token. Raises AmbiguousName when
+    several members match about equally well.
+    """
+    try:
+        return get_lookup_index(client).resolve('member', member_name)
+    except NameNotFound:
         return None
-    
-    member_name_lower = member_name.lower()
-    members = client.list_members()
-    for member in members:
-        if (member_name_lower in member.profile.name.lower() or 
-            member_name_lower in member.profile.email_address.lower()):
-            return member.id
-    return None
 
 
 def format_story_id(story_id: str) -> str:
@@ -47,6 +111,15 @@ def format_story_id(story_id: str) -> str:
     return f"#{story_id}"
 
 
+def format_date(value, default: str = "-") -> str:
+    """``YYYY-MM-DD`` for an ISO timestamp string or a datetime.
+
+    The typed API models parse dates into datetimes while search records
+    and the local mirror keep the raw strings; this accepts both.
+    """
+    return str(value)[:10] if value else default
+
+
 def truncate_text(text: str, max_length: int = 60) -> str:
     """Truncate text with ellipsis if too long."""
     if len(text) > max_length:
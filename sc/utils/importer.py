@@ -0,0 +1,222 @@
+"""Story import: streaming row readers and name-to-ID resolution."""
+
+import csv
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import yaml
+
+from sc.utils.common import get_workflow_index
+
+# File extension -> input format.
+INPUT_FORMATS = {
+    '.csv': 'csv',
+    '.tsv': 'tsv',
+    '.yml': 'yaml',
+    '.yaml': 'yaml',
+    '.ndjson': 'ndjson',
+    '.jsonl': 'ndjson',
+}
+
+STORY_TYPES = ('feature', 'bug', 'chore')
+
+
+class RowError(ValueError):
+    """An input row that cannot be turned into a story."""
+
+
+def detect_format(path: str) -> Optional[str]:
+    return INPUT_FORMATS.get(Path(path).suffix.lower())
+
+
+def read_rows(path: str, fmt: str) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Yield ``(row number, row)`` pairs from a file without loading it whole.
+
+    Rows are numbered from 1: data lines for CSV/TSV (the header is not
+    counted), lines for NDJSON and items for YAML. A YAML file may hold
+    one list of rows or a stream of ``---``-separated documents; each
+    document is parsed as it is reached.
+    """
+    with open(path, newline='', encoding='utf-8') as f:
+        if fmt in ('csv', 'tsv'):
+            reader = csv.DictReader(f, delimiter='\t' if fmt == 'tsv' else ',')
+            for number, row in enumerate(reader, 1):
+                yield number, row
+        elif fmt == 'ndjson':
+            number = 0
+            for line in f:
+                if line.strip():
+                    number += 1
+                    yield number, json.loads(line)
+        elif fmt == 'yaml':
+            number = 0
+            for document in yaml.safe_load_all(f):
+                for row in document if isinstance(document, list) else [document]:
+                    if row is not None:
+                        number += 1
+                        yield number, row
+        else:
+            raise ValueError(f"Unknown input format '{fmt}'")
+
+
+def _names(value) -> List[str]:
+    """A list field given either as a list or as a comma-separated string."""
+    if value is None or value == '':
+        return []
+    if isinstance(value, (list, tuple)):
+        return [str(v).strip() for v in value if str(v).strip()]
+    return [v.strip() for v in str(value).split(',') if v.strip()]
+
+
+def _first(row: Dict[str, Any], *keys: str):
+    for key in keys:
+        value = row.get(key)
+        if value is not None and value != '':
+            return value
+    return None
+
+
+class StoryRowBuilder:
+    """Turns input rows into CreateStoryParams bodies.
+
+    Workflows, members, epics, iterations and groups are fetched once, in
+    parallel, through the cached client; every row is then resolved
+    locally. Names match case-insensitively and numeric IDs are accepted
+    anywhere a name is. Columns that are not story fields are ignored.
+    """
+
+    def __init__(self, client, workflow: Optional[str] = None):
+        self.workflow = workflow
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            index = pool.submit(get_workflow_index, client)
+            members = pool.submit(client.list_members)
+            epics = pool.submit(client.list_epics)
+            iterations = pool.submit(client.list_iterations)
+            groups = pool.submit(client.list_groups)
+            self.workflow_index = index.result()
+            self.members = self._member_index(members.result())
+            self.epics = self._name_index(epics.result())
+            self.iterations = self._name_index(iterations.result())
+            self.groups = self._name_index(groups.result())
+
+    @staticmethod
+    def _name_index(entities) -> Dict[str, Any]:
+        index = {}
+        for entity in entities:
+            index.setdefault(entity.name.lower(), entity.id)
+            index[str(entity.id)] = entity.id
+        return index
+
+    @staticmethod
+    def _member_index(members) -> Dict[str, str]:
+        index = {}
+        for member in members:
+            index[str(member.id)] = member.id
+            profile = getattr(member, 'profile', None)
+            for key in ('name', 'mention_name', 'email_address'):
+                value = getattr(profile, key, None) if profile else None
+                if value:
+                    index.setdefault(value.lower(), member.id)
+                    if key == 'mention_name':
+                        index.setdefault(f"@{value.lower()}", member.id)
+        return index
+
+    def _lookup(self, index: Dict[str, Any], value, kind: str):
+        found = index.get(str(value).strip().lower())
+        if found is None:
+            raise RowError(f"unknown {kind} '{value}'")
+        return found
+
+    def build(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """CreateStoryParams body for one row; raises RowError when it cannot be resolved."""
+        name = _first(row, 'name', 'title')
+        if not name:
+            raise RowError("missing name")
+        body = {'name': str(name)}
+
+        description = _first(row, 'description')
+        if description:
+            body['description'] = str(description)
+
+        story_type = _first(row, 'story_type', 'type')
+        if story_type:
+            story_type = str(story_type).lower()
+            if story_type not in STORY_TYPES:
+                raise RowError(f"unknown story type '{story_type}'")
+            body['story_type'] = story_type
+
+        state = _first(row, 'state', 'workflow_state')
+        if state:
+            state_id = self.workflow_index.state_id_by_name(str(state), self.workflow)
+            if state_id is None:
+                raise RowError(f"unknown workflow state '{state}'")
+            body['workflow_state_id'] = state_id
+
+        owners = _names(_first(row, 'owners', 'owner'))
+        if owners:
+            body['owner_ids'] = [self._lookup(self.members, o, 'member') for o in owners]
+
+        requester = _first(row, 'requested_by')
+        if requester:
+            body['requested_by_id'] = self._lookup(self.members, requester, 'member')
+
+        for key, index, kind in (('epic', self.epics, 'epic'),
+                                 ('iteration', self.iterations, 'iteration')):
+            value = _first(row, key, f'{key}_id')
+            if value:
+                body[f'{key}_id'] = self._lookup(index, value, kind)
+
+        group = _first(row, 'team', 'group', 'group_id')
+        if group:
+            body['group_id'] = self._lookup(self.groups, group, 'team')
+
+        labels = _names(_first(row, 'labels', 'label'))
+        if labels:
+            body['labels'] = [{'name': label} for label in labels]
+
+        estimate = _first(row, 'estimate')
+        if estimate is not None:
+            try:
+                body['estimate'] = int(estimate)
+            except (TypeError, ValueError):
+                raise RowError(f"estimate '{estimate}' is not a number")
+
+        for key in ('deadline', 'external_id'):
+            value = _first(row, key)
+            if value:
+                body[key] = str(value)
+        return body
+
+
+def default_mapping_path(path: str) -> str:
+    return f"{path}.ids.csv"
+
+
+def read_mapping(path: str) -> Dict[int, int]:
+    """Rows already imported according to a mapping file (row number -> story ID)."""
+    if not os.path.exists(path):
+        return {}
+    with open(path, newline='', encoding='utf-8') as f:
+        return {int(r['row']): int(r['story_id']) for r in csv.DictReader(f) if r.get('story_id')}
+
+
+class MappingWriter:
+    """Appends ``row,story_id,name`` lines to a mapping file as stories are created."""
+
+    def __init__(self, path: str):
+        new = not os.path.exists(path) or os.path.getsize(path) == 0
+        self._file = open(path, 'a', newline='', encoding='utf-8')
+        self._writer = csv.writer(self._file)
+        if new:
+            self._writer.writerow(['row', 'story_id', 'name'])
+
+    def write(self, pairs) -> None:
+        for row_number, story in pairs:
+            self._writer.writerow([row_number, story['id'], story.get('name', '')])
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
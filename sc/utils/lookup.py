@@ -0,0 +1,251 @@
+"""Fuzzy name lookup for members, epics, labels, iterations and groups.
+
+Each kind is indexed once per client from its (reference-cached) list
+call. Names, mention names and emails are normalised (case and accents
+folded) and indexed whole, by word, by word prefix and by trigram, so an
+exact name or ID is a dictionary hit and a partial or misspelt one is
+ranked instead of scanned for.
+"""
+
+import re
+import unicodedata
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import click
+
+# Entity kind -> bulk list method on the API client
+LOADERS = {
+    'member': 'list_members',
+    'epic': 'list_epics',
+    'label': 'list_labels',
+    'iteration': 'list_iterations',
+    'group': 'list_groups',
+}
+# Reference-cache collection -> the kind indexed from it
+KINDS_BY_COLLECTION = {loader[len('list_'):]: kind for kind, loader in LOADERS.items()}
+# How kinds are named in messages
+KIND_LABELS = {'group': 'team'}
+
+# Scores. An exact name, email or ID beats whole-word matches, which beat
+# word prefixes, which beat trigram similarity (scaled below PREFIX).
+EXACT = 1.0
+WORDS = 0.9
+PREFIX = 0.8
+MIN_SIMILARITY = 0.3
+# Archived and disabled entities rank just below active ones
+INACTIVE_PENALTY = 0.02
+# How a match was found, in the order resolve() trusts them. Trigram
+# matches are only ever suggestions: "Sprint 13" is close to "Sprint 12".
+RESOLVABLE = ('exact', 'word', 'prefix')
+SUGGESTIONS = 3
+
+
+@dataclass
+class Match:
+    """One ranked lookup result."""
+    kind: str
+    id: Any
+    name: str
+    score: float
+    via: str  # 'exact' (name, email or ID), 'word', 'prefix' or 'trigram'
+
+
+class NameNotFound(click.ClickException):
+    def __init__(self, kind: str, query: str, suggestions: Sequence[Match] = ()):
+        message = f"Could not find {KIND_LABELS.get(kind, kind)} '{query}'"
+        if suggestions:
+            message += ". Did you mean: " + "; ".join(f"{m.name} [{m.id}]" for m in suggestions) + "?"
+        super().__init__(message)
+        self.kind = kind
+        self.query = query
+        self.suggestions = list(suggestions)
+
+
+class AmbiguousName(click.ClickException):
+    """Several entities match a name about equally well."""
+
+    def __init__(self, kind: str, query: str, matches: List[Match]):
+        choices = "; ".join(f"{m.name} [{m.id}]" for m in matches)
+        super().__init__(f"'{query}' matches several {KIND_LABELS.get(kind, kind)}s: {choices}. "
+                         "Use a longer name or the ID.")
+        self.kind = kind
+        self.query = query
+        self.matches = matches
+
+
+def normalize(text: str) -> str:
+    """Case-folded text with accents removed and whitespace collapsed."""
+    decomposed = unicodedata.normalize('NFKD', str(text))
+    folded = ''.join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+    return ' '.join(folded.split())
+
+
+def words(text: str) -> List[str]:
+    return re.findall(r'\w+', text)
+
+
+def trigrams(text: str) -> Set[str]:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _describe(kind: str, entity):
+    """Display name, lookup keys and whether an entity is active."""
+    if kind == 'member':
+        profile = entity.profile
+        name = getattr(profile, 'name', None) or str(entity.id)
+        email = getattr(profile, 'email_address', None)
+        keys = [name, getattr(profile, 'mention_name', None), email]
+        display = f"{name} <{email}>" if email else name
+        return display, keys, not getattr(entity, 'disabled', False)
+    keys = [entity.name, getattr(entity, 'mention_name', None)]
+    return entity.name, keys, not getattr(entity, 'archived', False)
+
+
+class KindIndex:
+    """Lookup tables for the entities of one kind."""
+
+    def __init__(self, kind: str, entities: Iterable):
+        self.kind = kind
+        self.ids: List[Any] = []
+        self.names: List[str] = []
+        self.active: List[bool] = []
+        self.by_id: Dict[str, int] = {}
+        self.exact: Dict[str, Set[int]] = {}
+        self.prefixes: Dict[str, Set[int]] = {}
+        self.words: List[Set[str]] = []
+        self.lengths: List[int] = []
+        self.keys: List[tuple] = []  # (entry, trigrams) per normalised key
+        self.trigrams: Dict[str, Set[int]] = {}
+
+        for entry, entity in enumerate(entities):
+            display, keys, active = _describe(kind, entity)
+            self.ids.append(entity.id)
+            self.names.append(display)
+            self.active.append(active)
+            self.by_id[str(entity.id).lower()] = entry
+            entity_words = set()
+            for key in (normalize(k) for k in keys if isinstance(k, str) and k):
+                self.exact.setdefault(key, set()).add(entry)
+                entity_words.update(words(key))
+                grams = trigrams(key)
+                for gram in grams:
+                    self.trigrams.setdefault(gram, set()).add(len(self.keys))
+                self.keys.append((entry, grams))
+            for word in entity_words:
+                for end in range(1, len(word) + 1):
+                    self.prefixes.setdefault(word[:end], set()).add(entry)
+            self.words.append(entity_words)
+            primary = keys[0] if isinstance(keys[0], str) else ''
+            self.lengths.append(sum(map(len, words(normalize(primary)))) or 1)
+
+    def _scores(self, query: str) -> Dict[int, Tuple[float, str]]:
+        """Score and kind of hit for each matching entry."""
+        if query in self.by_id:
+            return {self.by_id[query]: (EXACT, 'exact')}
+
+        scores = {}
+        query_words = words(query)
+        if query_words:
+            typed = sum(map(len, query_words))
+            for entry in set.intersection(*(self.prefixes.get(w, set()) for w in query_words)):
+                whole = all(w in self.words[entry] for w in query_words)
+                # Prefer the entity whose name the query covers most of
+                scores[entry] = ((WORDS if whole else PREFIX) - 0.04 * (1 - min(1.0, typed / self.lengths[entry])),
+                                 'word' if whole else 'prefix')
+        for entry in self.exact.get(query, ()):
+            scores[entry] = (EXACT, 'exact')
+        if scores:
+            return scores
+
+        # No word matches: fall back to trigram similarity (typos, infixes)
+        grams = trigrams(query)
+        shared: Dict[int, int] = {}
+        for gram in grams:
+            for key in self.trigrams.get(gram, ()):
+                shared[key] = shared.get(key, 0) + 1
+        for key, count in shared.items():
+            entry, key_grams = self.keys[key]
+            similarity = count / (len(grams) + len(key_grams) - count)
+            if similarity >= MIN_SIMILARITY and PREFIX * similarity > scores.get(entry, (0.0,))[0]:
+                scores[entry] = (PREFIX * similarity, 'trigram')
+        return scores
+
+    def search(self, query: str, limit: Optional[int] = 10) -> List[Match]:
+        """Entities matching ``query``, best first."""
+        scores = self._scores(normalize(query))
+        matches = [
+            Match(self.kind, self.ids[entry], self.names[entry],
+                  round(score - (0 if self.active[entry] else INACTIVE_PENALTY), 4), via)
+            for entry, (score, via) in scores.items()
+        ]
+        matches.sort(key=lambda m: (-m.score, m.name.lower()))
+        return matches[:limit] if limit else matches
+
+
+class LookupIndex:
+    """Name lookup over every kind, each built on first use from the client's list call."""
+
+    def __init__(self, client):
+        self.client = client
+        self._kinds: Dict[str, KindIndex] = {}
+        self._me: Optional[str] = None
+
+    def load(self, kind: str) -> KindIndex:
+        if kind not in self._kinds:
+            self._kinds[kind] = KindIndex(kind, getattr(self.client, LOADERS[kind])())
+        return self._kinds[kind]
+
+    def invalidate(self, kind: Optional[str] = None) -> None:
+        """Drop one kind (or all) so it is rebuilt from fresh data on next use."""
+        if kind is None:
+            self._kinds.clear()
+        else:
+            self._kinds.pop(kind, None)
+
+    def me(self) -> str:
+        """ID of the member who owns the API token (``GET /member``, cached)."""
+        if self._me is None:
+            self._me = self.client.get_current_member().id
+        return self._me
+
+    def search(self, kind: str, query: str, limit: Optional[int] = 10) -> List[Match]:
+        return self.load(kind).search(query, limit)
+
+    def name(self, kind: str, entity_id) -> str:
+        """Display name for an ID, or the ID itself when it is not indexed."""
+        index = self.load(kind)
+        entry = index.by_id.get(str(entity_id).lower())
+        return index.names[entry] if entry is not None else str(entity_id)
+
+    def resolve(self, kind: str, query: str):
+        """ID for an ID, a name or a whole word or prefix of one, or ``@me`` for members.
+
+        Only an unambiguous hit is resolved: the single exact match, else the
+        single whole-word match, else the single prefix match. Raises
+        AmbiguousName when that tier holds several, and NameNotFound (with
+        close names as suggestions) when nothing but typo-level matches exist.
+        """
+        if kind == 'member' and query.strip().lower() == '@me':
+            return self.me()
+        matches = self.search(kind, query, limit=None)
+        for via in RESOLVABLE:
+            tier = [m for m in matches if m.via == via]
+            if len(tier) == 1:
+                return tier[0].id
+            if tier:
+                raise AmbiguousName(kind, query, tier[:6])
+        raise NameNotFound(kind, query, suggestions=matches[:SUGGESTIONS])
+
+
+# Built once per process (per client) by get_lookup_index()
+_lookup_index = None
+
+
+def get_lookup_index(client) -> LookupIndex:
+    """Get the shared lookup index for a client."""
+    global _lookup_index
+    if _lookup_index is None or _lookup_index.client is not client:
+        _lookup_index = LookupIndex(client)
+    return _lookup_index
@@ -0,0 +1,79 @@
+"""Batched ID-to-name resolution for table rendering."""
+
+from typing import Dict, Iterable, Optional, Sequence, Set
+
+from sc.utils.lookup import LOADERS
+
+
+def _entity_name(kind: str, entity) -> str:
+    if kind == 'member':
+        return entity.profile.name if entity.profile else entity.id
+    return entity.name
+
+
+class EntityResolver:
+    """Resolves member, epic, iteration and group IDs with one bulk call per kind.
+
+    IDs can be queued up front with ``collect()`` and fetched together by
+    ``resolve()``; a lookup for a kind that has not been loaded yet loads it
+    on demand. Either way a table of any length costs at most one request
+    per kind.
+    """
+
+    def __init__(self, client):
+        self.client = client
+        self._pending: Dict[str, Set] = {kind: set() for kind in LOADERS}
+        self._names: Dict[str, Dict] = {kind: {} for kind in LOADERS}
+        self._loaded: Set[str] = set()
+
+    def load(self, kind: str, entity_id) -> None:
+        """Queue an ID to be resolved by the next ``resolve()``."""
+        if entity_id is not None and kind not in self._loaded:
+            self._pending[kind].add(entity_id)
+
+    def collect(self, stories: Iterable, kinds: Sequence[str]) -> None:
+        """Queue the IDs of the given kinds (member, epic, iteration, group) referenced by stories.
+
+        Name only the kinds the table renders: each one queued costs a bulk call.
+        """
+        fields = {'epic': 'epic_id', 'iteration': 'iteration_id', 'group': 'group_id'}
+        for story in stories:
+            if 'member' in kinds:
+                for owner_id in getattr(story, 'owner_ids', None) or []:
+                    self.load('member', owner_id)
+            for kind, field in fields.items():
+                if kind in kinds:
+                    self.load(kind, getattr(story, field, None))
+
+    def _load_kind(self, kind: str) -> None:
+        self._loaded.add(kind)
+        self._pending[kind].clear()
+        try:
+            entities = getattr(self.client, LOADERS[kind])()
+        except Exception:
+            return
+        self._names[kind] = {e.id: _entity_name(kind, e) for e in entities}
+
+    def resolve(self) -> None:
+        """Bulk-load every kind that has queued IDs."""
+        for kind, pending in self._pending.items():
+            if pending and kind not in self._loaded:
+                self._load_kind(kind)
+
+    def name(self, kind: str, entity_id, default: Optional[str] = None) -> Optional[str]:
+        """Name for an ID; unknown IDs fall back to default or the ID itself."""
+        if entity_id is None:
+            return default
+        if kind not in self._loaded:
+            self._load_kind(kind)
+        return self._names[kind].get(entity_id, default if default is not None else str(entity_id))
+
+    def member_name(self, member_id, default: Optional[str] = None) -> Optional[str]:
+        return self.name('member', member_id, default)
+
+    def owner_name(self, story, default: str = "Unassigned") -> str:
+        """Name of a story's first owner."""
+        owner_ids = getattr(story, 'owner_ids', None)
+        if not owner_ids:
+            return default
+        return self.member_name(owner_ids[0])
@@ -0,0 +1,46 @@
+"""Streaming aggregation over stories."""
+
+from collections import Counter
+from typing import Dict, Iterable
+
+
+class StoryStats:
+    """Running counts and point sums over a stream of stories.
+
+    Each story updates a few counters and is then dropped, so memory stays
+    constant however many stories flow through. Counters are keyed by
+    state ID and story type; state names are only resolved for display.
+    """
+
+    def __init__(self, workflow_index):
+        self.workflow_index = workflow_index
+        self._done_ids = workflow_index.state_ids_of_type("done")
+        self.total = 0
+        self.completed = 0
+        self.points = 0
+        self.completed_points = 0
+        self.by_type: Counter = Counter()
+        self.by_state_id: Counter = Counter()
+
+    def add(self, story) -> None:
+        estimate = story.estimate or 0
+        self.total += 1
+        self.points += estimate
+        if story.workflow_state_id in self._done_ids:
+            self.completed += 1
+            self.completed_points += estimate
+        self.by_type[story.story_type] += 1
+        self.by_state_id[story.workflow_state_id] += 1
+
+    def consume(self, stories: Iterable) -> 'StoryStats':
+        for story in stories:
+            self.add(story)
+        return self
+
+    def by_state(self) -> Dict[str, int]:
+        """Story counts per state name, in order of first appearance."""
+        counts: Dict[str, int] = {}
+        for state_id, count in self.by_state_id.items():
+            name = self.workflow_index.state_name(state_id, "Unknown")
+            counts[name] = counts.get(name, 0) + count
+        return counts
@@ -0,0 +1,173 @@
+"""Velocity and throughput across iterations, aggregated column by column.
+
+Every story in the selected iterations is reduced to a handful of facts
+and laid out as parallel columns (iteration index, points, done flag,
+type code, team code). Totals, rolling means and percentiles are then
+whole-column operations: NumPy when it is installed, plain ``array``
+loops otherwise.
+"""
+
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sc.utils.common import format_date
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+# Iterations fetched at once; the client's rate limiter still applies.
+FETCH_WORKERS = 8
+
+
+def story_facts(story: Dict[str, Any], end_date) -> List[Any]:
+    """``[points, done, carried_in, story_type, group_id]`` for one story.
+
+    A story counts as done for the iteration only if it was completed by
+    the iteration's end date; carried in means it sat in an earlier
+    iteration first.
+    """
+    completed_at = story.get('completed_at')
+    end = format_date(end_date, '')
+    done = bool(story.get('completed')) and not (end and completed_at and format_date(completed_at) > end)
+    return [
+        story.get('estimate') or 0,
+        int(done),
+        int(bool(story.get('previous_iteration_ids'))),
+        story.get('story_type'),
+        story.get('group_id'),
+    ]
+
+
+def load_iteration_facts(client, store, iterations: Sequence, workers: int = FETCH_WORKERS
+                         ) -> Tuple[Dict[int, List[List[Any]]], int]:
+    """Facts per iteration ID, plus how many came from the local cache.
+
+    Finished iterations are immutable, so their facts are read from and
+    written to the local store; the rest are fetched concurrently.
+    """
+    done_ids = [i.id for i in iterations if i.status == 'done']
+    facts = store.get_iteration_facts(done_ids)
+    cached = len(facts)
+    missing = [i for i in iterations if i.id not in facts]
+
+    def fetch(iteration):
+        stories = client._make_request('GET', f'/iterations/{iteration.id}/stories')
+        return [story_facts(s, iteration.end_date) for s in stories]
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        for iteration, rows in zip(missing, pool.map(fetch, missing)):
+            facts[iteration.id] = rows
+            if iteration.status == 'done':
+                store.set_iteration_facts(iteration.id, rows)
+    return facts, cached
+
+
+def _bincount(index, weights, length: int) -> List[float]:
+    if np is not None:
+        return np.bincount(index, weights=weights, minlength=length).tolist()
+    totals = [0.0] * length
+    for i, w in zip(index, weights):
+        totals[i] += w
+    return totals
+
+
+def rolling_mean(values: Sequence[float], window: int) -> List[Optional[float]]:
+    """Trailing mean over ``window`` values; None until a full window is available."""
+    n = len(values)
+    if window <= 0 or n < window:
+        return [None] * n
+    if np is not None:
+        sums = np.cumsum(np.concatenate(([0.0], np.asarray(values, dtype=float))))
+        means = ((sums[window:] - sums[:-window]) / window).tolist()
+    else:
+        means, total = [], sum(values[:window])
+        means.append(total / window)
+        for i in range(window, n):
+            total += values[i] - values[i - window]
+            means.append(total / window)
+    return [None] * (window - 1) + means
+
+
+def percentile(values: Sequence[float], q: float) -> Optional[float]:
+    """Linear-interpolated percentile (NumPy's default method)."""
+    if not len(values):
+        return None
+    if np is not None:
+        return float(np.percentile(values, q))
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+class VelocityTable:
+    """Story facts for a run of iterations, stored as parallel columns."""
+
+    def __init__(self, iterations: Sequence, facts: Dict[int, List[List[Any]]]):
+        self.iterations = list(iterations)
+        self.types: List[Optional[str]] = []
+        self.teams: List[Optional[str]] = []
+        type_codes: Dict[Optional[str], int] = {}
+        team_codes: Dict[Optional[str], int] = {}
+
+        index, points, done, carried = array('q'), array('d'), array('d'), array('d')
+        type_col, team_col = array('q'), array('q')
+        for n, iteration in enumerate(self.iterations):
+            for estimate, is_done, carried_in, story_type, group_id in facts.get(iteration.id, ()):
+                index.append(n)
+                points.append(estimate)
+                done.append(is_done)
+                carried.append(carried_in)
+                if story_type not in type_codes:
+                    type_codes[story_type] = len(self.types)
+                    self.types.append(story_type)
+                type_col.append(type_codes[story_type])
+                if group_id not in team_codes:
+                    team_codes[group_id] = len(self.teams)
+                    self.teams.append(group_id)
+                team_col.append(team_codes[group_id])
+
+        if np is not None:
+            index, points, done, carried, type_col, team_col = (
+                np.frombuffer(c, dtype=np.int64 if c.typecode == 'q' else np.float64)
+                if len(c) else np.zeros(0, dtype=np.int64 if c.typecode == 'q' else np.float64)
+                for c in (index, points, done, carried, type_col, team_col)
+            )
+        self.index, self.points, self.done, self.carried = index, points, done, carried
+        self.type_col, self.team_col = type_col, team_col
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def _done_points(self):
+        if np is not None:
+            return self.points * self.done
+        return array('d', (p * d for p, d in zip(self.points, self.done)))
+
+    def per_iteration(self) -> Dict[str, List[float]]:
+        """Committed, completed, carry-over and carried-in points, and stories done, per iteration."""
+        n = len(self.iterations)
+        done_points = self._done_points()
+        carried_points = (self.points * self.carried if np is not None
+                          else array('d', (p * c for p, c in zip(self.points, self.carried))))
+        committed = _bincount(self.index, self.points, n)
+        completed = _bincount(self.index, done_points, n)
+        return {
+            'committed': committed,
+            'completed': completed,
+            'carry_over': [c - d for c, d in zip(committed, completed)],
+            'carried_in': _bincount(self.index, carried_points, n),
+            'stories_done': _bincount(self.index, self.done, n),
+        }
+
+    def throughput(self, by: str = 'type') -> List[Tuple[Optional[str], float, float]]:
+        """``(label, stories done, points done)`` per story type or team, busiest first."""
+        labels, codes = (self.types, self.type_col) if by == 'type' else (self.teams, self.team_col)
+        stories = _bincount(codes, self.done, len(labels))
+        points = _bincount(codes, self._done_points(), len(labels))
+        rows = list(zip(labels, stories, points))
+        return sorted(rows, key=lambda r: (-r[1], -r[2]))
@@ -22,9 +22,13 @@ setup(
     install_requires=[
         "click",
     ],
+    extras_require={
+        "fast": ["orjson"],
+        "stats": ["numpy"],
+    },
     entry_points={
         "console_scripts": [
-            "sc=sc.cli:cli",
+            "sc=sc.cli:main",
         ],
     },
 )
\ No newline at end of file
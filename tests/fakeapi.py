@@ -0,0 +1,735 @@
+"""A local stand-in for the Shortcut API, for scale and performance tests.
+
+``Workspace`` builds a synthetic workspace of any size; ``FakeShortcut``
+serves it over HTTP on 127.0.0.1 so the real client, rate limiter and
+commands run end to end without network access::
+
+    with FakeShortcut(Workspace(stories=10_000, members=500)) as api:
+        client = api.client()
+        ...
+        assert api.count('GET', '/iterations/1/stories') == 1
+
+Every response is shaped by ``shortcut-api-v3.yaml``: the route's
+response definition gives the payload its required fields (with empty
+values) and the workspace fills in the ones the CLI reads, so slim and
+full variants differ exactly as the spec says. The server follows
+``next`` cursors on the search endpoints up to the spec's 1000-result
+limit (past it, the 400 maximum-results-exceeded error), accepts the
+bulk endpoints, and can add latency or answer with 429s to exercise
+backoff. Every request is logged with its status and response size.
+"""
+
+import gzip
+import json
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+import yaml
+
+SPEC = Path(__file__).resolve().parents[1] / "shortcut-api-v3.yaml"
+API_PREFIX = "/api/v3"
+TOKEN = "fake-token"
+EPOCH = "2024-01-01T00:00:00Z"
+STORY_TYPES = ('feature', 'bug', 'chore')
+# Largest batches the real API accepts
+MAX_PAGE_SIZE = 250
+MAX_BULK = 100
+STORY_SEARCH_CAP = 1000
+# GET /search/* answers maximum-results-exceeded past this many hits
+MAX_SEARCH_RESULTS = 1000
+
+
+@lru_cache(maxsize=None)
+def load_spec(path: Path = SPEC) -> Dict[str, Any]:
+    with open(path, encoding='utf-8') as f:
+        return yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+
+
+class Shapes:
+    """Spec-derived payload skeletons, one per definition."""
+
+    def __init__(self, spec: Dict[str, Any]):
+        self.spec = spec
+        self.definitions = spec['definitions']
+        self._skeletons: Dict[str, Dict[str, Any]] = {}
+        self._properties: Dict[str, frozenset] = {}
+
+    def _value(self, prop: Dict[str, Any], depth: int) -> Any:
+        if '$ref' in prop:
+            return self.skeleton(prop['$ref'].rsplit('/', 1)[-1], depth + 1) if depth < 3 else {}
+        if prop.get('x-nullable'):
+            return None
+        kind = prop.get('type')
+        if kind == 'array':
+            return []
+        if kind == 'object':
+            return {}
+        if kind == 'boolean':
+            return False
+        if kind in ('integer', 'number'):
+            return 0
+        if prop.get('format') == 'date-time':
+            return EPOCH
+        if prop.get('enum'):
+            return prop['enum'][0]
+        return ''
+
+    def skeleton(self, name: str, depth: int = 0) -> Dict[str, Any]:
+        """Every required field of a definition, with an empty value of its type."""
+        if name not in self._skeletons:
+            definition = self.definitions[name]
+            properties = definition.get('properties', {})
+            self._skeletons[name] = {
+                field: self._value(properties[field], depth) for field in definition.get('required', ())
+            }
+        return self._skeletons[name]
+
+    def properties(self, name: str) -> frozenset:
+        if name not in self._properties:
+            self._properties[name] = frozenset(self.definitions[name].get('properties', {}))
+        return self._properties[name]
+
+    def render(self, name: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """``data`` as definition ``name``: required defaults plus the fields it defines."""
+        properties = self.properties(name)
+        return {**self.skeleton(name), **{k: v for k, v in data.items() if k in properties}}
+
+    def response(self, method: str, template: str) -> Tuple[Optional[str], bool]:
+        """``(definition, is_array)`` of a route's success response in the spec."""
+        operation = self.spec['paths'][API_PREFIX + template][method.lower()]
+        for status, response in operation['responses'].items():
+            if str(status).startswith('2'):
+                schema = response.get('schema')
+                if not schema:
+                    return None, False
+                if schema.get('type') == 'array':
+                    return schema['items']['$ref'].rsplit('/', 1)[-1], True
+                return schema['$ref'].rsplit('/', 1)[-1], False
+        return None, False
+
+
+def _uuid(kind: int, n: int) -> str:
+    return f"00000000-0000-4000-{8000 + kind:04x}-{n:012d}"
+
+
+def _instant(stamp: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(stamp.replace('Z', '+00:00')) if stamp else None
+
+
+def _day(offset: int) -> str:
+    return time.strftime('%Y-%m-%dT00:00:00Z', time.gmtime(1704067200 + offset * 86400))
+
+
+class Workspace:
+    """A synthetic workspace: members, teams, workflows, projects, epics, iterations, labels and stories.
+
+    Generation is seeded, so the same sizes always give the same data.
+    Entities are plain dicts holding the fields the CLI reads; the server
+    shapes them per response. ``me`` is the member the token belongs to.
+    """
+
+    def __init__(self, stories: int = 100, members: int = 10, groups: int = 3, epics: int = 5,
+                 iterations: int = 6, labels: int = 8, projects: int = 2, seed: int = 0):
+        rng = random.Random(seed)
+        self.lock = threading.RLock()
+
+        self.workflows = [self._workflow(w) for w in range(1, 3)]
+        self.members = {}
+        for n in range(members):
+            member_id = _uuid(1, n)
+            self.members[member_id] = {
+                'id': member_id, 'role': 'owner' if n == 0 else 'member', 'disabled': False,
+                'state': 'full', 'group_ids': [], 'created_at': EPOCH, 'updated_at': EPOCH,
+                'profile': {'id': member_id, 'name': f"Member {n}", 'mention_name': f"member{n}",
+                            'email_address': f"member{n}@example.com", 'deactivated': False},
+            }
+        member_ids = list(self.members)
+        self.me = member_ids[0] if member_ids else None
+
+        self.groups = {}
+        for n in range(groups):
+            group_id = _uuid(2, n)
+            owners = member_ids[n::max(groups, 1)]
+            self.groups[group_id] = {
+                'id': group_id, 'name': f"Team {n}", 'mention_name': f"team{n}", 'archived': False,
+                'member_ids': owners, 'workflow_ids': [self.workflows[n % 2]['id']],
+                'description': '',
+            }
+            for member_id in owners:
+                self.members[member_id]['group_ids'].append(group_id)
+        group_ids = list(self.groups)
+
+        self.labels = {n: {'id': n, 'name': f"label-{n}", 'color': '#cccccc', 'archived': False,
+                           'created_at': EPOCH, 'updated_at': EPOCH}
+                       for n in range(1, labels + 1)}
+        self.projects = {n: {'id': n, 'name': f"Project {n}", 'archived': False, 'description': '',
+                             'workflow_id': self.workflows[0]['id'], 'created_at': EPOCH, 'updated_at': EPOCH,
+                             'app_url': f"https://app.shortcut.com/fake/project/{n}"}
+                         for n in range(1, projects + 1)}
+        self.epics = {n: {'id': n, 'name': f"Epic {n}", 'state': ('to do', 'in progress', 'done')[n % 3],
+                          'description': '', 'archived': False, 'owner_ids': member_ids[:1],
+                          'project_ids': list(self.projects)[:1],
+                          'group_ids': group_ids[:1], 'created_at': EPOCH, 'updated_at': EPOCH,
+                          'app_url': f"https://app.shortcut.com/fake/epic/{n}"}
+                      for n in range(1, epics + 1)}
+
+        # Fortnightly iterations ending before "today", except the last two
+        self.iterations = {}
+        for n in range(1, iterations + 1):
+            status = 'done' if n < iterations - 1 else 'started' if n == iterations - 1 else 'unstarted'
+            self.iterations[n] = {
+                'id': n, 'name': f"Sprint {n}", 'status': status, 'description': '',
+                'start_date': _day((n - 1) * 14), 'end_date': _day(n * 14 - 1),
+                'group_ids': [group_ids[n % len(group_ids)]] if group_ids else [],
+                'created_at': EPOCH, 'updated_at': EPOCH,
+                'app_url': f"https://app.shortcut.com/fake/iteration/{n}",
+            }
+
+        self.stories: Dict[int, Dict[str, Any]] = {}
+        self._next_id = 1000
+        for n in range(stories):
+            workflow = self.workflows[n % 2]
+            state = rng.choice(workflow['states'])
+            iteration_id = rng.choice([None, *self.iterations]) if self.iterations else None
+            self.add_story({
+                'name': f"Story {n} {rng.choice(('fix', 'add', 'remove', 'refactor'))} "
+                        f"{rng.choice(('login', 'search', 'billing', 'export', 'sync'))}",
+                'description': f"Synthetic story {n}.",
+                'story_type': STORY_TYPES[n % 3],
+                'workflow_id': workflow['id'],
+                'workflow_state_id': state['id'],
+                'owner_ids': rng.sample(member_ids, k=min(len(member_ids), rng.choice((0, 1, 1, 2)))),
+                'requested_by_id': self.me,
+                'estimate': rng.choice((None, 1, 2, 3, 5, 8)),
+                'epic_id': rng.choice([None, *self.epics]) if self.epics else None,
+                'iteration_id': iteration_id,
+                'previous_iteration_ids': [iteration_id - 1] if iteration_id and iteration_id > 1
+                                          and rng.random() < 0.2 else [],
+                'group_id': rng.choice(group_ids) if group_ids else None,
+                'labels': [self.labels[i] for i in
+                           rng.sample(list(self.labels), k=min(len(self.labels), rng.choice((0, 1, 2))))],
+                'completed': state['type'] == 'done',
+                'started': state['type'] != 'unstarted',
+                'created_at': _day(n % 180),
+                # Distinct, increasing timestamps so incremental sync has a cursor
+                'updated_at': _day(n % 180).replace('00:00:00', f"{n // 3600 % 24:02d}:{n // 60 % 60:02d}:{n % 60:02d}"),
+            })
+
+    @staticmethod
+    def _workflow(n: int) -> Dict[str, Any]:
+        base = 500000000 + n * 100
+        states = [
+            {'id': base + 1, 'name': 'To Do', 'type': 'unstarted', 'position': 1},
+            {'id': base + 2, 'name': 'In Progress', 'type': 'started', 'position': 2},
+            {'id': base + 3, 'name': 'In Review', 'type': 'started', 'position': 3},
+            {'id': base + 4, 'name': 'Done', 'type': 'done', 'position': 4},
+        ]
+        for state in states:
+            state.update(description='', verb=None, num_stories=0, created_at=EPOCH, updated_at=EPOCH)
+        return {'id': base, 'name': 'Engineering' if n == 1 else f"Workflow {n}", 'description': '',
+                'states': states, 'default_state_id': base + 1, 'project_ids': [],
+                'created_at': EPOCH, 'updated_at': EPOCH}
+
+    def state(self, state_id) -> Optional[Dict[str, Any]]:
+        for workflow in self.workflows:
+            for state in workflow['states']:
+                if state['id'] == state_id:
+                    return state
+        return None
+
+    def add_story(self, fields: Dict[str, Any]) -> Dict[str, Any]:
+        """Create a story from CreateStoryParams-like fields."""
+        with self.lock:
+            story_id = self._next_id
+            self._next_id += 1
+            workflow = self.workflows[0]
+            story = {
+                'id': story_id, 'name': '', 'description': '', 'story_type': 'feature',
+                'workflow_id': workflow['id'], 'workflow_state_id': workflow['default_state_id'],
+                'owner_ids': [], 'requested_by_id': self.me, 'estimate': None, 'epic_id': None,
+                'iteration_id': None, 'group_id': None, 'labels': [], 'previous_iteration_ids': [],
+                'archived': False, 'blocked': False, 'started': False, 'completed': False,
+                'comments': [], 'tasks': [], 'deadline': None, 'external_id': None,
+                'created_at': EPOCH, 'updated_at': EPOCH, 'started_at': None, 'completed_at': None,
+                'app_url': f"https://app.shortcut.com/fake/story/{story_id}",
+            }
+            self._apply(story, fields)
+            story['position'] = story_id
+            self.stories[story_id] = story
+            return story
+
+    def _label(self, spec: Dict[str, Any]) -> Dict[str, Any]:
+        for label in self.labels.values():
+            if label['name'] == spec.get('name') or label['id'] == spec.get('id'):
+                return label
+        label = {'id': max(self.labels, default=0) + 1, 'name': spec['name'], 'color': None,
+                 'archived': False, 'created_at': EPOCH, 'updated_at': EPOCH}
+        self.labels[label['id']] = label
+        return label
+
+    def _apply(self, story: Dict[str, Any], fields: Dict[str, Any]) -> None:
+        """Apply UpdateStory/UpdateStories-style fields to a story in place."""
+        for key, value in fields.items():
+            if key == 'labels':
+                story['labels'] = [self._label(v) for v in value]
+            elif key == 'labels_add':
+                names = {label['name'] for label in story['labels']}
+                story['labels'] = story['labels'] + [self._label(v) for v in value if v['name'] not in names]
+            elif key == 'labels_remove':
+                names = {v['name'] for v in value}
+                story['labels'] = [label for label in story['labels'] if label['name'] not in names]
+            elif key == 'owner_ids_add':
+                story['owner_ids'] = story['owner_ids'] + [v for v in value if v not in story['owner_ids']]
+            elif key == 'owner_ids_remove':
+                story['owner_ids'] = [v for v in story['owner_ids'] if v not in value]
+            elif key in ('story_ids', 'before_id', 'after_id'):
+                continue
+            else:
+                story[key] = value
+        if 'workflow_state_id' in fields:
+            state = self.state(story['workflow_state_id'])
+            if state:
+                story['started'] = state['type'] != 'unstarted'
+                story['completed'] = state['type'] == 'done'
+        if story['completed'] and not story.get('completed_at'):
+            story['completed_at'] = story['updated_at'] or EPOCH
+        story['started_at'] = story['started_at'] or (story['created_at'] if story['started'] else None)
+        story['label_ids'] = [label['id'] for label in story['labels']]
+
+    def update_story(self, story: Dict[str, Any], fields: Dict[str, Any]) -> Dict[str, Any]:
+        with self.lock:
+            self._apply(story, fields)
+            story['updated_at'] = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())
+            return story
+
+    def iteration_stats(self) -> Dict[int, Dict[str, int]]:
+        """IterationStats counts for every iteration, in one pass over the stories."""
+        stats = {i: {'num_stories_done': 0, 'num_stories_started': 0, 'num_stories_unstarted': 0,
+                     'num_points': 0, 'num_points_done': 0} for i in self.iterations}
+        for story in self.stories.values():
+            counts = stats.get(story['iteration_id'])
+            if counts is None:
+                continue
+            kind = 'done' if story['completed'] else 'started' if story['started'] else 'unstarted'
+            counts[f'num_stories_{kind}'] += 1
+            counts['num_points'] += story['estimate'] or 0
+            if story['completed']:
+                counts['num_points_done'] += story['estimate'] or 0
+        return stats
+
+
+# key:"quoted value" | key:value | "quoted text" | word
+QUERY_TOKEN = re.compile(r'(-?)(\w+):"([^"]*)"|(-?)(\w+):(\S+)|"([^"]*)"|(\S+)')
+
+
+class _Query:
+    """The subset of Shortcut's search syntax the CLI builds, matched locally."""
+
+    def __init__(self, workspace: Workspace, query: str):
+        self.ws = workspace
+        self.tests: List[Callable[[Dict[str, Any]], bool]] = []
+        for m in QUERY_TOKEN.finditer(query or ''):
+            if m.group(2) or m.group(5):
+                negate = bool(m.group(1) or m.group(4))
+                key = (m.group(2) or m.group(5)).lower()
+                value = m.group(3) if m.group(2) else m.group(6)
+                test = self._operator(key, value.lower())
+                if test is not None:
+                    self.tests.append((lambda t: lambda s: not t(s))(test) if negate else test)
+            else:
+                text = (m.group(7) or m.group(8)).lower()
+                self.tests.append(lambda s, text=text: text in s['name'].lower()
+                                  or text in (s.get('description') or '').lower())
+
+    def _ids(self, entities, value, *keys) -> set:
+        return {e['id'] for e in entities
+                if str(e['id']) == value or any(str(e.get(k) or '').lower() == value for k in keys)}
+
+    def _operator(self, key: str, value: str):
+        ws = self.ws
+        if key == 'id':
+            return lambda s: str(s['id']) == value
+        if key == 'type':
+            return lambda s: s['story_type'] == value
+        if key == 'state':
+            return lambda s: (ws.state(s['workflow_state_id']) or {}).get('name', '').lower() == value
+        if key == 'is':
+            return {
+                'done': lambda s: s['completed'],
+                'started': lambda s: s['started'] and not s['completed'],
+                'unstarted': lambda s: not s['started'],
+                'archived': lambda s: s['archived'],
+                'blocked': lambda s: s['blocked'],
+            }.get(value)
+        if key == 'owner':
+            if value == '@me' or value == 'me':
+                ids = {ws.me}
+            else:
+                ids = {m['id'] for m in ws.members.values()
+                       if value.lstrip('@') in (m['profile']['mention_name'].lower(), m['id'])}
+            return lambda s: bool(ids.intersection(s['owner_ids']))
+        if key == 'label':
+            return lambda s: any(label['name'].lower() == value for label in s['labels'])
+        if key == 'epic':
+            ids = self._ids(ws.epics.values(), value, 'name')
+            return lambda s: s['epic_id'] in ids
+        if key == 'iteration':
+            ids = self._ids(ws.iterations.values(), value, 'name')
+            return lambda s: s['iteration_id'] in ids
+        if key in ('group', 'team'):
+            ids = self._ids(ws.groups.values(), value, 'name', 'mention_name')
+            return lambda s: s['group_id'] in ids
+        return None
+
+    def __call__(self, story: Dict[str, Any]) -> bool:
+        return all(test(story) for test in self.tests)
+
+
+class ApiError(Exception):
+    def __init__(self, status: int, message: str, payload: Optional[Dict[str, Any]] = None):
+        super().__init__(message)
+        self.status = status
+        self.payload = payload or {'message': message}
+
+
+@dataclass
+class RequestRecord:
+    """One request the server answered."""
+    method: str
+    path: str
+    status: int
+    bytes: int
+    elapsed: float
+
+
+class FakeShortcut:
+    """Serve a Workspace as the Shortcut REST API on a free local port.
+
+    ``latency`` (seconds) delays every response; ``throttle_every=N``
+    answers every Nth request with a 429 and ``retry_after`` seconds.
+    ``fail_next()`` queues one-off error responses. Responses are gzipped
+    when the client accepts it, as the real API does.
+    """
+
+    def __init__(self, workspace: Optional[Workspace] = None, latency: float = 0.0,
+                 throttle_every: int = 0, retry_after: Optional[float] = None,
+                 compress: bool = True, spec_path: Path = SPEC):
+        self.workspace = workspace or Workspace()
+        self.shapes = Shapes(load_spec(spec_path))
+        self.latency = latency
+        self.throttle_every = throttle_every
+        self.retry_after = retry_after
+        self.compress = compress
+        self.requests: List[RequestRecord] = []
+        self.connections = 0
+        self._failures: List[Tuple[int, Optional[float]]] = []
+        self._seen = 0
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self.routes = [
+            ('GET', r'/member', '/member', self._get_me),
+            ('GET', r'/members', '/members', lambda m, b, q: list(self.workspace.members.values())),
+            ('GET', r'/members/(?P<id>[^/]+)', '/members/{member-public-id}', self._get_member),
+            ('GET', r'/workflows', '/workflows', lambda m, b, q: self.workspace.workflows),
+            ('GET', r'/groups', '/groups', lambda m, b, q: list(self.workspace.groups.values())),
+            ('GET', r'/groups/(?P<id>[^/]+)', '/groups/{group-public-id}', self._get_group),
+            ('GET', r'/labels', '/labels', lambda m, b, q: list(self.workspace.labels.values())),
+            ('GET', r'/projects', '/projects', lambda m, b, q: list(self.workspace.projects.values())),
+            ('GET', r'/epics', '/epics', lambda m, b, q: list(self.workspace.epics.values())),
+            ('GET', r'/epics/(?P<id>\d+)', '/epics/{epic-public-id}', self._get_epic),
+            ('GET', r'/iterations', '/iterations', self._list_iterations),
+            ('GET', r'/iterations/(?P<id>\d+)', '/iterations/{iteration-public-id}', self._get_iteration),
+            ('GET', r'/iterations/(?P<id>\d+)/stories', '/iterations/{iteration-public-id}/stories',
+             self._iteration_stories),
+            ('POST', r'/stories', '/stories', lambda m, b, q: self.workspace.add_story(b)),
+            ('POST', r'/stories/bulk', '/stories/bulk', self._bulk_create),
+            ('PUT', r'/stories/bulk', '/stories/bulk', self._bulk_update),
+            ('POST', r'/stories/search', '/stories/search', self._story_search),
+            ('GET', r'/stories/(?P<id>\d+)', '/stories/{story-public-id}', self._get_story),
+            ('PUT', r'/stories/(?P<id>\d+)', '/stories/{story-public-id}', self._update_story),
+            ('DELETE', r'/stories/(?P<id>\d+)', '/stories/{story-public-id}', self._delete_story),
+            ('GET', r'/search/stories', '/search/stories', self._search_stories),
+            ('GET', r'/search/epics', '/search/epics', self._search_epics),
+        ]
+        self._compiled = [(method, re.compile(pattern + '$'), template, handler)
+                          for method, pattern, template, handler in self.routes]
+
+    # -- lifecycle ---------------------------------------------------------
+
+    def start(self) -> 'FakeShortcut':
+        api = self
+
+        class Handler(_Handler):
+            fake = api
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> 'FakeShortcut':
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}{API_PREFIX}"
+
+    def client(self, **kwargs):
+        """A ShortcutClient pointed at this server (uncached, unthrottled unless given)."""
+        from sc.api import ShortcutClient
+
+        return ShortcutClient(TOKEN, base_url=self.base_url, **kwargs)
+
+    # -- test controls -----------------------------------------------------
+
+    def fail_next(self, count: int = 1, status: int = 429, retry_after: Optional[float] = None) -> None:
+        """Answer the next ``count`` requests with ``status``."""
+        with self._lock:
+            self._failures.extend([(status, retry_after)] * count)
+
+    def reset(self) -> None:
+        """Forget logged requests."""
+        with self._lock:
+            self.requests.clear()
+            self.connections = 0
+
+    def count(self, method: Optional[str] = None, path: Optional[str] = None) -> int:
+        """Logged requests, optionally only those with a method and a path prefix."""
+        return sum(1 for r in list(self.requests)
+                   if (method is None or r.method == method)
+                   and (path is None or r.path.split('?', 1)[0].startswith(path)))
+
+    @property
+    def bytes_sent(self) -> int:
+        return sum(r.bytes for r in list(self.requests))
+
+    # -- dispatch ----------------------------------------------------------
+
+    def _injected(self) -> Optional[Tuple[int, Optional[float]]]:
+        with self._lock:
+            self._seen += 1
+            if self._failures:
+                return self._failures.pop(0)
+            if self.throttle_every and self._seen % self.throttle_every == 0:
+                return 429, self.retry_after
+        return None
+
+    def handle(self, method: str, target: str, body: Any) -> Tuple[int, Any, Dict[str, str]]:
+        """``(status, payload, headers)`` for one request."""
+        if self.latency:
+            time.sleep(self.latency)
+        injected = self._injected()
+        if injected is not None:
+            status, retry_after = injected
+            headers = {'Retry-After': f"{retry_after:g}"} if retry_after is not None else {}
+            return status, {'message': 'Rate limit exceeded' if status == 429 else 'Injected failure'}, headers
+
+        parts = urlsplit(target)
+        if not parts.path.startswith(API_PREFIX):
+            return 404, {'message': f"Not found: {parts.path}"}, {}
+        path = parts.path[len(API_PREFIX):].rstrip('/') or '/'
+        query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+        for route_method, pattern, template, handler in self._compiled:
+            match = pattern.match(path)
+            if route_method != method or match is None:
+                continue
+            try:
+                result = handler(match, body, query)
+            except ApiError as e:
+                return e.status, e.payload, {}
+            definition, is_array = self.shapes.response(method, template)
+            status = 201 if method == 'POST' else 204 if method == 'DELETE' else 200
+            if definition is None:
+                return status, None, {}
+            if is_array:
+                return status, [self._shape(definition, item, query) for item in result], {}
+            return status, self._shape(definition, result, query), {}
+        return 404, {'message': f"No route for {method} {path}"}, {}
+
+    def _shape(self, definition: str, item: Dict[str, Any], query: Dict[str, str]) -> Dict[str, Any]:
+        if definition.endswith('SearchResults'):
+            hit = definition.replace('SearchResults', 'SearchResult')
+            hit = hit if hit in self.shapes.definitions else definition.replace('SearchResults', 'Slim')
+            data = [self._shape(hit, h, query) for h in item['data']]
+            if query.get('detail', 'full') != 'full':
+                for h in data:
+                    for key in ('description', 'comments', 'tasks'):
+                        h.pop(key, None)
+            return {**item, 'data': data}
+        if definition in ('Workflow',):
+            item = {**item, 'states': [self.shapes.render('WorkflowState', s) for s in item['states']]}
+        elif definition in ('Member',):
+            item = {**item, 'profile': self.shapes.render('Profile', item['profile'])}
+        elif 'labels' in item and definition not in ('Label', 'LabelSlim'):
+            item = {**item, 'labels': [self.shapes.render('LabelSlim', label) for label in item['labels']]}
+        return self.shapes.render(definition, item)
+
+    # -- handlers ----------------------------------------------------------
+
+    def _find(self, collection: Dict, key, kind: str) -> Dict[str, Any]:
+        item = collection.get(key)
+        if item is None:
+            raise ApiError(404, f"{kind} {key} not found")
+        return item
+
+    def _get_me(self, match, body, query):
+        me = self._find(self.workspace.members, self.workspace.me, 'Member')
+        return {'id': me['id'], 'name': me['profile']['name'], 'mention_name': me['profile']['mention_name'],
+                'role': me['role'], 'is_owner': me['role'] == 'owner',
+                'workspace2': {'url_slug': 'fake', 'estimate_scale': [0, 1, 2, 3, 5, 8]}}
+
+    def _get_member(self, match, body, query):
+        return self._find(self.workspace.members, match['id'], 'Member')
+
+    def _get_group(self, match, body, query):
+        return self._find(self.workspace.groups, match['id'], 'Group')
+
+    def _get_epic(self, match, body, query):
+        return self._find(self.workspace.epics, int(match['id']), 'Epic')
+
+    def _list_iterations(self, match, body, query):
+        stats = self.workspace.iteration_stats()
+        return [{**i, 'stats': stats[i['id']]} for i in self.workspace.iterations.values()]
+
+    def _get_iteration(self, match, body, query):
+        iteration = self._find(self.workspace.iterations, int(match['id']), 'Iteration')
+        return {**iteration, 'stats': self.workspace.iteration_stats()[iteration['id']]}
+
+    def _iteration_stories(self, match, body, query):
+        iteration_id = int(match['id'])
+        self._find(self.workspace.iterations, iteration_id, 'Iteration')
+        return [s for s in self.workspace.stories.values() if s['iteration_id'] == iteration_id]
+
+    def _get_story(self, match, body, query):
+        return self._find(self.workspace.stories, int(match['id']), 'Story')
+
+    def _update_story(self, match, body, query):
+        story = self._find(self.workspace.stories, int(match['id']), 'Story')
+        return self.workspace.update_story(story, body or {})
+
+    def _delete_story(self, match, body, query):
+        with self.workspace.lock:
+            self._find(self.workspace.stories, int(match['id']), 'Story')
+            del self.workspace.stories[int(match['id'])]
+
+    def _bulk_create(self, match, body, query):
+        stories = (body or {}).get('stories') or []
+        if len(stories) > MAX_BULK:
+            raise ApiError(400, f"At most {MAX_BULK} stories per request")
+        return [self.workspace.add_story(s) for s in stories]
+
+    def _bulk_update(self, match, body, query):
+        body = dict(body or {})
+        ids = body.pop('story_ids', None) or []
+        if len(ids) > MAX_BULK:
+            raise ApiError(400, f"At most {MAX_BULK} stories per request")
+        stories = [self._find(self.workspace.stories, i, 'Story') for i in ids]
+        return [self.workspace.update_story(s, body) for s in stories]
+
+    def _story_search(self, match, body, query):
+        # Only the timestamp filters are honoured. The spec gives no order,
+        # so hits come back by ID rather than by updated_at.
+        body = body or {}
+        bounds = [(field, _instant(body.get(f'{field}_start')), _instant(body.get(f'{field}_end')))
+                  for field in ('updated_at', 'created_at')]
+        hits = [s for s in self.workspace.stories.values()
+                if all((lo is None or _instant(s[field]) >= lo) and (hi is None or _instant(s[field]) <= hi)
+                       for field, lo, hi in bounds)]
+        return hits[:STORY_SEARCH_CAP]
+
+    def _page(self, path: str, hits: List[Dict[str, Any]], query: Dict[str, str]) -> Dict[str, Any]:
+        page_size = int(query.get('page_size') or 25)
+        if not 1 <= page_size <= MAX_PAGE_SIZE:
+            raise ApiError(400, f"page_size must be between 1 and {MAX_PAGE_SIZE}")
+        offset = int(query.get('next') or 0)
+        if offset >= MAX_SEARCH_RESULTS:
+            message = f"A maximum of {MAX_SEARCH_RESULTS} search results are supported."
+            raise ApiError(400, message, {'error': 'maximum-results-exceeded', 'message': message,
+                                          'maximum-results': MAX_SEARCH_RESULTS})
+        end = offset + page_size
+        next_token = None
+        if end < len(hits):
+            next_token = f"{API_PREFIX}{path}?{urlencode({**query, 'next': end})}"
+        return {'data': hits[offset:end], 'next': next_token, 'total': len(hits)}
+
+    def _search_stories(self, match, body, query):
+        test = _Query(self.workspace, query.get('query', ''))
+        hits = [s for s in self.workspace.stories.values() if test(s)]
+        return self._page('/search/stories', hits, query)
+
+    def _search_epics(self, match, body, query):
+        text = query.get('query', '').lower().strip('"')
+        hits = [e for e in self.workspace.epics.values() if text in e['name'].lower()]
+        return self._page('/search/epics', hits, query)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body go out as separate writes; with Nagle on, the body
+    # waits for a delayed ACK and every keep-alive request gains ~40 ms.
+    disable_nagle_algorithm = True
+    fake: FakeShortcut
+
+    def setup(self):
+        super().setup()
+        with self.fake._lock:
+            self.fake.connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def _dispatch(self):
+        started = time.perf_counter()
+        length = int(self.headers.get('Content-Length') or 0)
+        raw = self.rfile.read(length) if length else b''
+        if self.headers.get('Shortcut-Token') != TOKEN:
+            status, payload, headers = 401, {'message': 'Unauthorized'}, {}
+        else:
+            try:
+                body = json.loads(raw) if raw else None
+            except ValueError:
+                status, payload, headers = 400, {'message': 'Malformed JSON'}, {}
+            else:
+                status, payload, headers = self.fake.handle(self.command, self.path, body)
+
+        data = b'' if payload is None else json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        if data:
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            if self.fake.compress and 'gzip' in (self.headers.get('Accept-Encoding') or '') and len(data) > 1024:
+                data = gzip.compress(data, compresslevel=1)
+                self.send_header('Content-Encoding', 'gzip')
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        # Logged before the body goes out, so a client never sees a response
+        # that is missing from the log
+        with self.fake._lock:
+            self.fake.requests.append(RequestRecord(self.command, self.path[len(API_PREFIX):] if
+                                                    self.path.startswith(API_PREFIX) else self.path,
+                                                    status, len(data), time.perf_counter() - started))
+        self.wfile.write(data)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _dispatch
@@ -0,0 +1,33 @@
+"""Tests for the benchmark harness and the request budgets it guards."""
+
+from dataclasses import replace
+from benchmarks.harness import SCENARIOS, compare, load_baseline, run
+
+# Request counts do not depend on latency, so the guard runs at full speed
+SETTINGS = {**load_baseline()['settings'], 'latency': 0.0}
+REQUEST_METRICS = {'requests': 0.0, 'duplicates': 0.0}
+
+
+def test_request_counts_within_baseline():
+    """Every scenario succeeds without issuing more requests than recorded."""
+    baseline = load_baseline()['scenarios']
+    for measurement in run(SCENARIOS, SETTINGS, memory=False):
+        assert compare(measurement, baseline[measurement.name], REQUEST_METRICS) == [], measurement.output
+
+
+def test_n_plus_one_fails_the_run(mocker):
+    """A per-row member lookup in `team stories` is reported against its endpoint."""
+    from sc.utils.resolver import EntityResolver
+
+    def owner_name(self, story, default="Unassigned"):
+        return self.client.get_member(story.owner_ids[0]).profile.name if story.owner_ids else default
+
+    mocker.patch.object(EntityResolver, 'owner_name', owner_name)
+    team_stories = next(s for s in SCENARIOS if s.name == 'team-stories')
+    # A short table keeps the extra requests inside the rate limiter's burst
+    scenario = replace(team_stories, args=lambda ws: [*team_stories.argv(ws)[:-1], '10'])
+    [measurement] = run([scenario], SETTINGS, memory=False)
+
+    problems = compare(measurement, load_baseline()['scenarios']['team-stories'], REQUEST_METRICS)
+    assert any(p.startswith('requests') for p in problems)
+    assert any(p.startswith('GET /members/{id}') for p in problems)
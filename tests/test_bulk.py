@@ -0,0 +1,92 @@
+"""Tests for bulk story updates."""
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+from click.testing import CliRunner
+from sc.commands.story import story
+
+
+def make_client(total=250, fail_chunk=None):
+    client = Mock(base_url="https://api.app.shortcut.com/api/v3")
+    puts = []
+
+    def request(method, path, params=None, json=None):
+        if path.startswith('/search/stories'):
+            return {'next': None, 'data': [{'id': n, 'name': f"Story {n}"} for n in range(1, total + 1)]}
+        if method == 'PUT' and path == '/stories/bulk':
+            puts.append(json)
+            if fail_chunk is not None and fail_chunk in json['story_ids']:
+                raise RuntimeError("422 Unprocessable")
+            return [{'id': i} for i in json['story_ids']]
+        raise AssertionError(f"unexpected {method} {path}")
+
+    client._make_request.side_effect = request
+    client.list_workflows.return_value = [SimpleNamespace(id=1, name='Eng', states=[
+        SimpleNamespace(id=100, name='Todo', type='unstarted'),
+        SimpleNamespace(id=200, name='In Progress', type='started')])]
+    client.puts = puts
+    return client
+
+
+def test_bulk_update_chunks_search_results(mocker):
+    """250 matches become three PUT /stories/bulk calls carrying the same change."""
+    client = make_client()
+    mocker.patch('sc.commands.story.get_client', return_value=client)
+
+    result = CliRunner().invoke(story, ['bulk-update', '--label', 'legacy',
+                                        '--set-state', 'In Progress', '--add-label', 'cleanup'])
+
+    assert result.exit_code == 0, result.output
+    assert sorted(len(p['story_ids']) for p in client.puts) == [50, 100, 100]
+    assert all(p['workflow_state_id'] == 200 and p['labels_add'] == [{'name': 'cleanup'}]
+               for p in client.puts)
+    assert sorted(i for p in client.puts for i in p['story_ids']) == list(range(1, 251))
+    assert "Chunk 3/3" in result.output
+    assert "Updated 250 of 250 stories" in result.output
+
+
+def test_bulk_update_dry_run_sends_nothing(mocker):
+    client = make_client()
+    mocker.patch('sc.commands.story.get_client', return_value=client)
+
+    result = CliRunner().invoke(story, ['bulk-update', '--stdin', '--set-state', 'Todo', '--dry-run'],
+                                input="12 #13\nsc-14, https://app.shortcut.com/org/story/15/title 12\n")
+
+    assert result.exit_code == 0, result.output
+    assert client.puts == []
+    assert "would update 4 stories in 1 bulk request" in result.output
+    assert "12, 13, 14, 15" in result.output
+
+
+def test_bulk_update_dry_run_names_what_was_resolved(mocker):
+    """Names resolve only on a clear hit; the dry run shows what each one matched."""
+    client = make_client()
+    client.list_iterations.return_value = [SimpleNamespace(id=12, name="Sprint 12"),
+                                           SimpleNamespace(id=14, name="Sprint 14")]
+    client.list_members.return_value = [SimpleNamespace(id="mem-1", disabled=False, profile=SimpleNamespace(
+        name="Sarah Chen", email_address="sarah@example.com", mention_name="sarah"))]
+    mocker.patch('sc.commands.story.get_client', return_value=client)
+
+    result = CliRunner().invoke(story, ['bulk-update', '--stdin', '--set-iteration', 'sprint 12',
+                                        '--add-owner', 'chen', '--dry-run'], input="1 2\n")
+    assert result.exit_code == 0, result.output
+    assert "iteration_id: Sprint 12 [12]" in result.output
+    assert "owner_ids_add: Sarah Chen <sarah@example.com> [mem-1]" in result.output
+
+    result = CliRunner().invoke(story, ['bulk-update', '--stdin', '--set-iteration', 'Sprint 13'],
+                                input="1 2\n")
+    assert result.exit_code == 1
+    assert "Could not find iteration 'Sprint 13'. Did you mean: Sprint 12 [12]" in result.output
+    assert client.puts == []
+
+
+def test_bulk_update_reports_failed_chunk(mocker):
+    """A failing chunk is reported with its IDs; the others still go through."""
+    client = make_client(total=150, fail_chunk=120)
+    mocker.patch('sc.commands.story.get_client', return_value=client)
+
+    result = CliRunner().invoke(story, ['bulk-update', '--type', 'bug', '--archive'])
+
+    assert result.exit_code == 1
+    assert "Updated 100 of 150 stories" in result.output
+    assert "stories 101..150" in result.output
@@ -0,0 +1,87 @@
+"""Tests for the reference-data cache."""
+
+import json
+import time
+from unittest.mock import Mock
+from click.testing import CliRunner
+from sc.api import ShortcutClient, ReferenceCache
+from sc.commands.cache import cache as cache_command
+
+
+def make_client(tmp_path, payloads):
+    """Client whose HTTP session returns canned JSON per path."""
+    cache = ReferenceCache(tmp_path)
+    client = ShortcutClient(api_token="token", cache=cache)
+    client.session = Mock()
+
+    def request(method, url, **kwargs):
+        path = url.split('/api/v3', 1)[1]
+        body = payloads.get(path, {})
+        return Mock(content=json.dumps(body).encode(), json=Mock(return_value=body),
+                    raise_for_status=Mock())
+
+    client.session.request.side_effect = request
+    return client
+
+
+def test_collection_served_from_cache(tmp_path):
+    """Second list call is answered from disk."""
+    client = make_client(tmp_path, {'/members': [{'id': 'mem-1'}]})
+
+    assert client._make_request('GET', '/members') == [{'id': 'mem-1'}]
+    assert client._make_request('GET', '/members') == [{'id': 'mem-1'}]
+    assert client.session.request.call_count == 1
+    assert (tmp_path / 'members.json').exists()
+
+
+def test_uncached_paths_go_to_api(tmp_path):
+    """Single resources and searches are never cached."""
+    client = make_client(tmp_path, {'/members/mem-1': {'id': 'mem-1'}})
+
+    client._make_request('GET', '/members/mem-1')
+    client._make_request('GET', '/members/mem-1')
+    client._make_request('GET', '/epics', params={'query': 'x'})
+    assert client.session.request.call_count == 3
+
+
+def test_write_invalidates_collection(tmp_path):
+    """A write to a cached collection drops its entry."""
+    client = make_client(tmp_path, {'/epics': [{'id': 1}]})
+
+    client._make_request('GET', '/epics')
+    client._make_request('POST', '/epics', json={'name': 'New'})
+    client._make_request('GET', '/epics')
+    assert client.session.request.call_count == 3
+
+
+def test_ttl_expiry(tmp_path):
+    """Entries older than their TTL are treated as missing."""
+    cache = ReferenceCache(tmp_path, ttls={'workflows': 10})
+    cache.set('workflows', [{'id': 1}])
+    assert cache.get('workflows') == [{'id': 1}]
+
+    entry = json.loads((tmp_path / 'workflows.json').read_text())
+    entry['fetched_at'] = time.time() - 11
+    (tmp_path / 'workflows.json').write_text(json.dumps(entry))
+    assert cache.get('workflows') is None
+
+
+def test_no_cache_client(tmp_path):
+    """Without a cache every call reaches the API."""
+    client = make_client(tmp_path, {'/groups': []})
+    client.cache = None
+
+    client._make_request('GET', '/groups')
+    client._make_request('GET', '/groups')
+    assert client.session.request.call_count == 2
+
+
+def test_refresh_counts_records_like_status(tmp_path, mocker):
+    """The token's member is one object, not a list of its keys."""
+    client = make_client(tmp_path, {'/member': {'id': 'mem-1', 'name': 'Sarah'}, '/groups': [{'id': 1}, {'id': 2}]})
+    mocker.patch('sc.commands.cache.get_client', return_value=client)
+
+    result = CliRunner().invoke(cache_command, ['refresh', 'member', 'groups'])
+    assert "Refreshed member (1 items)" in result.output
+    assert "Refreshed groups (2 items)" in result.output
+    assert {row['name']: row['count'] for row in client.cache.status()}['member'] == 1
@@ -0,0 +1,43 @@
+"""Tests for the API client's HTTP layer."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from sc.api import ShortcutClient
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    peers = set()
+    tokens = []
+
+    def do_GET(self):
+        Handler.peers.add(self.client_address)
+        Handler.tokens.append(self.headers.get('Shortcut-Token'))
+        body = json.dumps({'id': 'mem-1'}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_connections_are_reused():
+    """Sequential requests share one keep-alive connection and keep the auth header."""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        client = ShortcutClient(api_token="secret",
+                                base_url=f"http://127.0.0.1:{server.server_port}/api/v3")
+        for _ in range(5):
+            assert client._make_request('GET', '/member') == {'id': 'mem-1'}
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert len(Handler.peers) == 1
+    assert Handler.tokens == ["secret"] * 5
+    assert client.session.headers['Accept-Encoding'] == 'gzip, deflate'
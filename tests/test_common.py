@@ -0,0 +1,54 @@
+"""Tests for shared command utilities."""
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+from sc.utils.common import WorkflowIndex, get_workflow_index, get_state_id_by_name
+
+
+def make_workflows():
+    state = lambda id, name, type: SimpleNamespace(id=id, name=name, type=type)
+    return [
+        SimpleNamespace(id=1, name="Engineering", states=[
+            state(100, "Todo", "unstarted"),
+            state(101, "In Progress", "started"),
+            state(102, "Done", "done"),
+        ]),
+        SimpleNamespace(id=2, name="Design", states=[
+            state(200, "Todo", "unstarted"),
+            state(202, "Done", "done"),
+        ]),
+    ]
+
+
+def test_lookups_by_id_name_and_type():
+    """States resolve by ID, case-insensitive name and type."""
+    index = WorkflowIndex(make_workflows())
+
+    assert index.state_name(101) == "In Progress"
+    assert index.state_name(999) == "999"
+    assert index.state_name(999, "Unknown") == "Unknown"
+    assert index.state_id_by_name("in progress") == 101
+    assert index.state_ids_of_type("done") == {102, 202}
+    assert index.state_type(200) == "unstarted"
+
+
+def test_name_disambiguation_by_workflow():
+    """Shared state names pick the first workflow unless one is given."""
+    index = WorkflowIndex(make_workflows())
+
+    assert index.state_id_by_name("Done") == 102
+    assert index.state_id_by_name("Done", workflow="design") == 202
+    assert index.state_id_by_name("Done", workflow="2") == 202
+    assert index.state_id_by_name("Design/Done") == 202
+    assert index.state_id_by_name("Done", workflow="Marketing") is None
+
+
+def test_index_built_once_per_client():
+    """Repeated lookups share one list_workflows call."""
+    client = Mock()
+    client.list_workflows.return_value = make_workflows()
+
+    for _ in range(5):
+        get_state_id_by_name(client, "Done")
+        get_workflow_index(client).state_name(100)
+    client.list_workflows.assert_called_once()
@@ -0,0 +1,72 @@
+"""Tests for forwarding commands to `sc daemon`."""
+
+import os
+import subprocess
+import sys
+import time
+import pytest
+from sc.daemon import command_path, control, forward
+from tests.fakeapi import TOKEN, FakeShortcut, Workspace
+
+ROOT = os.path.dirname(os.path.dirname(__file__))
+
+
+def test_command_path_skips_global_options():
+    assert command_path(['--debug', '--trace-file', 'out.json', 'story', 'view', '12']) == ('story', 'view')
+    assert command_path(['--no-cache', 'daemon']) == ('daemon',)
+    assert command_path(['--version']) == ()
+
+
+def test_forward_runs_in_process_without_a_daemon(tmp_path):
+    assert forward(['team', 'list'], tmp_path / 'missing.sock') is None
+
+
+@pytest.fixture
+def daemon(tmp_path, monkeypatch):
+    """A daemon subprocess serving a fake workspace; yields (api, socket path)."""
+    sock = tmp_path / 'sc.sock'
+    with FakeShortcut(Workspace(stories=40, members=10)) as api:
+        env = {**os.environ, 'HOME': str(tmp_path), 'SHORTCUT_API_TOKEN': TOKEN,
+               'SHORTCUT_API_URL': api.base_url, 'SC_DAEMON_SOCKET': str(sock)}
+        process = subprocess.Popen([sys.executable, '-m', 'sc', 'daemon', 'start', '--idle-timeout', '60'],
+                                   cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        try:
+            deadline = time.monotonic() + 20
+            while control('status', sock) is None:
+                assert process.poll() is None, process.stderr.read().decode()
+                assert time.monotonic() < deadline, "daemon did not start"
+                time.sleep(0.05)
+            monkeypatch.setenv('SHORTCUT_API_TOKEN', TOKEN)
+            monkeypatch.setenv('SHORTCUT_API_URL', api.base_url)
+            yield api, sock
+        finally:
+            control('stop', sock)
+            process.wait(timeout=10)
+            process.stderr.close()
+
+
+def test_daemon_runs_commands_with_a_warm_client(daemon, capsys):
+    api, sock = daemon
+    api.reset()
+
+    assert forward(['story', 'search', '--state', 'Done'], sock) == 0
+    assert forward(['team', 'list'], sock) == 0
+
+    out = capsys.readouterr().out
+    assert "Stories" in out and "Team 1" in out
+    # Workflows and members were loaded at startup; both commands reused one connection
+    assert api.count('GET', '/workflows') == 0
+    assert api.count('GET', '/members') == 0
+    assert api.connections <= 1
+    assert control('status', sock)['served'] == 2
+
+
+def test_daemon_reports_exit_codes_and_declines(daemon, capsys, monkeypatch):
+    api, sock = daemon
+
+    assert forward(['story', 'view'], sock) == 2
+    assert "Missing argument" in capsys.readouterr().err
+    # Interactive commands, and other workspaces, run in-process
+    assert forward(['story', 'create'], sock) is None
+    monkeypatch.setenv('SHORTCUT_API_TOKEN', 'another-token')
+    assert forward(['team', 'list'], sock) is None
@@ -0,0 +1,95 @@
+"""End-to-end tests against the local fake Shortcut API."""
+
+import time
+import pytest
+import requests
+from click.testing import CliRunner
+from sc.api.bulk import bulk_update_stories
+from sc.api.pagination import iter_search_stories
+from sc.api.ratelimit import RateLimiter
+from sc.api.store import LocalStore
+from sc.api.sync import sync_stories
+from sc.commands.iteration import iteration
+from tests.fakeapi import FakeShortcut, Workspace
+
+
+@pytest.fixture(scope='module')
+def api():
+    with FakeShortcut(Workspace(stories=2600, members=50)) as server:
+        yield server
+
+
+def test_search_follows_next_up_to_the_result_cap(api):
+    api.reset()
+    stories = list(iter_search_stories(api.client(), '', limit=1000))
+
+    assert len({s.id for s in stories}) == 1000
+    assert api.count('GET', '/search/stories') == 4
+    # Keep-alive: every page goes over the same pooled connection
+    assert api.connections == 1
+
+    # Like the real API, a cursor past 1000 results is refused
+    with pytest.raises(requests.HTTPError) as excinfo:
+        list(iter_search_stories(api.client(), ''))
+    assert excinfo.value.response.status_code == 400
+    assert excinfo.value.response.json()['error'] == 'maximum-results-exceeded'
+
+
+def test_typed_models_decode_spec_shaped_payloads(api):
+    client = api.client()
+    assert len(client.list_members()) == 50
+    assert client.get_story(1000).name.startswith("Story 0")
+    assert client.get_iteration(1).name == "Sprint 1"
+    assert [w.name for w in client.list_workflows()] == ["Engineering", "Workflow 2"]
+
+
+def test_throttling_is_retried_by_the_limiter(api):
+    api.reset()
+    api.fail_next(2, retry_after=0.01)
+    client = api.client(limiter=RateLimiter(requests_per_minute=6000, base_delay=0.01))
+
+    assert len(client.list_groups()) == 3
+    assert [r.status for r in api.requests] == [429, 429, 200]
+
+
+def test_bulk_update_chunks_and_applies(api):
+    api.reset()
+    ids = list(range(1000, 1250))
+    results = bulk_update_stories(api.client(), ids, {'labels_add': [{'name': 'bulk'}]},
+                                  chunk_size=100)
+
+    assert all(r.ok for r in results)
+    assert api.count('PUT', '/stories/bulk') == 3
+    assert all('bulk' in [l['name'] for l in api.workspace.stories[i]['labels']] for i in ids)
+
+
+def test_latency_is_injected():
+    with FakeShortcut(Workspace(stories=10), latency=0.05) as slow:
+        started = time.perf_counter()
+        slow.client().list_groups()
+        assert time.perf_counter() - started >= 0.05
+
+
+def test_sync_splits_capped_searches(tmp_path):
+    """Over 1000 stories from one bulk edit still all reach the mirror."""
+    workspace = Workspace(stories=1500, members=5)
+    for story in list(workspace.stories.values())[:1200]:
+        story['updated_at'] = '2024-07-01T09:30:00Z'
+    store = LocalStore(tmp_path / 'store.sqlite3')
+    with FakeShortcut(workspace) as server:
+        assert sync_stories(server.client(), store) == 1500
+        assert store.high_water('stories') == '2024-07-01T09:30:00Z'
+        assert server.count('POST', '/stories/search') > 2
+    assert store.counts()['stories'] == 1500
+    store.close()
+
+
+def test_iteration_stats_command(api, mocker):
+    mocker.patch('sc.commands.iteration.get_client', return_value=api.client())
+    iteration_id = 2
+    expected = sum(1 for s in api.workspace.stories.values() if s['iteration_id'] == iteration_id)
+
+    result = CliRunner().invoke(iteration, ['stats', str(iteration_id)])
+
+    assert result.exit_code == 0, result.output
+    assert f"Total Stories: {expected}" in result.output
@@ -0,0 +1,111 @@
+"""Tests for streaming output formats."""
+
+import io
+import json
+from types import SimpleNamespace
+from unittest.mock import Mock
+from click.testing import CliRunner
+from sc.commands.story import story
+from sc.formatters import write_rows
+
+ROWS = [{'id': 1, 'name': 'First, with comma', 'owner': None},
+        {'id': 2, 'name': 'Second', 'owner': 'Sarah'}]
+
+
+def test_formats():
+    """Each format renders the same rows."""
+    out = io.StringIO()
+    write_rows(iter(ROWS), 'ndjson', ['id', 'name', 'owner'], out)
+    assert [json.loads(line) for line in out.getvalue().splitlines()] == ROWS
+
+    out = io.StringIO()
+    write_rows(iter(ROWS), 'json', ['id', 'name', 'owner'], out)
+    assert json.loads(out.getvalue()) == ROWS
+
+    out = io.StringIO()
+    write_rows(iter([]), 'json', ['id'], out)
+    assert json.loads(out.getvalue()) == []
+
+    out = io.StringIO()
+    write_rows(iter(ROWS), 'csv', ['id', 'name', 'owner'], out)
+    assert out.getvalue() == 'id,name,owner\n1,"First, with comma",\n2,Second,Sarah\n'
+
+    out = io.StringIO()
+    write_rows(iter(ROWS), 'tsv', ['id', 'owner'], out)
+    assert out.getvalue() == 'id\towner\n1\t\n2\tSarah\n'
+
+
+def test_rows_are_written_as_they_arrive():
+    """A row is on the stream before the next one is produced."""
+    out = io.StringIO()
+
+    def rows():
+        yield ROWS[0]
+        assert out.getvalue().count('\n') == 1
+        yield ROWS[1]
+
+    assert write_rows(rows(), 'ndjson', ['id'], out) == 2
+
+
+def test_story_search_ndjson(mocker):
+    """story search --format ndjson streams plain records, no table."""
+    client = Mock(base_url="https://api.app.shortcut.com/api/v3")
+    client._make_request.return_value = {'next': None, 'data': [
+        {'id': 7, 'name': 'Fix login', 'story_type': 'bug', 'workflow_state_id': 100,
+         'owner_ids': ['m1'], 'estimate': 3, 'app_url': 'https://app/7'},
+    ]}
+    client.list_workflows.return_value = [SimpleNamespace(id=1, name='Eng', states=[
+        SimpleNamespace(id=100, name='Todo', type='unstarted')])]
+    client.list_members.return_value = [SimpleNamespace(id='m1', profile=SimpleNamespace(name='Sarah'))]
+    mocker.patch('sc.commands.story.get_client', return_value=client)
+
+    result = CliRunner().invoke(story, ['search', 'login', '--format', 'ndjson'])
+
+    assert result.exit_code == 0
+    assert json.loads(result.output) == {
+        'id': 7, 'name': 'Fix login', 'type': 'bug', 'state': 'Todo',
+        'owner': 'Sarah', 'estimate': 3, 'app_url': 'https://app/7',
+    }
+
+
+def make_search_client(hit):
+    client = Mock(base_url="https://api.app.shortcut.com/api/v3")
+    client._make_request.return_value = {'next': None, 'data': [hit]}
+    return client
+
+
+def test_fields_projection_stays_slim(mocker):
+    """Slim-only fields request detail=slim and skip lookups they do not need."""
+    client = make_search_client({'id': 7, 'name': 'Fix login', 'labels': [{'id': 1, 'name': 'ui'}],
+                                 'description': 'ignored'})
+    mocker.patch('sc.commands.story.get_client', return_value=client)
+
+    result = CliRunner().invoke(story, ['search', 'login', '-f', 'ndjson', '--fields', 'id,name,labels'])
+
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.output) == {'id': 7, 'name': 'Fix login', 'labels': 'ui'}
+    assert client._make_request.call_args[1]['params']['detail'] == 'slim'
+    client.list_workflows.assert_not_called()
+    client.list_members.assert_not_called()
+
+
+def test_fields_needing_full_detail(mocker):
+    client = make_search_client({'id': 7, 'name': 'Fix login', 'description': 'Steps to reproduce',
+                                 'tasks': [{'complete': True}, {'complete': False}]})
+    mocker.patch('sc.commands.story.get_client', return_value=client)
+
+    result = CliRunner().invoke(story, ['search', 'login', '--fields', 'id,description,tasks'])
+
+    assert result.exit_code == 0, result.output
+    assert client._make_request.call_args[1]['params']['detail'] == 'full'
+    assert "Description" in result.output and "Steps to reproduce" in result.output
+    assert "1/2" in result.output
+
+
+def test_unknown_field_is_rejected(mocker):
+    mocker.patch('sc.commands.story.get_client', return_value=make_search_client({'id': 1}))
+
+    result = CliRunner().invoke(story, ['search', 'x', '--fields', 'id,colour'])
+
+    assert result.exit_code == 2
+    assert "unknown field(s) colour" in result.output
@@ -0,0 +1,106 @@
+"""Tests for bulk story import."""
+
+import csv
+import json
+from types import SimpleNamespace
+from unittest.mock import Mock
+from click.testing import CliRunner
+from sc.commands.story import story
+
+
+def make_client(fail_rows=()):
+    client = Mock(base_url="https://api.app.shortcut.com/api/v3")
+    posts = []
+
+    def request(method, path, json=None):
+        assert (method, path) == ('POST', '/stories/bulk')
+        posts.append(json['stories'])
+        if any(s['name'] in fail_rows for s in json['stories']):
+            raise RuntimeError("422 Unprocessable")
+        start = 1000 + sum(len(p) for p in posts[:-1])
+        return [{'id': start + i, 'name': s['name']} for i, s in enumerate(json['stories'])]
+
+    client._make_request.side_effect = request
+    client.list_workflows.return_value = [SimpleNamespace(id=1, name='Eng', states=[
+        SimpleNamespace(id=100, name='Todo', type='unstarted'),
+        SimpleNamespace(id=200, name='Done', type='done')])]
+    client.list_members.return_value = [SimpleNamespace(
+        id='m1', profile=SimpleNamespace(name='Sarah Lee', mention_name='sarah', email_address='s@x.io'))]
+    client.list_epics.return_value = [SimpleNamespace(id=7, name='Auth')]
+    client.list_iterations.return_value = [SimpleNamespace(id=9, name='Sprint 12')]
+    client.list_groups.return_value = [SimpleNamespace(id='g1', name='Backend')]
+    client.posts = posts
+    return client
+
+
+def read_map(path):
+    with open(path, newline='') as f:
+        return {int(r['row']): int(r['story_id']) for r in csv.DictReader(f)}
+
+
+def test_import_csv_resolves_names(mocker, tmp_path):
+    client = make_client()
+    mocker.patch('sc.commands.story.get_client', return_value=client)
+    source = tmp_path / "stories.csv"
+    source.write_text("name,type,state,owner,epic,iteration,team,labels,estimate\n"
+                      "Login page,bug,todo,@sarah,Auth,Sprint 12,Backend,\"ui, auth\",3\n"
+                      "Logout,,,,,,,,\n")
+
+    result = CliRunner().invoke(story, ['import', str(source)])
+
+    assert result.exit_code == 0, result.output
+    assert client.posts == [[
+        {'name': 'Login page', 'story_type': 'bug', 'workflow_state_id': 100, 'owner_ids': ['m1'],
+         'epic_id': 7, 'iteration_id': 9, 'group_id': 'g1',
+         'labels': [{'name': 'ui'}, {'name': 'auth'}], 'estimate': 3},
+        {'name': 'Logout'},
+    ]]
+    assert read_map(f"{source}.ids.csv") == {1: 1000, 2: 1001}
+
+
+def test_import_resumes_failed_chunks(mocker, tmp_path):
+    """Rows from a failed chunk stay out of the mapping and are retried on the next run."""
+    source = tmp_path / "stories.ndjson"
+    source.write_text("".join(json.dumps({'name': f"Story {n}"}) + "\n" for n in range(1, 6)))
+
+    client = make_client(fail_rows={'Story 3'})
+    mocker.patch('sc.commands.story.get_client', return_value=client)
+    result = CliRunner().invoke(story, ['import', str(source), '--chunk-size', '2'])
+    assert result.exit_code == 1
+    assert sorted(read_map(f"{source}.ids.csv")) == [1, 2, 5]
+
+    client = make_client()
+    mocker.patch('sc.commands.story.get_client', return_value=client)
+    result = CliRunner().invoke(story, ['import', str(source), '--chunk-size', '2'])
+    assert result.exit_code == 0, result.output
+    assert client.posts == [[{'name': 'Story 3'}, {'name': 'Story 4'}]]
+    assert sorted(read_map(f"{source}.ids.csv")) == [1, 2, 3, 4, 5]
+
+
+def test_import_records_sent_chunks_before_a_malformed_row(mocker, tmp_path):
+    """A bad line stops the import, but stories already created reach the mapping."""
+    source = tmp_path / "stories.ndjson"
+    source.write_text("".join(json.dumps({'name': f"Story {n}"}) + "\n" for n in range(1, 5)) + "{not json\n")
+
+    client = make_client()
+    mocker.patch('sc.commands.story.get_client', return_value=client)
+    result = CliRunner().invoke(story, ['import', str(source), '--chunk-size', '2'])
+
+    assert result.exit_code == 1
+    assert "Error reading" in result.output
+    assert read_map(f"{source}.ids.csv") == {1: 1000, 2: 1001, 3: 1002, 4: 1003}
+
+
+def test_import_yaml_dry_run_reports_bad_rows(mocker, tmp_path):
+    client = make_client()
+    mocker.patch('sc.commands.story.get_client', return_value=client)
+    source = tmp_path / "stories.yaml"
+    source.write_text("- name: Good\n  state: Done\n- name: Bad\n  owner: nobody\n- state: Todo\n")
+
+    result = CliRunner().invoke(story, ['import', str(source), '--dry-run'])
+
+    assert result.exit_code == 0
+    assert client.posts == []
+    assert "Row 2: unknown member 'nobody'" in result.output
+    assert "Row 3: missing name" in result.output
+    assert "1 stories ready to create, 2 rows with errors" in result.output
@@ -0,0 +1,97 @@
+"""Tests for fuzzy name lookup."""
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+import pytest
+from sc.utils.common import get_member_id_by_name
+from sc.utils.lookup import AmbiguousName, KindIndex, LookupIndex, NameNotFound, get_lookup_index
+
+
+def member(id, name, email, mention, disabled=False):
+    profile = SimpleNamespace(name=name, email_address=email, mention_name=mention)
+    return SimpleNamespace(id=id, profile=profile, disabled=disabled)
+
+
+def make_client():
+    client = Mock()
+    client.list_members.return_value = [
+        member("mem-1", "Sarah Chen", "sarah@example.com", "sarah"),
+        member("mem-2", "Alex Johnson", "alex.j@example.com", "alexj"),
+        member("mem-3", "Alex Jones", "ajones@example.com", "ajones"),
+        member("mem-4", "José Álvarez", "jose@example.com", "jose"),
+        member("mem-5", "Sarah Old", "old@example.com", "sold", disabled=True),
+    ]
+    client.list_epics.return_value = [
+        SimpleNamespace(id=10, name="Authentication revamp", archived=False),
+        SimpleNamespace(id=11, name="Billing", archived=False),
+        SimpleNamespace(id=12, name="Billing", archived=True),
+    ]
+    client.list_groups.return_value = [SimpleNamespace(id="grp-1", name="Backend", mention_name="backend",
+                                                       archived=False)]
+    client.get_current_member.return_value = SimpleNamespace(id="mem-2")
+    return client
+
+
+def test_exact_word_prefix_and_trigram_matches_are_ranked():
+    index = LookupIndex(make_client())
+
+    assert index.resolve('member', "sarah@example.com") == "mem-1"
+    assert index.resolve('member', "jose alvarez") == "mem-4"  # accents folded
+    assert index.resolve('member', "chen") == "mem-1"           # whole word
+    assert index.resolve('member', "jos") == "mem-4"            # prefix
+    assert index.resolve('group', "grp-1") == "grp-1"           # ID
+    assert [m.id for m in index.search('member', "sarah")] == ["mem-1", "mem-5"]  # disabled ranks lower
+
+
+def test_ambiguous_and_missing_names():
+    index = LookupIndex(make_client())
+
+    with pytest.raises(AmbiguousName) as excinfo:
+        index.resolve('member', "alex")
+    assert {m.id for m in excinfo.value.matches} == {"mem-2", "mem-3"}
+    assert "Alex Johnson <alex.j@example.com> [mem-2]" in excinfo.value.message
+    with pytest.raises(AmbiguousName):
+        index.resolve('epic', "billing")  # same name, one archived: let the user pick
+    with pytest.raises(NameNotFound, match="Could not find team 'frontend'"):
+        index.resolve('group', "frontend")
+
+
+def test_typo_level_matches_are_only_suggested():
+    client = make_client()
+    client.list_iterations.return_value = [SimpleNamespace(id=12, name="Sprint 12"),
+                                           SimpleNamespace(id=14, name="Sprint 14")]
+    client.list_epics.return_value.append(SimpleNamespace(id=13, name="Billing v1", archived=False))
+    index = LookupIndex(client)
+
+    assert index.search('epic', "authentcation")[0].id == 10  # still ranked by trigram
+    with pytest.raises(NameNotFound, match=r"Did you mean: Authentication revamp \[10\]"):
+        index.resolve('epic', "authentcation")
+    with pytest.raises(NameNotFound, match=r"Did you mean: .*Billing v1 \[13\]"):
+        index.resolve('epic', "Billing v2")
+    with pytest.raises(NameNotFound) as excinfo:
+        index.resolve('iteration', "Sprint 13")
+    assert {m.id for m in excinfo.value.suggestions} == {12, 14}
+    assert index.resolve('iteration', "sprint 12") == 12
+    assert index.resolve('epic', "billing v") == 13  # unique prefix
+
+
+def test_at_me_and_indexes_are_built_once_per_client():
+    client = make_client()
+
+    assert get_member_id_by_name(client, "@me") == "mem-2"
+    for name in ("sarah", "chen", "jose", "@me"):
+        get_member_id_by_name(client, name)
+    assert get_member_id_by_name(client, "nobody") is None
+
+    client.list_members.assert_called_once()
+    client.get_current_member.assert_called_once()
+    assert get_lookup_index(client) is get_lookup_index(client)
+
+
+def test_lookup_cost_does_not_grow_with_scans():
+    """An exact key is one dictionary hit, whatever the workspace size."""
+    members = [member(f"mem-{n}", f"Person {n}", f"p{n}@example.com", f"p{n}") for n in range(5000)]
+    index = KindIndex('member', members)
+
+    assert index.search("p4321@example.com")[0].id == "mem-4321"
+    assert index.search("person 4321")[0].id == "mem-4321"
@@ -0,0 +1,64 @@
+"""Tests for per-command sharing of identical API reads."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from sc.api.memo import RequestMemo
+from tests.fakeapi import FakeShortcut, Workspace
+
+
+@pytest.fixture(scope='module')
+def api():
+    with FakeShortcut(Workspace(stories=20, members=5), latency=0.02) as server:
+        yield server
+
+
+def test_concurrent_identical_reads_share_one_request():
+    memo = RequestMemo()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.05)
+        return {'id': 1, 'labels': [{'name': 'a'}]}
+
+    key = memo.key('GET', '/stories/1', {})
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda _: memo.call(key, fetch), range(4)))
+
+    assert len(calls) == 1
+    assert sorted(shared for _, shared in results) == [False, True, True, True]
+    # Every caller got its own copy
+    results[0][0]['labels'].append('mutated')
+    assert all(r[0]['labels'] == [{'name': 'a'}] for r in results[1:])
+    assert memo.call(key, fetch)[0] == {'id': 1, 'labels': [{'name': 'a'}]}
+
+
+def test_writes_searches_and_errors_are_not_shared():
+    memo = RequestMemo()
+
+    assert memo.key('PUT', '/stories/1', {'json': {}}) is None
+    assert memo.key('GET', '/search/stories', {'params': {'query': 'x'}}) is None
+    assert memo.key('GET', '/iterations/3/stories', {}) is None
+    assert memo.key('GET', '/epics', {'params': {'a': 1}}) != memo.key('GET', '/epics', {'params': {'a': 2}})
+
+    key = memo.key('GET', '/stories/1', {})
+    with pytest.raises(ValueError):
+        memo.call(key, lambda: (_ for _ in ()).throw(ValueError("boom")))
+    assert memo.call(key, lambda: {'id': 1}) == ({'id': 1}, False)
+
+
+def test_client_shares_reads_until_a_write(api):
+    api.reset()
+    client = api.client(memo=RequestMemo())
+    member_id = next(iter(api.workspace.members))
+
+    names = {client.get_member(member_id).profile.name for _ in range(3)}
+    story = client.get_story(1000)
+    assert client.get_story(1000).name == story.name
+    client._make_request('PUT', '/stories/1000', json={'name': 'Renamed'})
+
+    assert len(names) == 1
+    assert api.count('GET', f'/members/{member_id}') == 1
+    assert client.get_story(1000).name == 'Renamed'
+    assert api.count('GET', '/stories/1000') == 2
@@ -0,0 +1,50 @@
+"""Tests for cursor-following search pagination."""
+
+from unittest.mock import Mock
+from sc.api.pagination import iter_search_stories
+
+
+def make_client(total, page_size):
+    """Client serving `total` stories in pages linked by next tokens."""
+    client = Mock(base_url="https://api.app.shortcut.com/api/v3")
+
+    def request(method, path, params=None):
+        start = int(path.split('next=')[1]) if 'next=' in path else 0
+        end = min(start + page_size, total)
+        next_token = f"/api/v3/search/stories?query=x&next={end}" if end < total else None
+        return {'data': [{'id': n, 'name': f"Story {n}"} for n in range(start, end)],
+                'next': next_token, 'total': total}
+
+    client._make_request.side_effect = request
+    return client
+
+
+def test_follows_next_until_exhausted():
+    """Without a limit every page is fetched."""
+    client = make_client(total=130, page_size=50)
+    stories = list(iter_search_stories(client, "x"))
+
+    assert [s.id for s in stories] == list(range(130))
+    assert client._make_request.call_count == 3
+    assert client._make_request.call_args_list[1][0] == ('GET', '/search/stories?query=x&next=50')
+
+
+def test_stops_at_limit():
+    """A limit inside the second page never requests a third."""
+    client = make_client(total=1000, page_size=50)
+    stories = list(iter_search_stories(client, "x", limit=70))
+
+    assert len(stories) == 70
+    assert client._make_request.call_count == 2
+    params = client._make_request.call_args_list[0][1]['params']
+    assert params == {'query': 'x', 'detail': 'slim', 'page_size': 70}
+
+
+def test_is_lazy():
+    """Nothing beyond the first page is fetched until the caller asks."""
+    client = make_client(total=1000, page_size=50)
+    stories = iter_search_stories(client, "x")
+
+    assert next(stories).id == 0
+    stories.close()
+    assert client._make_request.call_count <= 2
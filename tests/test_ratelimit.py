@@ -0,0 +1,103 @@
+"""Tests for the client-side rate limiter."""
+
+import pytest
+import requests
+from unittest.mock import Mock
+from sc.api import ShortcutClient
+from sc.api.ratelimit import RateLimiter, RateLimitExceeded
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def make_limiter(clock, **kwargs):
+    return RateLimiter(clock=clock, sleep=clock.sleep, **kwargs)
+
+
+def throttled_response(retry_after=None):
+    response = requests.Response()
+    response.status_code = 429
+    if retry_after is not None:
+        response.headers['Retry-After'] = retry_after
+    return response
+
+
+def test_token_bucket_paces_requests():
+    """After the burst, requests are spaced at the configured rate."""
+    clock = FakeClock()
+    limiter = make_limiter(clock, requests_per_minute=60, burst=2)
+
+    for _ in range(4):
+        limiter.acquire()
+        limiter.release()
+
+    assert clock.sleeps == [pytest.approx(1.0), pytest.approx(1.0)]
+    assert limiter.stats()['requests'] == 4
+
+
+def test_concurrency_halves_on_429_and_recovers():
+    """AIMD: a 429 halves the in-flight cap, a cap-sized run of successes adds one."""
+    clock = FakeClock()
+    limiter = make_limiter(clock, requests_per_minute=6000, max_concurrency=8)
+
+    limiter.acquire()
+    limiter.release(throttled=True)
+    assert limiter.stats()['concurrency_limit'] == 4
+
+    clock.now += 10
+    for _ in range(4):
+        limiter.acquire()
+        limiter.release()
+    assert limiter.stats()['concurrency_limit'] == 5
+
+
+def test_client_retries_after_429(mocker):
+    """The client waits out Retry-After, retries, and returns the eventual result."""
+    clock = FakeClock()
+    limiter = make_limiter(clock)
+    client = ShortcutClient(api_token="secret", limiter=limiter)
+    ok = Mock(status_code=200, content=b'{"id": 1}')
+    ok.json.return_value = {'id': 1}
+    mocker.patch.object(client.session, 'request',
+                        side_effect=[throttled_response('3'), ok])
+    assert client._make_request('GET', '/member') == {'id': 1}
+    assert 3.0 in clock.sleeps
+    stats = limiter.stats()
+    assert stats['throttled'] == 1 and stats['retries'] == 1
+
+
+def test_client_gives_up_with_clear_error(mocker):
+    """Persistent 429s end in RateLimitExceeded instead of a raw HTTP error."""
+    clock = FakeClock()
+    client = ShortcutClient(api_token="secret", limiter=make_limiter(clock, max_retries=2))
+    request = mocker.patch.object(client.session, 'request',
+                                  side_effect=lambda *a, **k: throttled_response())
+
+    with pytest.raises(RateLimitExceeded, match="rate limit"):
+        client._make_request('GET', '/member')
+    assert request.call_count == 3
+
+
+def test_other_errors_are_not_retried(mocker):
+    """Non-429 failures raise straight away and free their slot."""
+    clock = FakeClock()
+    limiter = make_limiter(clock)
+    client = ShortcutClient(api_token="secret", limiter=limiter)
+    response = requests.Response()
+    response.status_code = 404
+    request = mocker.patch.object(client.session, 'request', return_value=response)
+
+    with pytest.raises(requests.HTTPError):
+        client._make_request('GET', '/stories/1')
+    assert request.call_count == 1
+    assert limiter.stats()['in_flight'] == 0
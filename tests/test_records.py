@@ -0,0 +1,76 @@
+"""Tests for the generated slim record types."""
+
+import tracemalloc
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock
+from sc.api import gen_records
+from sc.api.pagination import iter_search_stories
+from sc.api.records import GroupSlim, IterationSlim, MemberSlim, ProjectSlim, StorySlim
+from tests.fakeapi import FakeShortcut, Workspace
+
+
+def full_story(n):
+    """A story hit shaped like a detail=full search result."""
+    return {
+        'id': n, 'name': f"Story {n}", 'story_type': 'feature', 'workflow_state_id': 500,
+        'owner_ids': ['m1'], 'estimate': 2, 'app_url': f"https://app/{n}",
+        'labels': [{'id': 1, 'name': 'ui', 'color': '#ff0000', 'entity_type': 'label'}],
+        'description': "x" * 200, 'comments': [], 'tasks': [], 'files': [], 'commits': [],
+        'branches': [], 'pull_requests': [], 'follower_ids': [], 'mention_ids': [],
+        'custom_fields': [], 'external_links': [], 'story_links': [], 'position': n * 10,
+        'global_id': f"g{n}", 'entity_type': 'story', 'moved_at': None, 'lead_time': 5,
+    }
+
+
+def test_generated_module_is_current():
+    """records.py matches what the generator produces from the bundled spec."""
+    assert gen_records.generate() == Path(gen_records.OUTPUT).read_text(encoding='utf-8')
+
+
+def test_from_dict_keeps_rendered_fields_only():
+    story = StorySlim.from_dict(full_story(7))
+
+    assert not hasattr(story, '__dict__')
+    assert (story.id, story.name, story.estimate, story.epic_id) == (7, "Story 7", 2, None)
+    assert story.labels[0].name == 'ui'
+    assert 'description' not in story.to_dict()
+    assert story.to_dict()['labels'] == [{'id': 1, 'name': 'ui', 'color': '#ff0000', 'archived': None}]
+
+
+def test_decoding_uses_a_fraction_of_the_memory():
+    hits = [full_story(n) for n in range(10_000)]
+
+    def retained(decode):
+        tracemalloc.start()
+        decoded = [decode(h) for h in hits]
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        assert len(decoded) == len(hits)
+        return size
+
+    slim = retained(StorySlim.from_dict)
+    namespace = retained(lambda h: SimpleNamespace(**h))
+    assert slim < namespace * 0.5
+
+
+def test_search_hits_decode_to_records():
+    client = Mock(base_url="https://api.app.shortcut.com/api/v3")
+    client._make_request.return_value = {'data': [full_story(1)], 'next': None}
+
+    story, = iter_search_stories(client, "x")
+    assert isinstance(story, StorySlim)
+
+
+def test_reference_lists_decode_to_records():
+    """The member, group, iteration and project loaders keep only the fields the CLI reads."""
+    with FakeShortcut(Workspace(stories=0, members=3)) as api:
+        client = api.client()
+        members, groups = client.list_members(), client.list_groups()
+        iterations, projects = client.list_iterations(), client.list_projects()
+
+    assert all(isinstance(m, MemberSlim) for m in members)
+    assert members[0].profile.name == "Member 0"
+    assert isinstance(groups[0], GroupSlim) and groups[0].member_ids
+    assert isinstance(iterations[0], IterationSlim) and iterations[0].status == 'done'
+    assert isinstance(projects[0], ProjectSlim) and projects[0].name == "Project 1"
@@ -0,0 +1,54 @@
+"""Tests for batched entity resolution."""
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+from sc.utils.resolver import EntityResolver
+
+
+def make_member(member_id, name):
+    return SimpleNamespace(id=member_id, profile=SimpleNamespace(name=name))
+
+
+def test_owner_names_use_one_bulk_call():
+    """A table of any size resolves owners with a single list_members."""
+    client = Mock()
+    client.list_members.return_value = [make_member('m1', 'Sarah'), make_member('m2', 'Alex')]
+    stories = [SimpleNamespace(owner_ids=['m1' if n % 2 else 'm2'], epic_id=7, iteration_id=8, group_id='g1')
+               for n in range(100)]
+
+    resolver = EntityResolver(client)
+    resolver.collect(stories, kinds=('member',))
+    resolver.resolve()
+    names = [resolver.owner_name(s) for s in stories]
+
+    assert names[:2] == ['Alex', 'Sarah']
+    client.list_members.assert_called_once()
+    client.get_member.assert_not_called()
+    client.list_epics.assert_not_called()
+    client.list_iterations.assert_not_called()
+    client.list_groups.assert_not_called()
+
+
+def test_collect_loads_only_the_named_kinds():
+    client = Mock()
+    client.list_epics.return_value = [SimpleNamespace(id=7, name="Billing")]
+    stories = [SimpleNamespace(owner_ids=['m1'], epic_id=7, iteration_id=8)]
+
+    resolver = EntityResolver(client)
+    resolver.collect(stories, kinds=('epic',))
+    resolver.resolve()
+
+    assert resolver.name('epic', 7) == "Billing"
+    client.list_members.assert_not_called()
+    client.list_iterations.assert_not_called()
+
+
+def test_unknown_and_missing_owners():
+    """Unknown IDs fall back to the ID; stories without owners are Unassigned."""
+    client = Mock()
+    client.list_members.return_value = []
+
+    resolver = EntityResolver(client)
+    assert resolver.owner_name(SimpleNamespace(owner_ids=['gone'])) == 'gone'
+    assert resolver.owner_name(SimpleNamespace(owner_ids=[])) == 'Unassigned'
+    client.list_members.assert_called_once()
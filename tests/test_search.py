@@ -0,0 +1,74 @@
+"""Tests for the search command group."""
+
+import json
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock
+from click.testing import CliRunner
+from sc.commands.search import search
+
+
+def make_client(delay):
+    client = Mock(base_url="https://api.app.shortcut.com/api/v3")
+
+    def request(method, path, params=None):
+        time.sleep(delay)
+        if path == '/search/stories':
+            return {'next': None, 'data': [{'id': 1, 'name': 'Login story', 'story_type': 'bug',
+                                            'workflow_state_id': 100}]}
+        raise RuntimeError("epic search is down")
+
+    def list_workflows():
+        time.sleep(delay)
+        return [SimpleNamespace(id=1, name='Eng', states=[SimpleNamespace(id=100, name='Todo', type='unstarted')])]
+
+    def list_iterations():
+        time.sleep(delay)
+        return [SimpleNamespace(id=5, name='Login sprint', status='started', stats=None)]
+
+    client._make_request.side_effect = request
+    client.list_workflows.side_effect = list_workflows
+    client.list_iterations.side_effect = list_iterations
+    return client
+
+
+def test_search_all_runs_sections_concurrently(mocker):
+    """Latency is about one call, sections keep their order, errors stay local."""
+    mocker.patch('sc.commands.search.get_client', return_value=make_client(delay=0.3))
+
+    started = time.monotonic()
+    result = CliRunner().invoke(search, ['all', 'login'])
+    elapsed = time.monotonic() - started
+
+    assert result.exit_code == 0
+    assert elapsed < 0.9
+    output = result.output
+    assert output.index("Stories:") < output.index("Error searching epics") < output.index("Iterations:")
+    assert "Login sprint" in output
+
+
+def test_search_all_streams_machine_formats(mocker):
+    """--format ndjson writes one record per hit, no tables."""
+    client = make_client(delay=0)
+    client._make_request.side_effect = lambda method, path, params=None: {'next': None, 'data': [
+        {'id': 1, 'name': 'Login story', 'story_type': 'bug', 'workflow_state_id': 100}
+        if path == '/search/stories' else
+        {'id': 2, 'name': 'Login epic', 'state': 'to do', 'stats': {'num_stories_total': 3}}]}
+    mocker.patch('sc.commands.search.get_client', return_value=client)
+
+    result = CliRunner().invoke(search, ['all', 'login', '--format', 'ndjson'])
+
+    assert result.exit_code == 0, result.output
+    assert [json.loads(line) for line in result.output.splitlines()] == [
+        {'type': 'story', 'id': 1, 'name': 'Login story', 'state': 'Todo', 'app_url': None},
+        {'type': 'epic', 'id': 2, 'name': 'Login epic', 'state': 'to do', 'app_url': None},
+        {'type': 'iteration', 'id': 5, 'name': 'Login sprint', 'state': 'started', 'app_url': None},
+    ]
+
+    # A failed section is reported on stderr; the others are still written
+    mocker.patch('sc.commands.search.get_client', return_value=make_client(delay=0))
+    result = CliRunner().invoke(search, ['all', 'login', '-f', 'csv'])
+    assert result.exit_code == 1
+    assert result.stdout.splitlines() == ['type,id,name,state,app_url', 'story,1,Login story,Todo,',
+                                          'iteration,5,Login sprint,started,']
+    assert "Error searching epics: epic search is down" in result.stderr
@@ -0,0 +1,58 @@
+"""Startup-time budget for the `sc` entry point."""
+
+import os
+import subprocess
+import sys
+import click
+from click.testing import CliRunner
+from sc.cli import COMMANDS, cli
+
+# Cumulative import time allowed for sc.cli, in milliseconds.
+STARTUP_BUDGET_MS = float(os.environ.get('SC_STARTUP_BUDGET_MS', 100))
+
+HEAVY_MODULES = ('requests', 'useshortcut', 'questionary', 'rich', 'yaml', 'sc.commands')
+
+
+def run_python(code, *flags):
+    return subprocess.run([sys.executable, *flags, '-c', code], capture_output=True, text=True,
+                          check=True, cwd=os.path.dirname(os.path.dirname(__file__)))
+
+
+def cumulative_import_ms(stderr, module):
+    """Cumulative time for ``module`` from ``-X importtime`` output."""
+    for line in stderr.splitlines():
+        parts = [p.strip() for p in line.split('|')]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1]) / 1000
+    raise AssertionError(f"{module} not in importtime output")
+
+
+def test_import_time_budget():
+    run_python("import sc.cli")  # compile bytecode so the measurement is of a warm start
+    elapsed = min(cumulative_import_ms(run_python("import sc.cli", '-X', 'importtime').stderr, 'sc.cli')
+                  for _ in range(3))
+    assert elapsed < STARTUP_BUDGET_MS, f"import sc.cli took {elapsed:.1f} ms (budget {STARTUP_BUDGET_MS} ms)"
+
+
+def test_version_and_help_skip_heavy_imports():
+    code = ("import sys\nfrom sc.cli import cli\n"
+            "for args in (['--version'], ['--help']):\n"
+            "    try:\n        cli(args)\n    except SystemExit:\n        pass\n"
+            "print(' '.join(sorted(sys.modules)))")
+    loaded = run_python(code).stdout.splitlines()[-1].split()
+    heavy = [m for m in loaded if m.startswith(HEAVY_MODULES)]
+    assert heavy == []
+
+
+def test_lazy_help_matches_commands():
+    """The help listed without importing matches each group's own summary."""
+    for name, (path, short_help) in COMMANDS.items():
+        command = cli.get_command(click.Context(cli), name)
+        assert command.name == name
+        assert command.get_short_help_str(limit=200) == short_help
+
+
+def test_subcommand_dispatch():
+    result = CliRunner().invoke(cli, ['story', '--help'])
+    assert result.exit_code == 0
+    assert "bulk-update" in result.output
@@ -0,0 +1,64 @@
+"""Tests for streaming iteration statistics."""
+
+from types import SimpleNamespace
+from unittest.mock import Mock
+from click.testing import CliRunner
+from sc.commands.iteration import iteration
+from sc.utils.common import WorkflowIndex
+from sc.utils.stats import StoryStats
+
+WORKFLOWS = [SimpleNamespace(id=1, name='Eng', states=[
+    SimpleNamespace(id=100, name='Todo', type='unstarted'),
+    SimpleNamespace(id=200, name='Done', type='done'),
+]), SimpleNamespace(id=2, name='Ops', states=[
+    SimpleNamespace(id=300, name='Done', type='done'),
+])]
+
+
+def story(n):
+    return {'id': n, 'name': f"Story {n}", 'story_type': 'bug' if n % 4 == 0 else 'feature',
+            'workflow_state_id': (100, 200, 300)[n % 3], 'estimate': n % 5 or None}
+
+
+def test_aggregator_counts():
+    stats = StoryStats(WorkflowIndex(WORKFLOWS)).consume(
+        SimpleNamespace(**story(n)) for n in range(1, 13))
+
+    assert (stats.total, stats.completed) == (12, 8)
+    assert stats.points == sum(n % 5 for n in range(1, 13))
+    assert stats.completed_points == sum(n % 5 for n in range(1, 13) if n % 3)
+    assert dict(stats.by_type) == {'feature': 9, 'bug': 3}
+    # Same-named states in different workflows are reported together
+    assert stats.by_state() == {'Done': 8, 'Todo': 4}
+
+
+def test_stats_covers_iterations_past_the_search_cap(mocker):
+    """All 2,600 stories are counted: search stops at 1000, the iteration's story list does not."""
+    total = 2600
+    client = Mock(base_url="https://api.app.shortcut.com/api/v3")
+    client._make_request.return_value = [story(n) for n in range(total)]
+    client.list_workflows.return_value = WORKFLOWS
+    client.get_iteration.return_value = SimpleNamespace(name='Sprint 9', status='started')
+    mocker.patch('sc.commands.iteration.get_client', return_value=client)
+
+    result = CliRunner().invoke(iteration, ['stats', '9'])
+
+    assert result.exit_code == 0, result.output
+    assert "Total Stories: 2600" in result.output
+    assert f"Completed Stories: {sum(1 for n in range(total) if n % 3)}" in result.output
+    client._make_request.assert_called_once_with('GET', '/iterations/9/stories')
+
+
+def test_iteration_stories_table(mocker):
+    """The table path materialises the page with the builtin list, not the `list` command."""
+    client = Mock(base_url="https://api.app.shortcut.com/api/v3")
+    client._make_request.return_value = {'next': None, 'data': [story(1)]}
+    client.list_workflows.return_value = WORKFLOWS
+    client.list_members.return_value = []
+    client.get_iteration.return_value = SimpleNamespace(name='Sprint 9', status='started')
+    mocker.patch('sc.commands.iteration.get_client', return_value=client)
+
+    result = CliRunner().invoke(iteration, ['stories', '9'])
+
+    assert result.exit_code == 0, result.output
+    assert "Story 1" in result.output
@@ -0,0 +1,113 @@
+"""Tests for the local story mirror and incremental sync."""
+
+from datetime import datetime
+from unittest.mock import Mock
+import pytest
+from sc.api import sync
+from sc.api.store import LocalStore
+from sc.api.sync import sync_all
+
+
+def instant(stamp):
+    return datetime.fromisoformat(stamp.replace('Z', '+00:00'))
+
+
+def story(id, updated_at, **fields):
+    return {'id': id, 'name': f"Story {id}", 'story_type': 'feature', 'updated_at': updated_at,
+            'owner_ids': [], 'labels': [], **fields}
+
+
+def make_client(stories, epics=(), iterations=(), cap=1000):
+    client = Mock(spec=['_make_request'])
+    calls = []
+
+    def request(method, path, **kwargs):
+        calls.append((method, path, kwargs.get('json')))
+        if path == '/stories/search':
+            body = kwargs['json']
+            hits = [s for s in stories
+                    if all(instant(body[f'{field}_start']) <= instant(s[field]) <= instant(body[f'{field}_end'])
+                           for field in ('updated_at', 'created_at') if f'{field}_start' in body)]
+            return hits[::-1][:cap]  # newest first: the sync must not rely on any order
+        return list({'/epics': epics, '/iterations': iterations}[path])
+
+    client._make_request.side_effect = request
+    client.calls = calls
+    return client
+
+
+def test_first_sync_then_deltas(tmp_path):
+    """The second sync asks only for stories updated since the high-water mark."""
+    store = LocalStore(tmp_path / 'store.sqlite3')
+    stories = [story(1, '2024-01-01T00:00:00Z'), story(2, '2024-02-01T00:00:00Z')]
+    client = make_client(stories, iterations=[{'id': 7, 'name': 'Sprint 7', 'status': 'started',
+                                               'updated_at': '2024-01-05T00:00:00Z'}])
+
+    assert sync_all(client, store) == {'stories': 2, 'epics': 0, 'iterations': 1}
+    assert store.high_water('stories') == '2024-02-01T00:00:00Z'
+
+    stories.append(story(3, '2024-03-01T00:00:00Z', iteration_id=7))
+    written = sync_all(client, store)
+
+    assert client.calls[-3][2]['updated_at_start'] == '2024-02-01T00:00:00.000Z'
+    assert written == {'stories': 2, 'epics': 0, 'iterations': 0}
+    assert store.counts() == {'stories': 3, 'epics': 0, 'iterations': 1}
+
+
+def test_capped_windows_are_split_whatever_the_order(tmp_path, monkeypatch):
+    """Capped batches split by updated_at, then created_at for stories sharing one."""
+    monkeypatch.setattr(sync, 'STORY_SEARCH_CAP', 3)
+    store = LocalStore(tmp_path / 'store.sqlite3')
+    stories = [story(i, f'2024-01-0{i}T00:00:00Z', created_at='2023-12-01T00:00:00Z') for i in range(1, 6)]
+    # A bulk edit: more stories than one batch holds share an updated_at
+    stories += [story(i, '2024-01-06T12:00:00Z', created_at=f'2023-12-{i:02d}T00:00:00Z')
+                for i in range(10, 17)]
+    client = make_client(stories, cap=3)
+
+    assert sync_all(client, store)['stories'] == 12
+    assert store.counts()['stories'] == 12
+    assert store.high_water('stories') == '2024-01-06T12:00:00Z'
+    assert any('created_at_start' in body for _, path, body in client.calls if path == '/stories/search')
+
+    same_instant = [story(i, '2024-02-01T00:00:00Z', created_at='2024-02-01T00:00:00Z') for i in range(20, 23)]
+    with pytest.raises(RuntimeError, match="same instant"):
+        sync_all(make_client(stories + same_instant, cap=3), store)
+    assert store.high_water('stories') == '2024-01-06T12:00:00Z'
+
+
+def test_search_filters(tmp_path):
+    """Mirrored stories filter by text, owner, iteration and label."""
+    store = LocalStore(tmp_path / 'store.sqlite3')
+    store.upsert_stories([
+        story(1, '2024-01-01', owner_ids=['m1'], iteration_id=7,
+              labels=[{'name': 'Urgent'}]),
+        story(2, '2024-01-02', owner_ids=['m2'], iteration_id=8, name='Login page'),
+        story(3, '2024-01-03', archived=True, iteration_id=7),
+    ])
+
+    assert [s['id'] for s in store.search_stories(text='login')] == [2]
+    assert [s['id'] for s in store.search_stories(owner_ids=['m1'])] == [1]
+    assert [s['id'] for s in store.search_stories(iteration_ids=[7])] == [1]
+    assert [s['id'] for s in store.search_stories(iteration_ids=[7], include_archived=True)] == [3, 1]
+    assert [s['id'] for s in store.search_stories(label='urgent')] == [1]
+    assert store.search_stories(owner_ids=[]) == []
+
+
+def test_full_text_search_is_ranked_and_incremental(tmp_path):
+    """Name matches outrank description matches; updates re-index the row."""
+    store = LocalStore(tmp_path / 'store.sqlite3')
+    store.upsert_stories([
+        story(1, '2024-01-01', name='Refactor billing', description='touches the login flow'),
+        story(2, '2024-01-02', name='Login rate limiting', description='throttle attempts'),
+        story(3, '2024-01-03', name='Unrelated', description='see login bug'),
+    ])
+
+    results = store.search_text('login', 'story')
+    assert results[0]['id'] == 2
+    assert sorted(r['id'] for r in results[1:]) == [1, 3]
+    assert '\x02Login\x03' in results[0]['_snippet']
+
+    store.upsert_stories([story(2, '2024-01-04', name='Rate limiting')])
+    assert sorted(r['id'] for r in store.search_text('log', 'story')) == [1, 3]
+    assert store.search_text('rate lim', 'story')[0]['id'] == 2
+    assert store.search_text('login', 'epic') == []
@@ -1,5 +1,6 @@
 """Tests for story create command."""
 
+import threading
 import pytest
 from unittest.mock import Mock, MagicMock
 from click.testing import CliRunner
@@ -264,4 +265,46 @@ def test_story_create_all_projects_archived(mocker):
     assert "No active projects available. All projects are archived." in result.output
     
     # Verify no story was created
-    mock_client.create_story.assert_not_called()
\ No newline at end of file
+    mock_client.create_story.assert_not_called()
+
+
+def test_story_create_prompts_before_reference_data_arrives(mocker):
+    """Reference data is fetched in the background while the first prompts show."""
+    mock_client = Mock()
+    mocker.patch('sc.commands.story.get_client', return_value=mock_client)
+    events = []
+    first_prompt = threading.Event()
+
+    def slow(name, result):
+        def fetch():
+            assert first_prompt.wait(5), f"{name} blocked the first prompt"
+            events.append(name)
+            return result
+        return fetch
+
+    mock_client.list_projects.side_effect = slow('projects', [Mock(id=1, name="Project", archived=False)])
+    mock_client.list_workflows.side_effect = slow('workflows', [Mock(states=[Mock(id=100, name="Todo")])])
+    mock_client.list_members.side_effect = slow('members', [])
+    mock_client.list_epics.side_effect = slow('epics', [])
+    mock_client.list_iterations.side_effect = slow('iterations', [])
+    mock_client.list_groups.side_effect = slow('groups', [])
+    mock_client.create_story.return_value = Mock(id=12347, app_url="https://app.shortcut.com/story/12347")
+
+    answers = iter(["Quick story", "", ""])
+
+    def text_answer():
+        events.append('prompt')
+        first_prompt.set()
+        return next(answers)
+
+    mock_questionary = mocker.patch('sc.commands.story.questionary')
+    mock_questionary.text.return_value.ask.side_effect = text_answer
+    mock_questionary.select.return_value.ask.side_effect = ["chore", 1, None, None, None, None]
+
+    result = CliRunner().invoke(story, ['create'])
+
+    assert result.exit_code == 0, result.output
+    assert "✓ Created story #12347" in result.output
+    assert events[0] == 'prompt'
+    assert sorted(e for e in events if e != 'prompt') == ['epics', 'groups', 'iterations', 'members', 'projects',
+                                                               'workflows']
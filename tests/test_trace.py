@@ -0,0 +1,54 @@
+"""Tests for --trace request and phase timing."""
+
+import json
+from click.testing import CliRunner
+from benchmarks.harness import cli_against
+from sc.api import trace
+from sc.api.trace import Tracer
+from sc.cli import cli
+from tests.fakeapi import FakeShortcut, Workspace
+
+
+class StepClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_phases_count_only_their_own_time():
+    clock = StepClock()
+    tracer = Tracer(clock=clock)
+
+    with tracer.span('model', 'list_members'):
+        clock.now += 0.002
+        with tracer.span('http', 'GET /members'):
+            clock.now += 0.050
+        with tracer.span('decode', '/members'):
+            clock.now += 0.003
+        clock.now += 0.001
+
+    assert {k: round(v, 3) for k, v in tracer.phases.items()} == {'model': 0.003, 'http': 0.05, 'decode': 0.003}
+    events = tracer.chrome_trace()['traceEvents']
+    assert [e['name'] for e in events] == ['list_members', 'GET /members', '/members']
+    assert events[0]['dur'] == 56000
+
+
+def test_trace_reports_requests_cache_hits_and_chrome_file(tmp_path):
+    trace_file = tmp_path / 'trace.json'
+    with FakeShortcut(Workspace(stories=50)) as api, cli_against(api):
+        runner = CliRunner()
+        runner.invoke(cli, ['story', 'search', 'login'])  # warms the reference cache
+        result = runner.invoke(cli, ['--trace-file', str(trace_file), 'story', 'search', 'login'])
+
+    assert result.exit_code == 0, result.output
+    report = result.stderr
+    assert "GET /search/stories" in report
+    assert "cache  GET /members" in report
+    assert "phases: http" in report and "render" in report
+    assert trace.get_tracer() is None
+
+    events = json.loads(trace_file.read_text())['traceEvents']
+    assert {'http', 'decode', 'model', 'render'} <= {e['cat'] for e in events}
+    assert any(e['cat'] == 'request,http' and e['args']['status'] == 200 for e in events)
@@ -0,0 +1,75 @@
+"""Tests for cross-iteration velocity."""
+
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import Mock
+from click.testing import CliRunner
+from sc.api.store import LocalStore
+from sc.commands.iteration import iteration
+from sc.utils import velocity
+from sc.utils.velocity import VelocityTable, percentile, rolling_mean, story_facts
+
+
+def sprint(id, status='done'):
+    return SimpleNamespace(id=id, name=f"Sprint {id}", status=status,
+                           end_date=f"2024-01-{id:02d}T00:00:00Z")
+
+
+def story(n, completed=True, completed_at='2024-01-01T12:00:00Z', **fields):
+    return {'id': n, 'estimate': n, 'story_type': 'bug' if n % 2 else 'feature',
+            'group_id': 'team-a' if n < 3 else None, 'completed': completed,
+            'completed_at': completed_at if completed else None,
+            'previous_iteration_ids': [], **fields}
+
+
+def test_columns_aggregate_per_iteration_and_type(monkeypatch):
+    facts = {
+        1: [story_facts(story(1), '2024-01-01'),
+            story_facts(story(2, completed=False, previous_iteration_ids=[7]), '2024-01-01'),
+            # Finished after the iteration ended: carry-over, not completed
+            story_facts(story(4, completed_at='2024-01-05T00:00:00Z'), '2024-01-01')],
+        2: [story_facts(story(3), None)],
+    }
+    # Typed Iteration models carry datetimes rather than strings
+    assert facts[1][2] == story_facts(story(4, completed_at='2024-01-05T00:00:00Z'),
+                                      datetime(2024, 1, 1, tzinfo=timezone.utc))
+    for backend in (velocity.np, None):
+        monkeypatch.setattr(velocity, 'np', backend)
+        table = VelocityTable([sprint(1), sprint(2)], facts)
+        totals = table.per_iteration()
+        assert totals['committed'] == [7, 3]
+        assert totals['completed'] == [1, 3]
+        assert totals['carry_over'] == [6, 0]
+        assert totals['carried_in'] == [2, 0]
+        assert totals['stories_done'] == [1, 1]
+        assert table.throughput('type') == [('bug', 2, 4), ('feature', 0, 0)]
+        assert rolling_mean([1, 2, 3, 6], 2) == [None, 1.5, 2.5, 4.5]
+        assert percentile([1, 2, 3, 4], 50) == 2.5
+        assert percentile([10, 20], 90) == 19
+
+
+def test_finished_iterations_come_from_the_store(mocker, tmp_path):
+    """Done iterations are fetched once; the started one is fetched every run."""
+    store = LocalStore(tmp_path / 'store.sqlite3')
+    client = Mock()
+    client.list_iterations.return_value = [sprint(1), sprint(2), sprint(3, 'started'),
+                                           SimpleNamespace(id=4, status='unstarted', end_date=None)]
+    client._make_request.side_effect = lambda method, path: [story(1), story(2)]
+    client.list_groups.return_value = [SimpleNamespace(id='team-a', name='Alpha')]
+    mocker.patch('sc.commands.iteration.get_client', return_value=client)
+    mocker.patch('sc.commands.iteration.get_store', side_effect=lambda: LocalStore(store.path))
+
+    result = CliRunner().invoke(iteration, ['velocity', '--last', '3'])
+    assert result.exit_code == 0, result.output
+    assert "Alpha" in result.output
+    assert sorted(c.args[1] for c in client._make_request.call_args_list) == [
+        '/iterations/1/stories', '/iterations/2/stories', '/iterations/3/stories']
+
+    client._make_request.reset_mock()
+    result = CliRunner().invoke(iteration, ['velocity', '--last', '3', '--format', 'ndjson'])
+    assert result.exit_code == 0, result.output
+    assert [c.args[1] for c in client._make_request.call_args_list] == ['/iterations/3/stories']
+    rows = [json.loads(line) for line in result.output.splitlines()]
+    assert [r['completed'] for r in rows] == [3, 3, 3]
+    assert rows[-1]['rolling_mean'] == 3
@@ -0,0 +1,210 @@
+"""Tests for applying replayed Shortcut webhook events."""
+
+import json
+import threading
+import urllib.error
+import urllib.request
+from functools import partial
+import pytest
+from sc.api.cache import ReferenceCache
+from sc.api.store import LocalStore
+from sc.api.webhook import SIGNATURE_HEADER, WebhookReceiver, make_server, sign
+
+SECRET = 'webhook-secret'
+
+# Payloads as recorded from a Shortcut outgoing webhook
+STORY_UPDATE = {
+    "id": "5f1e7c2a-0000-4000-8000-000000000001",
+    "changed_at": "2024-05-02T10:00:00Z",
+    "version": "v1",
+    "primary_id": 1000,
+    "member_id": "mem-2",
+    "actions": [{
+        "id": 1000,
+        "entity_type": "story",
+        "action": "update",
+        "name": "Fix login redirect",
+        "story_type": "bug",
+        "app_url": "https://app.shortcut.com/acme/story/1000",
+        "changes": {
+            "workflow_state_id": {"new": 500000003, "old": 500000001},
+            "owner_ids": {"adds": ["mem-2"], "removes": ["mem-1"]},
+            "label_ids": {"adds": [7001]},
+            "estimate": {"new": 3, "old": 1},
+        },
+    }],
+    "references": [{"id": 7001, "entity_type": "label", "name": "urgent"}],
+}
+STORY_CREATE = {
+    "id": "5f1e7c2a-0000-4000-8000-000000000002",
+    "changed_at": "2024-05-02T11:00:00Z",
+    "version": "v1",
+    "primary_id": 1002,
+    "actions": [{
+        "id": 1002,
+        "entity_type": "story",
+        "action": "create",
+        "name": "Add audit log",
+        "story_type": "feature",
+        "workflow_state_id": 500000001,
+        "app_url": "https://app.shortcut.com/acme/story/1002",
+    }],
+}
+STORY_DELETE = {
+    "id": "5f1e7c2a-0000-4000-8000-000000000003",
+    "changed_at": "2024-05-02T12:00:00Z",
+    "version": "v1",
+    "actions": [{"id": 1001, "entity_type": "story", "action": "delete", "name": "Old spike"}],
+}
+EPIC_UPDATE = {
+    "id": "5f1e7c2a-0000-4000-8000-000000000004",
+    "changed_at": "2024-05-02T13:00:00Z",
+    "version": "v1",
+    "actions": [{"id": 10, "entity_type": "epic", "action": "update", "name": "Auth revamp",
+                 "changes": {"name": {"new": "Auth revamp", "old": "Authentication revamp"},
+                             "state": {"new": "in progress", "old": "to do"}}}],
+}
+ITERATION_CREATE = {
+    "id": "5f1e7c2a-0000-4000-8000-000000000005",
+    "changed_at": "2024-05-02T14:00:00Z",
+    "version": "v1",
+    "actions": [{"id": 30, "entity_type": "iteration", "action": "create", "name": "Sprint 30",
+                 "start_date": "2024-05-06", "end_date": "2024-05-17", "status": "unstarted"}],
+}
+LABEL_UPDATE = {
+    "id": "5f1e7c2a-0000-4000-8000-000000000006",
+    "changed_at": "2024-05-02T15:00:00Z",
+    "version": "v1",
+    "actions": [{"id": 7000, "entity_type": "label", "action": "update",
+                 "changes": {"color": {"new": "#ff0000", "old": "#00ff00"}}}],
+}
+
+
+def story(id, name, **fields):
+    return {'id': id, 'name': name, 'story_type': 'feature', 'workflow_state_id': 500000001,
+            'owner_ids': [], 'label_ids': [], 'labels': [], 'estimate': None,
+            'updated_at': '2024-05-01T00:00:00Z', **fields}
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    store = LocalStore(tmp_path / 'store.sqlite3')
+    store.upsert_stories([
+        story(1000, "Fix login redirect", story_type='bug', owner_ids=['mem-1'], estimate=1,
+              label_ids=[7000], labels=[{'id': 7000, 'name': 'auth'}]),
+        story(1001, "Old spike"),
+    ])
+    store.upsert_epics([{'id': 10, 'name': "Authentication revamp", 'state': 'to do',
+                         'updated_at': '2024-05-01T00:00:00Z'}])
+    store.close()
+    cache = ReferenceCache(tmp_path / 'cache')
+    cache.set('epics', [{'id': 10, 'name': "Authentication revamp", 'state': 'to do'},
+                        {'id': 11, 'name': "Billing", 'state': 'done'}], fetched_at=1.0e12)
+    cache.set('iterations', [{'id': 29, 'name': "Sprint 29"}])
+    cache.set('labels', [{'id': 7000, 'name': "auth", 'color': '#00ff00', 'stats': {'num_stories': 1}}])
+    return partial(LocalStore, tmp_path / 'store.sqlite3'), cache
+
+
+@pytest.fixture
+def receiver(mirror):
+    open_store, cache = mirror
+    receiver = WebhookReceiver(open_store, cache=cache, secret=SECRET)
+    server = make_server(receiver, port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    receiver.url = f"http://127.0.0.1:{server.server_port}/"
+    yield receiver
+    server.shutdown()
+    server.server_close()
+
+
+def replay(url, payload, secret=SECRET):
+    body = payload if isinstance(payload, bytes) else json.dumps(payload).encode('utf-8')
+    request = urllib.request.Request(url, data=body, method='POST',
+                                     headers={'Content-Type': 'application/json',
+                                              SIGNATURE_HEADER: sign(body, secret)})
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def read(receiver, method, id):
+    store = receiver.open_store()
+    try:
+        return getattr(store, method)(id)
+    finally:
+        store.close()
+
+
+def test_replayed_story_events_update_the_mirror(receiver):
+    status, reply = replay(receiver.url, STORY_UPDATE)
+    assert status == 200
+    assert reply['applied'] == [{'entity_type': 'story', 'action': 'update', 'id': 1000, 'outcome': 'applied'}]
+    updated = read(receiver, 'get_story', 1000)
+    assert updated['workflow_state_id'] == 500000003
+    assert updated['owner_ids'] == ['mem-2']
+    assert updated['estimate'] == 3
+    assert [label['name'] for label in updated['labels']] == ['auth', 'urgent']
+    assert updated['updated_at'] == STORY_UPDATE['changed_at']
+
+    assert replay(receiver.url, STORY_CREATE)[0] == 200
+    created = read(receiver, 'get_story', 1002)
+    assert created['name'] == "Add audit log"
+    assert created['owner_ids'] == [] and created['created_at'] == STORY_CREATE['changed_at']
+
+    assert replay(receiver.url, STORY_DELETE)[0] == 200
+    assert read(receiver, 'get_story', 1001) is None
+    assert receiver.received == 3
+
+
+def test_bad_signatures_and_bodies_are_rejected(receiver):
+    assert replay(receiver.url, STORY_DELETE, secret='wrong') == (401, {'error': 'bad signature'})
+    assert replay(receiver.url, b'{not json')[0] == 400
+    assert replay(receiver.url, {'actions': 'nope'})[0] == 400
+    for length in ('-1', 'ten', str(2 ** 21)):
+        request = urllib.request.Request(receiver.url, data=b'{}', method='POST',
+                                         headers={'Content-Length': length})
+        with pytest.raises(urllib.error.HTTPError) as excinfo:
+            urllib.request.urlopen(request, timeout=5)
+        assert excinfo.value.code == 400
+    assert read(receiver, 'get_story', 1001) is not None
+    assert receiver.received == 0
+
+
+def test_late_and_unknown_updates_are_skipped(receiver):
+    late = dict(STORY_UPDATE, changed_at='2024-04-01T00:00:00Z')
+    unknown = json.loads(json.dumps(STORY_UPDATE).replace('1000', '4242'))
+
+    assert replay(receiver.url, late)[1]['applied'][0]['outcome'] == 'stale'
+    assert replay(receiver.url, unknown)[1]['applied'][0]['outcome'] == 'skipped'
+    assert read(receiver, 'get_story', 1000)['estimate'] == 1
+    assert read(receiver, 'get_story', 4242) is None
+
+
+def test_epic_and_iteration_events_patch_the_cache(receiver):
+    cache = receiver.cache
+
+    assert replay(receiver.url, EPIC_UPDATE)[0] == 200
+    assert read(receiver, 'get_epic', 10)['name'] == "Auth revamp"
+    assert cache.get('epics')[0] == {'id': 10, 'name': "Auth revamp", 'state': 'in progress'}
+    assert cache._read('epics')['fetched_at'] == 1.0e12  # patched, expiry unchanged
+
+    # A new iteration lacks fields the list response has: refetch instead
+    assert replay(receiver.url, ITERATION_CREATE)[0] == 200
+    assert read(receiver, 'get_iteration', 30)['name'] == "Sprint 30"
+    assert cache.get('iterations') is None
+
+
+def test_partial_epic_and_other_entity_events_drop_the_cache(receiver):
+    cache = receiver.cache
+    partial_update = json.loads(json.dumps(EPIC_UPDATE))
+    partial_update['actions'][0]['changes'] = {'owner_ids': {'adds': ['mem-2']}}
+
+    # The cached epic has no owner_ids to patch: refetch rather than guess
+    assert replay(receiver.url, partial_update)[1]['applied'][0]['outcome'] == 'applied'
+    assert cache.get('epics') is None
+    # Label events carry only the changed fields: the cached list is dropped
+    assert replay(receiver.url, LABEL_UPDATE)[1]['applied'][0]['outcome'] == 'cached'
+    assert cache.get('labels') is None